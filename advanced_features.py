@@ -33,10 +33,27 @@ from sklearn.cluster import KMeans
 import warnings
 warnings.filterwarnings('ignore')
 
+from job_record import Job, JobBatch
+
 class AdvancedJobAnalyzer:
     def __init__(self):
-        self.jobs_data = []
+        self.jobs_data = JobBatch()
         self.insights = {}
+
+    def load(self, jobs):
+        """Labeled DataFrame for the analysis methods from Job records or a JobBatch"""
+        self.jobs_data = jobs if isinstance(jobs, JobBatch) else JobBatch(jobs)
+        return self.jobs_data.to_frame()
+
+    def load_archive(self, since=None, until=None, searches=None, root=None):
+        """Labeled DataFrame of archived runs, reading only the matching date/search partitions and
+        the columns the analysis methods use (see run_archive.read_archive)"""
+        from run_archive import ARCHIVE_DIR, read_archive
+
+        jobs_df = read_archive(root or ARCHIVE_DIR, ["job_id", "title", "company", "location", "post_date"],
+                               since, until, searches, labels=True)
+        self.jobs_data = JobBatch.from_frame(jobs_df)
+        return jobs_df
         
     def add_salary_estimation(self, jobs_df):
         """Estimate salaries based on job titles and companies"""
@@ -131,9 +148,10 @@ class AdvancedJobAnalyzer:
         
         # 5. Time Series Analysis (if date available)
         plt.subplot(3, 3, 5)
-        if 'Date Posted' in jobs_df.columns:
-            jobs_df['Date Posted'] = pd.to_datetime(jobs_df['Date Posted'])
-            daily_jobs = jobs_df.groupby(jobs_df['Date Posted'].dt.date).size()
+        date_column = 'Post Date' if 'Post Date' in jobs_df.columns else 'Date Posted'
+        if date_column in jobs_df.columns:
+            jobs_df[date_column] = pd.to_datetime(jobs_df[date_column], errors='coerce')
+            daily_jobs = jobs_df.groupby(jobs_df[date_column].dt.date).size()
             daily_jobs.plot(kind='line', marker='o')
             plt.title('Jobs Posted Over Time')
             plt.xticks(rotation=45)
@@ -268,21 +286,21 @@ def main():
     
     # Create sample data
     sample_jobs = [
-        {'Job Title': 'Senior Software Engineer', 'Company': 'Google', 'Location': 'San Francisco, CA', 'Date Posted': '2024-01-15'},
-        {'Job Title': 'Full Stack Developer', 'Company': 'Meta', 'Location': 'San Francisco, CA', 'Date Posted': '2024-01-14'},
-        {'Job Title': 'Data Scientist', 'Company': 'Apple', 'Location': 'Cupertino, CA', 'Date Posted': '2024-01-13'},
-        {'Job Title': 'Product Manager', 'Company': 'Netflix', 'Location': 'Los Gatos, CA', 'Date Posted': '2024-01-12'},
-        {'Job Title': 'Machine Learning Engineer', 'Company': 'Tesla', 'Location': 'Palo Alto, CA', 'Date Posted': '2024-01-11'},
-        {'Job Title': 'DevOps Engineer', 'Company': 'Uber', 'Location': 'San Francisco, CA', 'Date Posted': '2024-01-10'},
-        {'Job Title': 'Backend Engineer', 'Company': 'Airbnb', 'Location': 'San Francisco, CA', 'Date Posted': '2024-01-09'},
-        {'Job Title': 'Frontend Developer', 'Company': 'Twitter', 'Location': 'San Francisco, CA', 'Date Posted': '2024-01-08'},
-        {'Job Title': 'Software Engineer', 'Company': 'LinkedIn', 'Location': 'Sunnyvale, CA', 'Date Posted': '2024-01-07'},
-        {'Job Title': 'Senior Data Analyst', 'Company': 'Salesforce', 'Location': 'San Francisco, CA', 'Date Posted': '2024-01-06'},
+        Job(None, 'Senior Software Engineer', 'Google', 'San Francisco, CA', '2024-01-15'),
+        Job(None, 'Full Stack Developer', 'Meta', 'San Francisco, CA', '2024-01-14'),
+        Job(None, 'Data Scientist', 'Apple', 'Cupertino, CA', '2024-01-13'),
+        Job(None, 'Product Manager', 'Netflix', 'Los Gatos, CA', '2024-01-12'),
+        Job(None, 'Machine Learning Engineer', 'Tesla', 'Palo Alto, CA', '2024-01-11'),
+        Job(None, 'DevOps Engineer', 'Uber', 'San Francisco, CA', '2024-01-10'),
+        Job(None, 'Backend Engineer', 'Airbnb', 'San Francisco, CA', '2024-01-09'),
+        Job(None, 'Frontend Developer', 'Twitter', 'San Francisco, CA', '2024-01-08'),
+        Job(None, 'Software Engineer', 'LinkedIn', 'Sunnyvale, CA', '2024-01-07'),
+        Job(None, 'Senior Data Analyst', 'Salesforce', 'San Francisco, CA', '2024-01-06'),
     ]
     
     # Initialize analyzer
     analyzer = AdvancedJobAnalyzer()
-    jobs_df = pd.DataFrame(sample_jobs)
+    jobs_df = analyzer.load(sample_jobs)
     
     # Add advanced features
     jobs_df = analyzer.add_salary_estimation(jobs_df)
@@ -0,0 +1,87 @@
+"""
+Benchmark: in-page JS card extraction vs page_source + BeautifulSoup
+
+Loads the saved fixture pages into a headless Chrome and times both paths:
+- js:   one execute_script call returning a JSON array of cards
+- soup: driver.page_source over the wire, then BeautifulSoup(html.parser)
+"""
+
+import argparse
+import glob
+import os
+import time
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+
+from job_card_extractor import extract_cards_js, extract_cards_from_html
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def create_headless_driver():
+    """Headless Chrome for repeatable timings"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    service = Service(ChromeDriverManager().install())
+    return webdriver.Chrome(service=service, options=chrome_options)
+
+
+def time_path(func, iterations):
+    """Run func repeatedly and return (best_ms, mean_ms, last_result)"""
+    timings = []
+    result = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings), sum(timings) / len(timings), result
+
+
+def benchmark_page(driver, path, iterations):
+    driver.get(Path(path).resolve().as_uri())
+
+    js_best, js_mean, js_cards = time_path(lambda: extract_cards_js(driver), iterations)
+    soup_best, soup_mean, soup_cards = time_path(
+        lambda: extract_cards_from_html(driver.page_source), iterations
+    )
+    page_bytes = len(driver.page_source.encode("utf-8"))
+
+    print(f"\n📄 {os.path.basename(path)} ({page_bytes / 1024:.1f} KB page_source)")
+    print(f"   js   : {len(js_cards):4d} cards | best {js_best:8.2f} ms | mean {js_mean:8.2f} ms")
+    print(f"   soup : {len(soup_cards):4d} cards | best {soup_best:8.2f} ms | mean {soup_mean:8.2f} ms")
+    if soup_mean > 0 and js_mean > 0:
+        print(f"   speedup: {soup_mean / js_mean:.1f}x")
+    if js_cards != soup_cards:
+        print("   ⚠️ JS and BeautifulSoup paths returned different records")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare JS and BeautifulSoup card extraction")
+    parser.add_argument("pages", nargs="*", help="HTML pages to load (default: fixtures/*.html)")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    pages = args.pages or sorted(glob.glob(str(FIXTURES_DIR / "*.html")))
+    if not pages:
+        print("❌ No fixture pages found")
+        return
+
+    print("🚀 Card extraction benchmark")
+    print("=" * 50)
+    driver = create_headless_driver()
+    try:
+        for page in pages:
+            benchmark_page(driver, page, args.iterations)
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
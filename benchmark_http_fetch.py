@@ -0,0 +1,72 @@
+"""
+Benchmark: driverless HTTP engine vs headless Chrome on the guest results page
+
+Serves the guest fixture page from a local HTTP server and measures pages/sec
+and CPU seconds per page for:
+- http:   GuestJobFetcher (pooled requests.Session, bounded concurrency)
+- chrome: one headless Chrome loading the same URLs (optional, --chrome)
+"""
+
+import argparse
+import os
+import resource
+import time
+
+from http_fetcher import GuestJobFetcher
+from job_card_extractor import extract_cards_js
+from test_http_fetcher import GuestHandler, serve
+
+
+def children_cpu_sec():
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def bench_http(base_url, pages, concurrency):
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    with GuestJobFetcher(concurrency=concurrency, base_url=base_url) as fetcher:
+        cards = sum(1 for _ in fetcher.iter_jobs("Software Engineer", "San Francisco", max_pages=pages))
+    return pages, cards, time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+
+def bench_chrome(base_url, pages):
+    from driver_setup import create_driver
+
+    driver = create_driver(headless=True)
+    try:
+        cpu_start, wall_start = children_cpu_sec() + time.process_time(), time.perf_counter()
+        cards = 0
+        for _ in range(pages):
+            driver.get(f"{base_url}?keywords=Software%20Engineer&location=San%20Francisco&start=0")
+            cards += len(extract_cards_js(driver))
+        wall = time.perf_counter() - wall_start
+    finally:
+        driver.quit()
+    # Chrome's renderer CPU is only accounted once its processes exit
+    return pages, cards, wall, children_cpu_sec() + time.process_time() - cpu_start
+
+
+def report(name, pages, cards, wall, cpu):
+    print(f"{name:>6}: {pages / wall:8.1f} pages/sec  {cpu / pages * 1000:7.2f} ms CPU/page  ({cards} cards)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--chrome", action="store_true", help="also benchmark headless Chrome")
+    args = parser.parse_args()
+
+    GuestHandler.pages = args.pages
+    server, base_url = serve()
+    try:
+        print(f"🏁 {args.pages} guest pages from a local server (pid {os.getpid()})")
+        report("http", *bench_http(base_url, args.pages, args.concurrency))
+        if args.chrome:
+            report("chrome", *bench_chrome(base_url, max(1, args.pages // 10)))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
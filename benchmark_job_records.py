@@ -0,0 +1,105 @@
+"""
+Benchmark: labeled dict lists vs slotted Job records vs columnar JobBatch
+
+Builds N synthetic job records each way and reports:
+- memory per record (tracemalloc, records plus their containers; the strings are shared)
+- time to convert to a pandas DataFrame
+- time to convert to a pyarrow Table (if pyarrow is installed)
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import pandas as pd
+
+from job_record import LABELS, Job, JobBatch
+
+
+def make_cards(n):
+    titles = ["Data Analyst", "Senior Software Engineer", "Product Manager", "Data Engineer"]
+    companies = ["Acme Corp", "Globex", "Initech", "Umbrella"]
+    return [{
+        "job_id": 3700000000 + i,
+        "title": titles[i % 4],
+        "company": companies[i % 4],
+        "location": "San Francisco, CA",
+        "post_date": "2026-10-01",
+        "link": f"https://www.linkedin.com/jobs/view/{3700000000 + i}",
+    } for i in range(n)]
+
+
+def as_dicts(cards):
+    return [{
+        "Job ID": card["job_id"], "Job Title": card["title"], "Company": card["company"],
+        "Location": card["location"], "Post Date": card["post_date"], "Link": card["link"],
+        "Search Keywords": "Data Analyst", "Search Location": "San Francisco",
+    } for card in cards]
+
+
+def as_jobs(cards):
+    return [Job.from_card(card, "Data Analyst", "San Francisco") for card in cards]
+
+
+def as_batch(cards):
+    return JobBatch(as_jobs(cards))
+
+
+def measure_memory(build, cards):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    records = build(cards)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return records, allocated / len(cards)
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        pa = None
+
+    cards = make_cards(args.records)
+    print(f"🏁 {args.records} records")
+
+    dicts, dict_bytes = measure_memory(as_dicts, cards)
+    to_frame_ms = best_of(lambda: pd.DataFrame(dicts), args.repeat)
+    to_arrow_ms = best_of(lambda: pa.Table.from_pylist(dicts), args.repeat) if pa else None
+    report("dicts", dict_bytes, to_frame_ms, to_arrow_ms)
+
+    jobs, job_bytes = measure_memory(as_jobs, cards)
+    to_frame_ms = best_of(lambda: JobBatch(jobs).to_frame(), args.repeat)
+    report("Job", job_bytes, to_frame_ms, None)
+
+    batch, batch_bytes = measure_memory(as_batch, cards)
+    del jobs
+    to_frame_ms = best_of(batch.to_frame, args.repeat)
+    to_arrow_ms = best_of(batch.to_arrow, args.repeat) if pa else None
+    report("JobBatch", batch_bytes, to_frame_ms, to_arrow_ms)
+
+    assert list(batch.to_frame().columns) == list(LABELS.values())
+
+
+def report(name, bytes_per_record, to_frame_ms, to_arrow_ms):
+    arrow = f"{to_arrow_ms:8.1f} ms -> Arrow" if to_arrow_ms is not None else "   (no pyarrow)"
+    print(f"{name:>9}: {bytes_per_record:7.1f} B/record  {to_frame_ms:8.1f} ms -> DataFrame  {arrow}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: FTS5 search_jobs vs pandas str.contains over every row
+
+Loads N synthetic jobs into a fresh database through JobStore (the FTS triggers
+index them as they are written), times a full index rebuild, then the latency
+of ranked word, prefix, phrase and filtered queries against the same search
+done with str.contains over a DataFrame of all jobs.
+
+    python benchmark_job_search.py --jobs 1000000
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmark_job_store import make_jobs
+from database_storage import JobStore, search_jobs
+
+# The synthetic titles are few, so the word/prefix/phrase queries each match 1/8 to 1/6
+# of all rows and have to rank all of those; "selective" is closer to a real search
+QUERIES = [
+    ("selective", '"company 4242"', {}, lambda df: df["company"].str.contains("company 4242", case=False)),
+    ("word", "security", {}, lambda df: df["job_title"].str.contains("security", case=False)),
+    ("prefix", "infra*", {}, lambda df: df["job_title"].str.contains(r"\binfra", case=False)),
+    ("phrase", '"data engineer"', {}, lambda df: df["job_title"].str.contains("data engineer", case=False)),
+    ("filtered", "payments", {"company": "Company 42"},
+     lambda df: df["job_title"].str.contains("payments", case=False) & (df["company"] == "Company 42")),
+]
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_name = os.path.join(tmp, "bench.db")
+        jobs = make_jobs(args.jobs)
+        started = time.perf_counter()
+        with JobStore(db_name, cluster_reposts=False) as store:
+            for i in range(0, len(jobs), 10_000):
+                store.insert(jobs[i:i + 10_000])
+        print(f"🏁 {args.jobs} jobs written with the FTS triggers in {time.perf_counter() - started:.1f}s")
+
+        conn = sqlite3.connect(db_name)
+        started = time.perf_counter()
+        with conn:
+            conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+        print(f"🔨 Index rebuild: {time.perf_counter() - started:.1f}s")
+        df = pd.read_sql_query("SELECT * FROM jobs", conn)
+        conn.close()
+
+        for name, query, filters, contains in QUERIES:
+            fts_ms = best_of(lambda: search_jobs(query, filters, args.limit, db_name=db_name), args.repeat)
+            pandas_ms = best_of(lambda: df[contains(df)].head(args.limit), args.repeat)
+            print(f"{name:>9} {query!r:>18}: FTS5 {fts_ms:8.1f} ms   str.contains {pandas_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
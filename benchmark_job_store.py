@@ -0,0 +1,105 @@
+"""
+Benchmark: per-row save_to_database loop vs JobStore bulk inserts
+
+The legacy writer below is save_to_database as it was before JobStore: a new
+connection per call, the default rollback journal, one INSERT per job with a
+rowcount check. Both writers assign repost clusters (MinHash + LSH), which
+dominates the cost of a new row; --no-clusters times the SQLite write path alone.
+Each size is written in batches of --batch-size (the scrapers save per batch)
+into a fresh database, then written again to time the re-seen case: ignored by
+the legacy writer, an upsert plus an observation row for JobStore.
+
+    python benchmark_job_store.py --sizes 1000 100000 1000000
+    python benchmark_job_store.py --no-clusters
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from database_storage import JobStore, connect
+from job_record import Job, to_job
+from near_duplicates import NearDuplicateIndex
+
+
+def make_jobs(n):
+    # Spread over many companies and titles, like real results; n copies of one posting
+    # would all land in the same LSH buckets
+    roles = ["Data Analyst", "Software Engineer", "Product Manager", "Data Engineer", "Designer", "Recruiter"]
+    areas = ["Payments", "Search", "Platform", "Growth", "Security", "Mobile", "Ads", "Infrastructure"]
+    return [Job(3700000000 + i, f"{roles[i % 6]}, {areas[i // 6 % 8]}", f"Company {i // 48 % 20000}",
+                "San Francisco, CA", "2026-10-01", f"https://www.linkedin.com/jobs/view/{3700000000 + i}",
+                "Data Analyst", "San Francisco") for i in range(n)]
+
+
+def legacy_save(data, db_name, cluster=True):
+    conn = connect(db_name)
+    cursor = conn.cursor()
+    reposts = NearDuplicateIndex(conn)
+    inserted_count = 0
+    for job in map(to_job, data):
+        if job.job_id is None:
+            continue
+        # Since the star schema (v6) jobs is a view: the insert goes through its INSTEAD OF
+        # trigger, which sqlite3_changes() does not count, so compare total_changes
+        before = conn.total_changes
+        cursor.execute('''
+            INSERT OR IGNORE INTO jobs
+            (job_id, job_title, company, location, post_date, link, search_keywords, search_location)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (job.job_id, job.title, job.company, job.location, job.post_date, job.link,
+              job.search_keywords or '', job.search_location or ''))
+        if conn.total_changes > before:
+            inserted_count += 1
+            if not cluster:
+                continue
+            cluster_id = reposts.add(job.job_id, job.title, job.company, job.location)
+            cursor.execute("UPDATE postings SET cluster_id = ? WHERE job_id = ?", (cluster_id, job.job_id))
+    conn.commit()
+    conn.close()
+    return inserted_count
+
+
+def run_legacy(batches, db_name, cluster):
+    return sum(legacy_save(batch, db_name, cluster) for batch in batches)
+
+
+def run_store(batches, db_name, cluster):
+    with JobStore(db_name, cluster_reposts=cluster) as store:
+        return sum(store.insert(batch) for batch in batches)
+
+
+def timed(writer, batches, db_name, cluster):
+    started = time.perf_counter()
+    inserted = writer(batches, db_name, cluster)
+    return inserted, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    parser.add_argument("--skip-legacy-above", type=int, default=None,
+                        help="only time JobStore for sizes above this (the legacy loop is slow)")
+    parser.add_argument("--no-clusters", action="store_true", help="skip repost clustering in both writers")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        jobs = make_jobs(size)
+        batches = [jobs[i:i + args.batch_size] for i in range(0, size, args.batch_size)]
+        print(f"🏁 {size} jobs in batches of {args.batch_size}")
+        writers = [("JobStore", run_store)]
+        if args.skip_legacy_above is None or size <= args.skip_legacy_above:
+            writers.insert(0, ("legacy", run_legacy))
+        for name, writer in writers:
+            with tempfile.TemporaryDirectory() as tmp:
+                db_name = os.path.join(tmp, "bench.db")
+                inserted, elapsed = timed(writer, batches, db_name, not args.no_clusters)
+                assert inserted == size, (name, inserted)
+                _, again = timed(writer, batches, db_name, not args.no_clusters)
+            print(f"{name:>9}: {size / elapsed:10,.0f} rows/sec new   {size / again:10,.0f} rows/sec re-seen")
+
+
+if __name__ == "__main__":
+    main()
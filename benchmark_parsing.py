@@ -0,0 +1,47 @@
+"""
+Benchmark: full html.parser tree vs lxml restricted to the job-card subtrees
+
+Parses each saved results page (the fixtures by default, or any page_source dumps
+passed on the command line) with:
+- html.parser, full tree (the original extractors)
+- lxml, full tree
+- lxml, parse-only job-card subtrees (what extract_cards_from_html uses now)
+and reports parse time and tree size per page.
+"""
+
+import argparse
+import glob
+import os
+
+from job_card_extractor import CARD_STRAINER
+from page_parser import ParseStats, parse_results_html
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+CONFIGS = [
+    ("html.parser full", "html.parser", None),
+    ("lxml full", "lxml", None),
+    ("lxml cards only", "lxml", CARD_STRAINER),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", help="saved HTML pages (default: fixtures/*.html)")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    for path in args.pages or sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.html"))):
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        print(f"\n📄 {os.path.basename(path)} ({len(html) / 1024:.1f} KB)")
+        for name, backend, strainer in CONFIGS:
+            stats = ParseStats()
+            for _ in range(args.repeat):
+                parse_results_html(html, strainer, backend, stats=stats)
+            summary = stats.summary()
+            print(f"   {name:<18} {summary['parse_ms_mean']:8.2f} ms/page  {summary['nodes_mean']:6d} nodes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: flat jobs table (schema v5) vs company/location/search dimension tables (v6)
+
+Builds a v5 database with N synthetic jobs, copies it and migrates the copy to
+the star schema, then reports the file size of both (after VACUUM), the
+migration time, and the best-of-N time of the company and location stats
+queries on each layout.
+
+    python benchmark_star_schema.py --jobs 1000000
+"""
+
+import argparse
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+
+import database_storage
+from benchmark_job_store import make_jobs
+
+# get_company_stats / get_location_stats as they were on the flat table
+FLAT_STATS_SQL = '''
+    SELECT {column}, COUNT(*) as job_count
+    FROM jobs
+    GROUP BY {column}
+    ORDER BY job_count DESC
+    LIMIT 10
+'''
+
+
+def build_flat(db_name, jobs):
+    conn = sqlite3.connect(db_name)
+    with conn:
+        for migration in database_storage.MIGRATIONS[:4]:
+            migration(conn)
+        conn.executemany('''
+            INSERT INTO jobs (job_id, job_title, company, location, post_date, link, search_keywords,
+                              search_location, cluster_id, first_seen, last_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+        ''', [(*job.as_row(), job.job_id) for job in jobs])
+        database_storage.MIGRATIONS[4](conn)  # FTS index, built once over all rows
+        conn.execute("PRAGMA user_version = 5")
+    conn.execute("VACUUM")
+    conn.close()
+
+
+def best_of(conn, sql, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        conn.execute(sql, () if "?" not in sql else (10,)).fetchall()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        flat_db = os.path.join(tmp, "flat.db")
+        star_db = os.path.join(tmp, "star.db")
+        build_flat(flat_db, make_jobs(args.jobs))
+        shutil.copy(flat_db, star_db)
+
+        started = time.perf_counter()
+        conn = database_storage.connect(star_db)
+        migrated = time.perf_counter() - started
+        conn.execute("VACUUM")
+        conn.close()
+        print(f"🏁 {args.jobs} jobs, migrated to the star schema in {migrated:.1f}s")
+
+        flat = sqlite3.connect(flat_db)
+        star = sqlite3.connect(star_db)
+        for name, conn, db_name in (("flat", flat, flat_db), ("star", star, star_db)):
+            print(f"{name:>5}: {os.path.getsize(db_name) / 1e6:8.1f} MB")
+        for column, star_sql in (("company", database_storage.COMPANY_STATS_SQL),
+                                 ("location", database_storage.LOCATION_STATS_SQL)):
+            flat_ms = best_of(flat, FLAT_STATS_SQL.format(column=column), args.repeat)
+            star_ms = best_of(star, star_sql, args.repeat)
+            print(f"{column + ' stats':>15}: flat {flat_ms:8.1f} ms   star {star_ms:8.1f} ms")
+        flat.close()
+        star.close()
+
+
+if __name__ == "__main__":
+    main()
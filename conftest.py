@@ -0,0 +1,16 @@
+"""
+Shared pytest setup
+"""
+
+import pytest
+
+from selector_stats import selector_stats
+
+
+@pytest.fixture(autouse=True)
+def selector_stats_file(tmp_path, monkeypatch):
+    """Keep the selector stats recorded by extraction out of the repo's selector_stats.json"""
+    monkeypatch.setattr(selector_stats, "path", tmp_path / "selector_stats.json")
+    yield
+    # Flush while the temp path is still set, so the exit-time save has nothing left to write
+    selector_stats.save()
@@ -2,102 +2,651 @@
 Database storage version of the LinkedIn job scraper data processing
 """
 
+import json
+import re
 import sqlite3
 import pandas as pd
 from datetime import datetime
 import os
 
-def create_database(db_name="linkedin_jobs.db"):
-    """Create SQLite database and jobs table"""
-    conn = sqlite3.connect(db_name)
-    cursor = conn.cursor()
-    
-    # Create jobs table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS jobs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+from job_ids import parse_job_id
+from job_record import to_job
+from near_duplicates import NearDuplicateIndex
+
+JOBS_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS jobs (
+        job_id INTEGER PRIMARY KEY,  -- LinkedIn job ID; also the rowid, so no separate key index
+        job_title TEXT,
+        company TEXT,
+        location TEXT,
+        post_date TEXT,
+        link TEXT,
+        search_keywords TEXT,
+        search_location TEXT,
+        scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+def _key_jobs_by_job_id(conn):
+    """v1: replace the UNIQUE(job_title, company, link) text key with the integer job ID"""
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(jobs)")]
+    if not columns:
+        conn.execute(JOBS_TABLE_SQL)
+        return
+    if "job_id" in columns:
+        return
+    conn.create_function("parse_job_id", 1, parse_job_id, deterministic=True)
+    conn.execute(JOBS_TABLE_SQL.replace("IF NOT EXISTS jobs", "jobs_v1"))
+    # Oldest row wins for each job ID
+    conn.execute('''
+        INSERT OR IGNORE INTO jobs_v1
+        SELECT parse_job_id(link), job_title, company, location, post_date, link,
+               search_keywords, search_location, scraped_at
+        FROM jobs WHERE parse_job_id(link) IS NOT NULL ORDER BY id
+    ''')
+    # Rows whose link has no job ID cannot be keyed; they are set aside as they were, not dropped
+    unkeyed = conn.execute("SELECT COUNT(*) FROM jobs WHERE parse_job_id(link) IS NULL").fetchone()[0]
+    if unkeyed:
+        conn.execute("CREATE TABLE jobs_without_id AS SELECT * FROM jobs WHERE parse_job_id(link) IS NULL")
+    kept = conn.execute("SELECT COUNT(*) FROM jobs_v1").fetchone()[0]
+    total = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+    conn.execute("DROP TABLE jobs")
+    conn.execute("ALTER TABLE jobs_v1 RENAME TO jobs")
+    print(f"🔧 Migrated jobs table to integer job IDs ({kept} kept, {total - kept - unkeyed} duplicates merged, "
+          f"{unkeyed} without a job ID moved to jobs_without_id)")
+
+def _add_repost_clusters(conn):
+    """v2: cluster_id column plus the MinHash-LSH index; existing jobs are clustered in ID order"""
+    conn.execute("ALTER TABLE jobs ADD COLUMN cluster_id INTEGER")
+    index = NearDuplicateIndex(conn)
+    index.create_tables()
+    rows = conn.execute("SELECT job_id, job_title, company, location FROM jobs ORDER BY job_id").fetchall()
+    for job_id, title, company, location in rows:
+        conn.execute("UPDATE jobs SET cluster_id = ? WHERE job_id = ?", (index.add(job_id, title, company, location), job_id))
+
+def _add_query_indexes(conn):
+    """v3: indexes for the latest-jobs, per-search and company/location stats queries"""
+    # job_id is the rowid, so every index also carries it: per-search ID lookups never touch the table
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at ON jobs (scraped_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_search ON jobs (search_keywords, search_location, scraped_at)")
+
+def _track_observations(conn):
+    """v4: first_seen/last_seen/seen_count per job, plus the runs and observations tables"""
+    conn.execute("ALTER TABLE jobs ADD COLUMN first_seen TIMESTAMP")
+    conn.execute("ALTER TABLE jobs ADD COLUMN last_seen TIMESTAMP")
+    conn.execute("ALTER TABLE jobs ADD COLUMN seen_count INTEGER NOT NULL DEFAULT 1")
+    conn.execute("UPDATE jobs SET first_seen = scraped_at, last_seen = scraped_at")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs (last_seen)")
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id INTEGER PRIMARY KEY,
+            search_keywords TEXT,
+            search_location TEXT,
+            started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            finished_at TIMESTAMP,
+            jobs_seen INTEGER
+        )
+    ''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_search ON runs (search_keywords, search_location, run_id)")
+    # Two integers per sighting; the primary key makes "jobs seen in run N" a range scan
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS observations (
+            run_id INTEGER,
+            job_id INTEGER,
+            PRIMARY KEY (run_id, job_id)
+        ) WITHOUT ROWID
+    ''')
+
+def _add_full_text_search(conn):
+    """v5: FTS5 index over job title, company and location, kept in sync with jobs by triggers"""
+    # External-content table: the text lives only in jobs, jobs_fts holds just the inverted index
+    conn.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+            job_title, company, location,
+            content='jobs', content_rowid='job_id',
+            tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+        )
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+            INSERT INTO jobs_fts (rowid, job_title, company, location)
+            VALUES (new.job_id, new.job_title, new.company, new.location);
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, job_title, company, location)
+            VALUES ('delete', old.job_id, old.job_title, old.company, old.location);
+        END
+    ''')
+    # Only text edits touch the index; last_seen/seen_count upserts do not fire this
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF job_title, company, location ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, job_title, company, location)
+            VALUES ('delete', old.job_id, old.job_title, old.company, old.location);
+            INSERT INTO jobs_fts (rowid, job_title, company, location)
+            VALUES (new.job_id, new.job_title, new.company, new.location);
+        END
+    ''')
+    conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')")
+
+# Same columns, in the same order, as the jobs table of v1-v5
+JOBS_VIEW_SQL = '''
+    CREATE VIEW jobs AS
+    SELECT postings.job_id, postings.job_title, companies.name AS company, locations.name AS location,
+           postings.post_date, postings.link, searches.keywords AS search_keywords,
+           searches.location AS search_location, postings.scraped_at, postings.cluster_id,
+           postings.first_seen, postings.last_seen, postings.seen_count
+    FROM postings
+    LEFT JOIN companies ON companies.company_id = postings.company_id
+    LEFT JOIN locations ON locations.location_id = postings.location_id
+    LEFT JOIN searches ON searches.search_id = postings.search_id
+'''
+
+def _normalize_dimensions(conn):
+    """v6: star schema; company, location and search strings move to dimension tables.
+
+    postings holds integer company_id/location_id/search_id keys, and jobs
+    becomes a view with the old columns, so readers are unchanged. Inserting
+    into the view (INSTEAD OF trigger) interns the strings, for old writers.
+    """
+    conn.execute("CREATE TABLE companies (company_id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)")
+    conn.execute("CREATE TABLE locations (location_id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)")
+    conn.execute('''
+        CREATE TABLE searches (
+            search_id INTEGER PRIMARY KEY,
+            keywords TEXT NOT NULL,
+            location TEXT NOT NULL,
+            UNIQUE (keywords, location)
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE postings (
+            job_id INTEGER PRIMARY KEY,
             job_title TEXT,
-            company TEXT,
-            location TEXT,
+            company_id INTEGER REFERENCES companies,
+            location_id INTEGER REFERENCES locations,
             post_date TEXT,
             link TEXT,
-            search_keywords TEXT,
-            search_location TEXT,
+            search_id INTEGER REFERENCES searches,
             scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(job_title, company, link)
+            cluster_id INTEGER,
+            first_seen TIMESTAMP,
+            last_seen TIMESTAMP,
+            seen_count INTEGER NOT NULL DEFAULT 1
         )
     ''')
-    
-    conn.commit()
+
+    conn.execute("INSERT INTO companies (name) SELECT DISTINCT company FROM jobs WHERE company IS NOT NULL")
+    conn.execute("INSERT INTO locations (name) SELECT DISTINCT location FROM jobs WHERE location IS NOT NULL")
+    conn.execute('''
+        INSERT INTO searches (keywords, location)
+        SELECT DISTINCT IFNULL(search_keywords, ''), IFNULL(search_location, '') FROM jobs
+    ''')
+    conn.execute('''
+        INSERT INTO postings
+        SELECT jobs.job_id, jobs.job_title, companies.company_id, locations.location_id, jobs.post_date, jobs.link,
+               searches.search_id, jobs.scraped_at, jobs.cluster_id, jobs.first_seen, jobs.last_seen, jobs.seen_count
+        FROM jobs
+        LEFT JOIN companies ON companies.name = jobs.company
+        LEFT JOIN locations ON locations.name = jobs.location
+        JOIN searches ON searches.keywords = IFNULL(jobs.search_keywords, '')
+                     AND searches.location = IFNULL(jobs.search_location, '')
+    ''')
+    # Dropping the table also drops its indexes and FTS triggers; jobs_fts keeps its
+    # index (same rowids and text) and reads its content through the view from now on
+    conn.execute("DROP TABLE jobs")
+    conn.execute(JOBS_VIEW_SQL)
+
+    conn.execute("CREATE INDEX idx_postings_scraped_at ON postings (scraped_at)")
+    conn.execute("CREATE INDEX idx_postings_company ON postings (company_id)")
+    conn.execute("CREATE INDEX idx_postings_location ON postings (location_id)")
+    conn.execute("CREATE INDEX idx_postings_search ON postings (search_id, scraped_at)")
+    conn.execute("CREATE INDEX idx_postings_last_seen ON postings (last_seen)")
+
+    conn.execute('''
+        CREATE TRIGGER jobs_fts_insert AFTER INSERT ON postings BEGIN
+            INSERT INTO jobs_fts (rowid, job_title, company, location)
+            VALUES (new.job_id, new.job_title,
+                    (SELECT name FROM companies WHERE company_id = new.company_id),
+                    (SELECT name FROM locations WHERE location_id = new.location_id));
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER jobs_fts_delete AFTER DELETE ON postings BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, job_title, company, location)
+            VALUES ('delete', old.job_id, old.job_title,
+                    (SELECT name FROM companies WHERE company_id = old.company_id),
+                    (SELECT name FROM locations WHERE location_id = old.location_id));
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER jobs_fts_update AFTER UPDATE OF job_title, company_id, location_id ON postings BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, job_title, company, location)
+            VALUES ('delete', old.job_id, old.job_title,
+                    (SELECT name FROM companies WHERE company_id = old.company_id),
+                    (SELECT name FROM locations WHERE location_id = old.location_id));
+            INSERT INTO jobs_fts (rowid, job_title, company, location)
+            VALUES (new.job_id, new.job_title,
+                    (SELECT name FROM companies WHERE company_id = new.company_id),
+                    (SELECT name FROM locations WHERE location_id = new.location_id));
+        END
+    ''')
+
+    # Writes through the view, for code that still inserts into or deletes from jobs
+    conn.execute('''
+        CREATE TRIGGER jobs_view_insert INSTEAD OF INSERT ON jobs BEGIN
+            INSERT OR IGNORE INTO companies (name) SELECT new.company WHERE new.company IS NOT NULL;
+            INSERT OR IGNORE INTO locations (name) SELECT new.location WHERE new.location IS NOT NULL;
+            INSERT OR IGNORE INTO searches (keywords, location)
+            VALUES (IFNULL(new.search_keywords, ''), IFNULL(new.search_location, ''));
+            INSERT INTO postings (job_id, job_title, company_id, location_id, post_date, link, search_id,
+                                  scraped_at, cluster_id, first_seen, last_seen, seen_count)
+            VALUES (new.job_id, new.job_title,
+                    (SELECT company_id FROM companies WHERE name = new.company),
+                    (SELECT location_id FROM locations WHERE name = new.location),
+                    new.post_date, new.link,
+                    (SELECT search_id FROM searches WHERE keywords = IFNULL(new.search_keywords, '')
+                                                     AND location = IFNULL(new.search_location, '')),
+                    IFNULL(new.scraped_at, CURRENT_TIMESTAMP), new.cluster_id,
+                    IFNULL(new.first_seen, CURRENT_TIMESTAMP), IFNULL(new.last_seen, CURRENT_TIMESTAMP),
+                    IFNULL(new.seen_count, 1));
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER jobs_view_delete INSTEAD OF DELETE ON jobs BEGIN
+            DELETE FROM postings WHERE job_id = old.job_id;
+        END
+    ''')
+
+def _mark_incremental_runs(conn):
+    """v7: flag runs that stopped at already-stored jobs; they cannot tell which jobs closed"""
+    conn.execute("ALTER TABLE runs ADD COLUMN incremental INTEGER NOT NULL DEFAULT 0")
+
+# Schema migrations, applied in order; PRAGMA user_version = number applied
+MIGRATIONS = [
+    _key_jobs_by_job_id,
+    _add_repost_clusters,
+    _add_query_indexes,
+    _track_observations,
+    _add_full_text_search,
+    _normalize_dimensions,
+    _mark_incremental_runs,
+]
+
+def connect(db_name="linkedin_jobs.db"):
+    """Open the jobs database, applying any pending schema migrations"""
+    conn = sqlite3.connect(db_name)
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version < len(MIGRATIONS):
+        with conn:
+            for migration in MIGRATIONS[version:]:
+                migration(conn)
+            conn.execute(f"PRAGMA user_version = {len(MIGRATIONS)}")
+    return conn
+
+def create_database(db_name="linkedin_jobs.db"):
+    """Create SQLite database and jobs table"""
+    conn = connect(db_name)
     conn.close()
     print(f"✅ Database {db_name} created/initialized")
 
-def save_to_database(data: list[dict], db_name="linkedin_jobs.db"):
-    """Save job data to SQLite database"""
+def drop_duplicate_jobs(df):
+    """Drop rows whose LinkedIn job ID was already seen (e.g. when merging CSVs)"""
+    job_ids = df['Link'].map(parse_job_id) if 'Link' in df.columns else pd.Series(None, index=df.index)
+    if 'Job ID' in df.columns:
+        job_ids = df['Job ID'].map(parse_job_id).fillna(job_ids)
+    df = df.assign(**{'Job ID': job_ids.astype('Int64')})
+    # Rows without an ID are kept; there is nothing reliable to compare them by
+    return df[df['Job ID'].isna() | ~df['Job ID'].duplicated(keep='first')]
+
+UPSERT_JOB_SQL = '''
+    INSERT INTO postings
+    (job_id, job_title, company_id, location_id, post_date, link, search_id, cluster_id,
+     first_seen, last_seen, seen_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 1)
+    ON CONFLICT (job_id) DO UPDATE SET last_seen = excluded.last_seen, seen_count = postings.seen_count + 1
+'''
+
+# Dimension table -> (key column, value columns)
+DIMENSIONS = {
+    "companies": ("company_id", ("name",)),
+    "locations": ("location_id", ("name",)),
+    "searches": ("search_id", ("keywords", "location")),
+}
+
+class JobStore:
+    """Persistent connection for bulk job writes.
+
+    The database is switched to WAL with synchronous=NORMAL (a commit no longer
+    waits for an fsync of the main file) and a larger page cache. insert() writes a
+    whole batch with executemany in one transaction and counts written rows from
+    sqlite3_changes(). cluster_reposts=False skips repost detection
+    (every new job is its own cluster), for bulk loads that are clustered later.
+
+    Each JobStore is one run (a row in runs, created on the first insert). Jobs
+    seen again are upserted: last_seen and seen_count are updated once per run,
+    and every job seen is recorded in observations as (run_id, job_id).
+    incremental=True marks a run whose crawl skipped already-stored jobs
+    (KnownJobCutoff); get_closed_jobs only compares full runs.
+
+    Company, location and search strings are interned into their dimension
+    tables; the integer IDs are cached for the life of the store.
+    """
+
+    def __init__(self, db_name="linkedin_jobs.db", cache_mb=64, cluster_reposts=True,
+                 search_keywords=None, search_location=None, incremental=False):
+        self.db_name = db_name
+        self.cluster_reposts = cluster_reposts
+        self.search = (search_keywords, search_location)
+        self.incremental = incremental
+        self.conn = connect(db_name)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute(f"PRAGMA cache_size = {-cache_mb * 1024}")
+        self.conn.execute("PRAGMA busy_timeout = 10000")
+        self.reposts = NearDuplicateIndex(self.conn)
+        self.run_id = None
+        self._dimension_ids = {table: {} for table in DIMENSIONS}
+        self.inserted = 0
+        self.reseen = 0
+        self.reposted = 0
+        self.without_id = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.run_id is not None:
+            with self.conn:
+                self.conn.execute("UPDATE runs SET finished_at = CURRENT_TIMESTAMP, jobs_seen = ? WHERE run_id = ?",
+                                  (self.inserted + self.reseen, self.run_id))
+        self.conn.close()
+
+    def _ids(self, sql, job_ids, *params):
+        # One statement for the whole batch: primary-key lookups for the IDs in a JSON array
+        return {job_id for (job_id,) in self.conn.execute(sql, (*params, json.dumps(job_ids)))}
+
+    def _intern(self, table, values):
+        """Make sure each value (a tuple of the table's value columns) has a row; IDs end up in the cache"""
+        key, columns = DIMENSIONS[table]
+        cache = self._dimension_ids[table]
+        where = " AND ".join(f"{column} = ?" for column in columns)
+        for value in set(values) - cache.keys():
+            if None in value:
+                continue
+            self.conn.execute(f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) "
+                              f"VALUES ({', '.join('?' * len(columns))})", value)
+            cache[value] = self.conn.execute(f"SELECT {key} FROM {table} WHERE {where}", value).fetchone()[0]
+
+    def insert(self, data):
+        """Upsert Job records (or older record dicts) in one transaction; returns the number of new rows"""
+        jobs = {}
+        for job in map(to_job, data):
+            if job.job_id is None:
+                self.without_id += 1
+            else:
+                jobs.setdefault(job.job_id, job)
+        if not jobs:
+            return 0
+
+        try:
+            inserted, upserted, reposted = self._upsert(jobs)
+        except BaseException:
+            self._dimension_ids = {table: {} for table in DIMENSIONS}  # IDs of rolled-back rows
+            raise
+        self.inserted += inserted
+        self.reseen += upserted - inserted
+        self.reposted += reposted
+        return inserted
+
+    def _upsert(self, jobs):
+        with self.conn:
+            # Take the write lock first so the stored/new split below cannot go stale
+            self.conn.execute("BEGIN IMMEDIATE")
+            if self.run_id is None:
+                self.run_id = self.conn.execute(
+                    "INSERT INTO runs (search_keywords, search_location, incremental) VALUES (?, ?, ?)",
+                    (*self.search, self.incremental)).lastrowid
+            job_ids = list(jobs)
+            observed = self._ids("SELECT job_id FROM observations WHERE run_id = ? AND job_id IN "
+                                 "(SELECT value FROM json_each(?))", job_ids, self.run_id)
+            stored = self._ids("SELECT job_id FROM postings WHERE job_id IN (SELECT value FROM json_each(?))", job_ids)
+            searches = {job_id: (job.search_keywords or '', job.search_location or '') for job_id, job in jobs.items()}
+            self._intern("companies", [(job.company,) for job in jobs.values()])
+            self._intern("locations", [(job.location,) for job in jobs.values()])
+            self._intern("searches", searches.values())
+            companies, locations, search_ids = (self._dimension_ids[table] for table in DIMENSIONS)
+            rows = []
+            inserted = reposted = 0
+            for job_id, job in jobs.items():
+                if job_id in observed:
+                    continue  # Already counted in this run
+                cluster_id = None
+                if job_id not in stored:
+                    inserted += 1
+                    # Reposts of a stored job (new ID, edited title) join its cluster
+                    cluster_id = self.reposts.add(job_id, job.title, job.company, job.location) if self.cluster_reposts else job_id
+                    reposted += cluster_id != job_id
+                rows.append((job_id, job.title, companies.get((job.company,)), locations.get((job.location,)),
+                             job.post_date, job.link, search_ids[searches[job_id]], cluster_id))
+            # executemany's rowcount sums sqlite3_changes() over the rows: an insert or an
+            # update counts once, writes made by triggers (the FTS index) are not counted
+            upserted = self.conn.executemany(UPSERT_JOB_SQL, rows).rowcount
+            self.conn.executemany("INSERT INTO observations (run_id, job_id) VALUES (?, ?)",
+                                  [(self.run_id, row[0]) for row in rows])
+        return inserted, upserted, reposted
+
+def save_to_database(data, db_name="linkedin_jobs.db"):
+    """Save job data (Job records, a JobBatch or older record dicts) to SQLite database"""
     if not data:
         print("No data to save to database")
         return 0
-    
-    conn = sqlite3.connect(db_name)
-    cursor = conn.cursor()
-    
-    # Insert data, ignoring duplicates
-    inserted_count = 0
-    for job in data:
-        try:
-            cursor.execute('''
-                INSERT OR IGNORE INTO jobs 
-                (job_title, company, location, post_date, link, search_keywords, search_location)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                job.get('Job Title', ''),
-                job.get('Company', ''),
-                job.get('Location', ''),
-                job.get('Post Date', ''),
-                job.get('Link', ''),
-                job.get('Search Keywords', ''),
-                job.get('Search Location', '')
-            ))
-            if cursor.rowcount > 0:
-                inserted_count += 1
-        except Exception as e:
-            print(f"Error inserting job: {e}")
-            continue
-    
-    conn.commit()
-    conn.close()
-    
-    print(f"✅ Saved {inserted_count} new jobs to database (duplicates ignored)")
+
+    with JobStore(db_name) as store:
+        inserted_count = store.insert(data)
+
+    if store.without_id:
+        print(f"⚠️ Skipped {store.without_id} jobs without a LinkedIn job ID")
+    print(f"✅ Saved {inserted_count} new jobs to database ({store.reseen} seen before, "
+          f"{store.reposted} reposts of stored jobs)")
     return inserted_count
 
-def get_jobs_from_database(db_name="linkedin_jobs.db", limit=100):
-    """Retrieve jobs from database"""
-    conn = sqlite3.connect(db_name)
-    df = pd.read_sql_query("SELECT * FROM jobs ORDER BY scraped_at DESC LIMIT ?", conn, params=(limit,))
+LATEST_JOBS_SQL = "SELECT * FROM jobs ORDER BY scraped_at DESC LIMIT ?"
+LATEST_SEARCH_JOBS_SQL = '''
+    SELECT * FROM jobs WHERE search_keywords = ? AND search_location = ?
+    ORDER BY scraped_at DESC LIMIT ?
+'''
+KNOWN_JOB_IDS_SQL = "SELECT job_id FROM jobs WHERE search_keywords = ? AND search_location = ?"
+# Counted by integer ID over the postings index, names joined only for the top rows
+COMPANY_STATS_SQL = '''
+    SELECT companies.name AS company, counts.job_count
+    FROM (
+        SELECT company_id, COUNT(*) AS job_count FROM postings
+        GROUP BY company_id ORDER BY job_count DESC LIMIT ?
+    ) AS counts
+    JOIN companies ON companies.company_id = counts.company_id
+    ORDER BY counts.job_count DESC
+'''
+LOCATION_STATS_SQL = '''
+    SELECT locations.name AS location, counts.job_count
+    FROM (
+        SELECT location_id, COUNT(*) AS job_count FROM postings
+        GROUP BY location_id ORDER BY job_count DESC LIMIT ?
+    ) AS counts
+    JOIN locations ON locations.location_id = counts.location_id
+    ORDER BY counts.job_count DESC
+'''
+
+def get_jobs_from_database(db_name="linkedin_jobs.db", limit=100, search_keywords=None, search_location=None):
+    """Retrieve the latest jobs, optionally only those found by one search"""
+    conn = connect(db_name)
+    if search_keywords is not None:
+        df = pd.read_sql_query(LATEST_SEARCH_JOBS_SQL, conn, params=(search_keywords, search_location or '', limit))
+    else:
+        df = pd.read_sql_query(LATEST_JOBS_SQL, conn, params=(limit,))
     conn.close()
     return df
 
+def get_known_job_ids(search_keywords, search_location, db_name="linkedin_jobs.db"):
+    """Return the set of LinkedIn job IDs already stored for a search"""
+    if not os.path.exists(db_name):
+        return set()
+    
+    conn = connect(db_name)
+    cursor = conn.execute(KNOWN_JOB_IDS_SQL, (search_keywords, search_location))
+    known_ids = {job_id for (job_id,) in cursor}
+    conn.close()
+    return known_ids
+
 def export_database_to_csv(db_name="linkedin_jobs.db", csv_filename=None):
-    """Export database to CSV file"""
+    """Export every stored job to a CSV file, streamed in chunks (see job_export)"""
+    from job_export import export_jobs
+
     if csv_filename is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         csv_filename = f"linkedin_jobs_database_{timestamp}.csv"
-    
-    df = get_jobs_from_database(db_name)
-    df.to_csv(csv_filename, index=False)
-    print(f"✅ Database exported to {csv_filename}")
+
+    exported, _ = export_jobs(csv_filename, db_name, fmt="csv")
+    print(f"✅ Database exported to {csv_filename} ({exported} jobs)")
     return csv_filename
 
-def get_company_stats(db_name="linkedin_jobs.db"):
+LAST_TWO_RUNS_SQL = '''
+    SELECT run_id FROM runs WHERE search_keywords IS ? AND search_location IS ? AND NOT incremental
+    ORDER BY run_id DESC LIMIT 2
+'''
+CLOSED_JOBS_SQL = '''
+    SELECT jobs.* FROM observations AS previous
+    JOIN jobs ON jobs.job_id = previous.job_id
+    WHERE previous.run_id = ?
+      AND NOT EXISTS (SELECT 1 FROM observations WHERE run_id = ? AND job_id = previous.job_id)
+'''
+POSTING_LIFETIMES_SQL = '''
+    SELECT job_id, job_title, company, first_seen, last_seen, seen_count,
+           julianday(last_seen) - julianday(first_seen) AS lifetime_days
+    FROM jobs WHERE last_seen >= ?
+    ORDER BY last_seen DESC
+'''
+
+def get_closed_jobs(db_name="linkedin_jobs.db", search_keywords=None, search_location=None):
+    """Jobs seen by the previous run of a search but not by its latest run (likely closed).
+
+    Incremental runs are left out: they skip stored jobs, so a missing job proves nothing.
+    """
+    conn = connect(db_name)
+    runs = [run_id for (run_id,) in conn.execute(LAST_TWO_RUNS_SQL, (search_keywords, search_location))]
+    if len(runs) < 2:
+        conn.close()
+        return pd.DataFrame()
+    latest, previous = runs
+    df = pd.read_sql_query(CLOSED_JOBS_SQL, conn, params=(previous, latest))
+    conn.close()
+    return df
+
+def get_posting_lifetimes(db_name="linkedin_jobs.db", seen_since="0000-01-01"):
+    """First/last sighting and lifetime in days of every job seen since a timestamp"""
+    conn = connect(db_name)
+    df = pd.read_sql_query(POSTING_LIFETIMES_SQL, conn, params=(seen_since,))
+    conn.close()
+    return df
+
+# Columns search_jobs can filter on (exact match)
+SEARCH_FILTERS = ("company", "location", "search_keywords", "search_location", "cluster_id")
+# bm25 weights of job_title, company, location: a title hit ranks above a company or place hit
+SEARCH_JOBS_SQL = '''
+    SELECT jobs.*, ranked.score FROM (
+        SELECT rowid, bm25(jobs_fts, 10.0, 4.0, 1.0) AS score FROM jobs_fts
+        WHERE jobs_fts MATCH ? ORDER BY score LIMIT ? OFFSET ?
+    ) AS ranked JOIN jobs ON jobs.job_id = ranked.rowid
+    ORDER BY ranked.score
+'''
+# With filters every match has to be joined to jobs before the limit applies
+FILTERED_SEARCH_JOBS_SQL = '''
+    SELECT jobs.*, bm25(jobs_fts, 10.0, 4.0, 1.0) AS score
+    FROM jobs_fts JOIN jobs ON jobs.job_id = jobs_fts.rowid
+    WHERE jobs_fts MATCH ?{filters}
+    ORDER BY score LIMIT ? OFFSET ?
+'''
+
+FTS_OPERATORS = ("OR", "NOT", "AND")
+
+def fts_query(text, operators=True):
+    """FTS5 MATCH expression for a search box query.
+
+    Words must all match (any column); "quoted words" match as a phrase, word*
+    as a prefix, and OR / NOT are kept as operators. Everything else is quoted,
+    so punctuation such as 'C++' or 'R&D' cannot break the query syntax.
+    Operators only stay between two terms: a run of them ('OR NOT') keeps the
+    last one, and leading or trailing ones are dropped. operators=False quotes
+    them as plain words.
+    """
+    terms = []
+    for token in re.findall(r'"[^"]*"?|\S+', text):
+        if operators and token in FTS_OPERATORS:
+            if terms and terms[-1] in FTS_OPERATORS:
+                terms[-1] = token
+            else:
+                terms.append(token)
+        elif token.startswith('"'):
+            phrase = token.strip('"').strip()
+            if phrase:
+                terms.append('"' + phrase.replace('"', '') + '"')
+        elif token.endswith("*") and token.rstrip("*"):
+            terms.append('"' + token.rstrip("*").replace('"', '') + '"*')
+        else:
+            terms.append('"' + token.replace('"', '') + '"')
+    while terms and terms[0] in FTS_OPERATORS:
+        terms.pop(0)
+    while terms and terms[-1] in FTS_OPERATORS:
+        terms.pop()
+    return " ".join(terms)
+
+def search_jobs(query, filters=None, limit=20, offset=0, db_name="linkedin_jobs.db"):
+    """Full-text search over job titles, companies and locations, best matches first.
+
+    filters is a dict of exact-match conditions on the SEARCH_FILTERS columns,
+    e.g. {"search_location": "Remote"}.
+    """
+    filters = filters or {}
+    unknown = set(filters) - set(SEARCH_FILTERS)
+    if unknown:
+        raise ValueError(f"Cannot filter jobs by {', '.join(sorted(unknown))}; use one of {', '.join(SEARCH_FILTERS)}")
+    match = fts_query(query)
+    if not match:
+        return pd.DataFrame()
+
+    sql = SEARCH_JOBS_SQL
+    if filters:
+        sql = FILTERED_SEARCH_JOBS_SQL.format(filters="".join(f" AND jobs.{column} = ?" for column in filters))
+    conn = connect(db_name)
+    try:
+        df = pd.read_sql_query(sql, conn, params=(match, *filters.values(), limit, offset))
+    except pd.errors.DatabaseError as e:
+        if not isinstance(e.__cause__, sqlite3.OperationalError):
+            raise
+        # FTS5 still rejected the expression: search every word literally instead
+        literal = fts_query(query, operators=False)
+        df = pd.read_sql_query(sql, conn, params=(literal, *filters.values(), limit, offset))
+    finally:
+        conn.close()
+    return df
+
+def get_company_stats(db_name="linkedin_jobs.db", limit=10):
     """Get company job statistics"""
-    conn = sqlite3.connect(db_name)
-    df = pd.read_sql_query('''
-        SELECT company, COUNT(*) as job_count 
-        FROM jobs 
-        GROUP BY company 
-        ORDER BY job_count DESC 
-        LIMIT 10
-    ''', conn)
+    conn = connect(db_name)
+    df = pd.read_sql_query(COMPANY_STATS_SQL, conn, params=(limit,))
+    conn.close()
+    return df
+
+def get_location_stats(db_name="linkedin_jobs.db", limit=10):
+    """Get location job statistics"""
+    conn = connect(db_name)
+    df = pd.read_sql_query(LOCATION_STATS_SQL, conn, params=(limit,))
     conn.close()
     return df
 
@@ -127,6 +676,8 @@ def main():
     company_stats = get_company_stats()
     print("\n📊 Top Companies by Job Count:")
     print(company_stats.to_string(index=False))
+    print("\n📍 Top Locations by Job Count:")
+    print(get_location_stats().to_string(index=False))
     
     # Export to CSV
     csv_file = export_database_to_csv()
@@ -0,0 +1,222 @@
+"""
+Pool of warm, reusable Chrome WebDrivers
+
+Starting Chrome and logging in costs tens of seconds per run. DriverPool keeps up
+to `size` browsers alive (optionally logged in by a warmup callable) and leases
+them to search tasks. A driver is recycled after `max_pages` page loads or once
+its browser process tree grows past `max_rss_mb`, which bounds memory growth in
+long-running scheduled scrapes.
+"""
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from driver_setup import create_driver
+
+try:
+    import psutil
+except ImportError:  # RSS-based recycling is skipped without psutil
+    psutil = None
+
+
+def browser_rss_mb(driver):
+    """Resident memory of chromedriver plus all Chrome processes it spawned, in MB"""
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+    except Exception:
+        return None
+
+
+class DriverLease:
+    """A pooled driver plus the usage counters the pool recycles on"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages_loaded = 0
+        self.leases = 0
+        self.created_at = time.time()
+
+    def record_page(self, count=1):
+        """Call after each page load so the pool can recycle worn-out drivers"""
+        self.pages_loaded += count
+
+
+class DriverPool:
+    """Leases warm WebDrivers to search tasks and recycles them when they wear out"""
+
+    def __init__(self, size=2, factory=create_driver, warmup=None, max_pages=200, max_rss_mb=1500):
+        self.size = size
+        self.factory = factory
+        self.warmup = warmup
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+
+        self._idle = queue.LifoQueue()  # LIFO hands out the most recently used (warmest) driver
+        self._lock = threading.Lock()
+        self._live = 0
+        self._closed = False
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "recycled": 0,
+            "lease_waits": 0,
+            "total_wait_sec": 0.0,
+            "max_wait_sec": 0.0,
+        }
+
+    def _count(self, key, waited=None):
+        with self._lock:
+            self._stats[key] += 1
+            if waited is not None:
+                self._stats["lease_waits"] += 1
+                self._stats["total_wait_sec"] += waited
+                self._stats["max_wait_sec"] = max(self._stats["max_wait_sec"], waited)
+
+    def _create(self):
+        driver = self.factory()
+        lease = DriverLease(driver)
+        if self.warmup:
+            try:
+                self.warmup(driver)
+            except Exception:
+                driver.quit()
+                raise
+        return lease
+
+    def prewarm(self):
+        """Start every browser up front so the first searches don't pay the cold start"""
+        with self._lock:
+            missing = self.size - self._live
+            self._live += missing
+        for started in range(missing):
+            try:
+                self._idle.put(self._create())
+            except Exception:
+                with self._lock:
+                    self._live -= missing - started
+                raise
+        print(f"✅ Driver pool warmed with {self.size} browsers")
+
+    def _try_reserve(self):
+        with self._lock:
+            if self._live < self.size:
+                self._live += 1
+                return True
+            return False
+
+    def acquire(self, timeout=None):
+        """Take a driver from the pool, starting one if the pool is not yet full"""
+        start = time.perf_counter()
+        waited = False
+        while True:
+            if self._closed:
+                raise RuntimeError("DriverPool is closed")
+
+            try:
+                lease = self._idle.get_nowait()
+                self._count("hits", waited=time.perf_counter() - start if waited else None)
+                lease.leases += 1
+                return lease
+            except queue.Empty:
+                pass
+
+            if self._try_reserve():
+                self._count("misses")
+                try:
+                    lease = self._create()
+                except Exception:
+                    with self._lock:
+                        self._live -= 1
+                    raise
+                lease.leases += 1
+                return lease
+
+            # Pool is full: wait for another task to release (or recycle) a driver
+            remaining = None if timeout is None else timeout - (time.perf_counter() - start)
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError(f"No pooled driver became free within {timeout}s")
+            waited = True
+            try:
+                lease = self._idle.get(timeout=0.5 if remaining is None else min(remaining, 0.5))
+            except queue.Empty:
+                continue
+            self._count("hits", waited=time.perf_counter() - start)
+            lease.leases += 1
+            return lease
+
+    def _worn_out(self, lease):
+        if self.max_pages and lease.pages_loaded >= self.max_pages:
+            return f"{lease.pages_loaded} pages loaded"
+        if self.max_rss_mb:
+            rss = browser_rss_mb(lease.driver)
+            if rss is not None and rss >= self.max_rss_mb:
+                return f"{rss:.0f} MB RSS"
+        return None
+
+    def release(self, lease, broken=False):
+        """Return a driver to the pool, quitting it instead if it is broken or worn out"""
+        reason = "driver error" if broken else self._worn_out(lease)
+        if reason or self._closed:
+            if reason:
+                print(f"♻️ Recycling pooled driver ({reason})")
+                self._count("recycled")
+            try:
+                lease.driver.quit()
+            except Exception:
+                pass
+            with self._lock:
+                self._live -= 1
+            return
+        self._idle.put(lease)
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """Context manager form of acquire/release"""
+        lease = self.acquire(timeout)
+        broken = False
+        try:
+            yield lease
+        except Exception:
+            # A failed task may have left the browser in an unknown state
+            broken = True
+            raise
+        finally:
+            self.release(lease, broken=broken)
+
+    def metrics(self):
+        """Pool hit/miss counts and lease-wait statistics"""
+        with self._lock:
+            stats = dict(self._stats)
+        leases = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / leases if leases else 0.0
+        stats["mean_wait_sec"] = stats["total_wait_sec"] / stats["lease_waits"] if stats["lease_waits"] else 0.0
+        stats["live_drivers"] = self._live
+        stats["idle_drivers"] = self._idle.qsize()
+        return stats
+
+    def close(self):
+        """Quit every idle driver; leased drivers are quit when released"""
+        self._closed = True
+        while True:
+            try:
+                lease = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                lease.driver.quit()
+            except Exception:
+                pass
+            with self._lock:
+                self._live -= 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
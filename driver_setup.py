@@ -0,0 +1,106 @@
+"""
+Shared Chrome WebDriver setup for the scrapers and the driver pool
+"""
+
+import os
+from functools import lru_cache
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+
+from lean_load import apply_lean_options, enable_request_blocking, lean_load_enabled
+from network_capture import enable_performance_log
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+STEALTH_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+    window.chrome = {runtime: {}};
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en']
+    });
+"""
+
+
+@lru_cache(maxsize=1)
+def chromedriver_path():
+    """Resolve the ChromeDriver binary once per process instead of once per driver"""
+    print("🔧 Installing/finding ChromeDriver...")
+    return ChromeDriverManager().install()
+
+
+def build_chrome_options(headless=None, user_data_dir=None, lean=None, detach=False, performance_log=False):
+    """Anti-detection and stability flags shared by every scraper
+
+    detach keeps the browser window open after the script ends (interactive scripts);
+    performance_log turns on the network log that EXTRACTION_MODE=network reads.
+    """
+    if headless is None:
+        headless = os.getenv("HEADLESS", "false").lower() == "true"
+    if lean is None:
+        lean = lean_load_enabled()
+
+    chrome_options = Options()
+    if detach:
+        chrome_options.add_experimental_option("detach", True)
+    if headless:
+        chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--window-size=1280,800")
+
+    # Anti-Detection Flags
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
+    chrome_options.add_experimental_option("useAutomationExtension", False)
+
+    # Stability Flags
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-infobars")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--lang=en-US")
+
+    # Keep background tabs loading at full speed (paginated fetch uses several tabs)
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+
+    # Persistent profile keeps the LinkedIn session between runs (one browser per profile)
+    if user_data_dir:
+        chrome_options.add_argument(f"--user-data-dir={os.path.abspath(user_data_dir)}")
+
+    # Eager page loads + performance log for the blocked-request counts
+    if lean:
+        apply_lean_options(chrome_options)
+    if performance_log:
+        enable_performance_log(chrome_options)
+
+    # User Agent
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+    return chrome_options
+
+
+def create_driver(headless=None, page_load_timeout=30, user_data_dir=None, lean=None, detach=False,
+                  performance_log=False):
+    """Create a Chrome WebDriver with the shared options and automation masking"""
+    if lean is None:
+        lean = lean_load_enabled()
+    service = Service(chromedriver_path())
+    options = build_chrome_options(headless, user_data_dir, lean, detach, performance_log)
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.set_page_load_timeout(page_load_timeout)
+
+    # Execute CDP commands to mask automation
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": STEALTH_SCRIPT})
+    except Exception as e:
+        print(f"⚠️ Warning: Could not execute CDP command: {e}")
+
+    # Skip images, fonts, media and trackers the extractor never reads
+    if lean:
+        enable_request_blocking(driver)
+
+    return driver
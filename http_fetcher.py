@@ -0,0 +1,164 @@
+"""
+Driverless HTTP engine for LinkedIn's public (guest) job search
+
+The guest job list is plain server-rendered HTML (base-card / base-search-card
+markup), so it can be fetched without Chrome. GuestJobFetcher uses one pooled
+requests.Session (keep-alive, gzip/deflate plus brotli when the brotli package
+is installed, retries with backoff on 429/5xx) and keeps up to `concurrency`
+page requests in flight. Pages are parsed by the same card parser as the
+Selenium engine and yielded in page order.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+from job_card_extractor import extract_cards_from_html
+
+# Guest endpoint that returns the job list fragment for one results page
+GUEST_SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+GUEST_PAGE_SIZE = 25
+
+# Same browser identity as the Selenium engine (kept here so this engine needs no Selenium)
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# urllib3 advertises "br" only when a brotli decoder is importable
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+
+def build_guest_url(keywords, location, start=0, sort_by_date=False, base_url=GUEST_SEARCH_URL):
+    """Build the guest search URL for one results page"""
+    url = f"{base_url}?keywords={quote(keywords)}&location={quote(location)}"
+    if sort_by_date:
+        url += "&sortBy=DD"
+    return url + f"&start={start}"
+
+
+def create_session(pool_size=4, retries=3):
+    """requests.Session with a connection pool sized for `pool_size` concurrent requests"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                          allowed_methods=("GET",)),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+class GuestJobFetcher:
+    """Fetches guest job-search pages over HTTP with bounded concurrency"""
+
+    def __init__(self, concurrency=4, timeout=15, base_url=GUEST_SEARCH_URL, session=None, snapshots=None):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.base_url = base_url
+        self.session = session or create_session(pool_size=concurrency)
+        self.snapshots = snapshots  # Optional snapshot_store.SnapshotStore for offline replay
+        self._lock = threading.Lock()
+        self._stats = {"pages": 0, "cards": 0, "bytes": 0, "fetch_sec": 0.0, "wall_sec": 0.0, "errors": 0}
+
+    def _count(self, **increments):
+        with self._lock:
+            for key, value in increments.items():
+                self._stats[key] += value
+
+    def fetch_page(self, keywords, location, start=0, sort_by_date=False):
+        """Fetch and parse one results page; returns its cards ([] past the last page, None if the request failed)"""
+        url = build_guest_url(keywords, location, start, sort_by_date, self.base_url)
+        started = time.perf_counter()
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            if response.status_code == 404:  # Guest API answers 404/empty past the last page
+                return []
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"⚠️ Guest page start={start} failed: {e}")
+            self._count(errors=1)
+            return None
+        if self.snapshots is not None:
+            self.snapshots.put(response.text, query=keywords, location=location, url=url,
+                               scroll_index=start // GUEST_PAGE_SIZE, engine="http")
+        cards = extract_cards_from_html(response.text)
+        self._count(pages=1, cards=len(cards), bytes=len(response.content), fetch_sec=time.perf_counter() - started)
+        return cards
+
+    def iter_jobs(self, keywords, location, max_pages=5, cutoff=None, sort_by_date=False):
+        """Yield cards from up to max_pages results pages, in page order.
+
+        Up to `concurrency` pages are in flight at once. Fetching stops at the first
+        empty page, or once a KnownJobCutoff reports a run of stored jobs; a page whose
+        request failed (timeout, 429 or 5xx after retries) is skipped, not taken as the end.
+        """
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            in_flight = deque()
+            next_page = 0
+
+            def submit():
+                nonlocal next_page
+                in_flight.append((next_page, executor.submit(
+                    self.fetch_page, keywords, location, next_page * GUEST_PAGE_SIZE, sort_by_date)))
+                next_page += 1
+
+            while next_page < min(self.concurrency, max_pages):
+                submit()
+
+            try:
+                while in_flight:
+                    page_index, future = in_flight.popleft()
+                    cards = future.result()
+                    if cards is None:
+                        print(f"⚠️ Page {page_index + 1} failed, skipping it")
+                        if next_page < max_pages:
+                            submit()
+                        continue
+                    print(f"🌐 Page {page_index + 1}: {len(cards)} job cards")
+                    if not cards:
+                        return
+
+                    if cutoff:
+                        cards = cutoff.filter(cards)
+                    yield from cards
+                    if cutoff and cutoff.reached:
+                        print(f"⏹️ Reached {cutoff.consecutive_seen} already-stored jobs in a row, stopping early.")
+                        return
+
+                    if next_page < max_pages:
+                        submit()
+            finally:
+                # Pages past the end of results or the cutoff are not waited for
+                for _, future in in_flight:
+                    future.cancel()
+                self._count(wall_sec=time.perf_counter() - started)
+
+    def stats(self):
+        """Pages, cards, bytes and throughput so far"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["pages_per_sec"] = round(stats["pages"] / stats["wall_sec"], 1) if stats["wall_sec"] else 0.0
+        return stats
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
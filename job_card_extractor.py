@@ -0,0 +1,303 @@
+"""
+Shared job card extraction for the LinkedIn scrapers.
+
+Two extraction paths share one set of fallback selectors:
+- "js": a single execute_script call walks the job cards inside the page and
+  returns a compact JSON array, so page_source never crosses the WebDriver wire
+- "soup": the original BeautifulSoup path over driver.page_source, kept as the
+  fallback when script execution fails; it parses with lxml and only builds the
+  job-card subtrees (see page_parser)
+"""
+
+import json
+
+from job_ids import LINKEDIN_ROOT, parse_job_id
+from page_parser import card_strainer, parse_results_html
+from selector_plan import SelectorPlan
+from selector_stats import LAYOUT_FINGERPRINT_EXPR, LAYOUT_MARKERS, layout_fingerprint, probe_cascade, selector_stats
+
+# Card and per-field fallback selectors come from selectors.json (first match wins)
+SELECTOR_PLAN = SelectorPlan.load()
+CARD_SELECTORS = SELECTOR_PLAN.cards
+FIELD_SELECTORS = SELECTOR_PLAN.fields
+
+# Parse-only filter: BeautifulSoup builds nothing outside the card containers
+CARD_STRAINER = card_strainer(CARD_SELECTORS)
+
+EXTRACTION_MODES = ("js", "soup")
+
+# Runs inside the page. arguments[0] = card selectors, arguments[1] = field selectors,
+# arguments[2] = incremental flag, arguments[3] = layout markers, arguments[4] = card selector
+# plans per layout fingerprint ({fingerprint: {order, skipped}}, see selector_stats.py).
+# In incremental mode only cards whose key is not in window.__scraperSeenJobKeys are
+# returned, so each call ships just the newly appended cards.
+# All fields of a card are resolved in one querySelectorAll walk over the union of the
+# field selectors; per field the highest-priority alternative wins and its index is returned.
+# Returns a JSON string (cards, layout, timed card selector probes) so the whole result
+# crosses the wire as one compact value.
+EXTRACT_CARDS_JS = """
+const cardSelectors = arguments[0];
+const fieldSelectors = arguments[1];
+const incremental = arguments[2];
+if (!window.__scraperSeenJobKeys) window.__scraperSeenJobKeys = new Set();
+const seen = window.__scraperSeenJobKeys;
+const layout = """ + LAYOUT_FINGERPRINT_EXPR + """;
+const plan = (arguments[4] || {})[layout] || {order: cardSelectors, skipped: []};
+const probes = [];
+let cards = [];
+for (const sel of plan.order.concat(plan.skipped)) {
+    const t0 = performance.now();
+    cards = document.querySelectorAll(sel);
+    probes.push([sel, cards.length > 0, performance.now() - t0]);
+    if (cards.length) break;
+}
+const fieldNames = Object.keys(fieldSelectors);
+const union = [...new Set(fieldNames.flatMap(name => fieldSelectors[name]))].join(',');
+const resolve = (card) => {
+    const best = {};
+    for (const name of fieldNames) best[name] = {rank: fieldSelectors[name].length, el: null};
+    let open = fieldNames.length;
+    for (const el of card.querySelectorAll(union)) {
+        for (const name of fieldNames) {
+            for (let k = 0; k < best[name].rank; k++) {
+                if (el.matches(fieldSelectors[name][k])) {
+                    best[name] = {rank: k, el: el};
+                    if (k === 0) open--;
+                    break;
+                }
+            }
+        }
+        if (!open) break;
+    }
+    return best;
+};
+const text = (el) => el ? el.textContent.replace(/\\s+/g, ' ').trim() : null;
+const out = [];
+for (const card of cards) {
+    const idHolder = card.matches('[data-job-id]') ? card : card.querySelector('[data-job-id]');
+    const jobId = idHolder ? idHolder.getAttribute('data-job-id') : card.getAttribute('data-entity-urn');
+    const fields = resolve(card);
+    const dateEl = fields.post_date.el;
+    const linkEl = fields.link.el;
+    if (incremental) {
+        const key = jobId || (linkEl && linkEl.getAttribute('href'));
+        if (!key || seen.has(key)) continue;
+        seen.add(key);
+    }
+    const matched = {};
+    for (const name of fieldNames) matched[name] = fields[name].el ? fields[name].rank : -1;
+    out.push({
+        job_id: jobId,
+        title: text(fields.title.el),
+        company: text(fields.company.el),
+        location: text(fields.location.el),
+        post_date: dateEl ? (dateEl.getAttribute('datetime') || text(dateEl)) : null,
+        link: linkEl ? linkEl.getAttribute('href') : null,
+        matched: matched
+    });
+}
+return JSON.stringify({cards: out, layout: layout, probes: probes});
+"""
+
+
+def clean_link(href):
+    """Make a job link absolute and strip tracking parameters."""
+    if not href:
+        return "N/A"
+    if href.startswith("/"):
+        href = LINKEDIN_ROOT + href
+    return href.split("?")[0]
+
+
+def normalize_card(raw):
+    """Turn a raw card dict from either extraction path into a uniform record."""
+    link = clean_link(raw.get("link"))
+    job_id = parse_job_id(raw.get("job_id")) or parse_job_id(link)
+    if link == "N/A" and job_id:
+        link = f"{LINKEDIN_ROOT}/jobs/view/{job_id}"
+    return {
+        "job_id": job_id,
+        "title": raw.get("title") or "N/A",
+        "company": raw.get("company") or "N/A",
+        "location": raw.get("location") or "N/A",
+        "post_date": raw.get("post_date") or "N/A",
+        "link": link,
+    }
+
+
+def extract_cards_js(driver, incremental=False):
+    """Extract job cards in the browser with one execute_script call."""
+    plans = {}
+    for fingerprint in selector_stats.known_layouts("cards"):
+        order, skipped = selector_stats.plan(fingerprint, "cards", CARD_SELECTORS)
+        plans[fingerprint] = {"order": order, "skipped": skipped}
+    payload = json.loads(driver.execute_script(
+        EXTRACT_CARDS_JS, CARD_SELECTORS, FIELD_SELECTORS, incremental, LAYOUT_MARKERS, plans) or "[]")
+    if isinstance(payload, dict):
+        selector_stats.record(payload["layout"], "cards", payload["probes"])
+        payload = payload["cards"]
+
+    cards = []
+    for raw in payload:
+        if "matched" in raw:
+            SELECTOR_PLAN.record_ranks(raw["matched"])
+        cards.append(normalize_card(raw))
+    return cards
+
+
+def _soup_text(el):
+    return " ".join(el.get_text(" ", strip=True).split()) if el else None
+
+
+def extract_cards_from_html(html, restrict=True, parser=None):
+    """Extract job cards from raw HTML with BeautifulSoup (fallback path)."""
+    fingerprint = layout_fingerprint(html)
+    soup = parse_results_html(html, CARD_STRAINER if restrict else None, parser)
+
+    # Card selectors that worked on this layout before are probed first, dead ones last
+    order, skipped = selector_stats.plan(fingerprint, "cards", CARD_SELECTORS)
+    cards, probes = probe_cascade(order, skipped, soup.select)
+    selector_stats.record(fingerprint, "cards", probes)
+
+    records = []
+    for card in cards:
+        id_holder = card if card.has_attr("data-job-id") else card.select_one("[data-job-id]")
+        fields = SELECTOR_PLAN.resolve(card)  # One walk over the card for every field
+        date_el = fields["post_date"]
+        link_el = fields["link"]
+        records.append(normalize_card({
+            "job_id": id_holder.get("data-job-id") if id_holder else card.get("data-entity-urn"),
+            "title": _soup_text(fields["title"]),
+            "company": _soup_text(fields["company"]),
+            "location": _soup_text(fields["location"]),
+            "post_date": (date_el.get("datetime") or _soup_text(date_el)) if date_el else None,
+            "link": link_el.get("href") if link_el else None,
+        }))
+    return records
+
+
+def extract_job_cards(driver, mode="js"):
+    """Extract job cards from the current page, falling back to BeautifulSoup if JS fails."""
+    if mode not in EXTRACTION_MODES:
+        raise ValueError(f"Unknown extraction mode: {mode} (expected one of {EXTRACTION_MODES})")
+
+    if mode == "js":
+        try:
+            return extract_cards_js(driver)
+        except Exception as e:
+            print(f"⚠️ JS extraction failed, falling back to BeautifulSoup: {e}")
+
+    return extract_cards_from_html(driver.page_source)
+
+
+def _card_key(card):
+    return card["job_id"] or card["link"]
+
+
+class KnownJobCutoff:
+    """Tracks runs of already-stored job IDs for incremental crawls.
+
+    With results sorted newest-first (sortBy=DD), once stop_after_seen consecutive
+    cards are already known the rest of the list is assumed to be known too.
+    """
+
+    def __init__(self, known_job_ids, stop_after_seen=10):
+        self.known_job_ids = known_job_ids or set()
+        self.stop_after_seen = stop_after_seen
+        self.consecutive_seen = 0
+        self.skipped = 0
+        self.reached = False
+
+    def is_known(self, card):
+        """Record one card; returns True if it is already stored and should be skipped."""
+        if card["job_id"] in self.known_job_ids:
+            self.consecutive_seen += 1
+            self.skipped += 1
+            if self.stop_after_seen and self.consecutive_seen >= self.stop_after_seen:
+                self.reached = True
+            return True
+        self.consecutive_seen = 0
+        return False
+
+    def filter(self, cards):
+        """Drop known cards, stopping at the card that completes the seen run."""
+        fresh = []
+        for card in cards:
+            if self.is_known(card):
+                if self.reached:
+                    break
+                continue
+            fresh.append(card)
+        return fresh
+
+
+def stream_job_cards(driver, results_pane, max_scrolls=5, pause=None, mode="js", cutoff=None, waiter=None,
+                     snapshots=None, snapshot_meta=None):
+    """Scroll the results pane and yield only the cards appended since the last scroll.
+
+    The cursor lives in the page (job IDs already shipped), so each scroll transfers
+    just the new cards and callers can write records out while scrolling continues.
+    The BeautifulSoup fallback filters against a Python set of job keys instead.
+    With a KnownJobCutoff, already-stored cards are skipped and scrolling stops once
+    a run of them is reached. A waiter (scroll_wait.AdaptiveScrollWait) replaces the
+    fixed pause: it scrolls and returns as soon as new cards render. With a
+    snapshot_store.SnapshotStore, the page HTML after every scroll is saved for replay.
+    """
+    if mode not in EXTRACTION_MODES:
+        raise ValueError(f"Unknown extraction mode: {mode} (expected one of {EXTRACTION_MODES})")
+
+    use_js = mode == "js"
+    if use_js:
+        # Reset the in-page cursor in case this tab was scraped before
+        driver.execute_script("window.__scraperSeenJobKeys = new Set();")
+    seen_keys = set()
+
+    def new_cards():
+        nonlocal use_js
+        if use_js:
+            try:
+                cards = extract_cards_js(driver, incremental=True)
+                # Mirror the cursor so a mid-stream BeautifulSoup fallback won't re-yield
+                seen_keys.update(_card_key(card) for card in cards)
+                return cards
+            except Exception as e:
+                print(f"⚠️ JS extraction failed, falling back to BeautifulSoup: {e}")
+                use_js = False
+        fresh = []
+        for card in extract_cards_from_html(driver.page_source):
+            key = _card_key(card)
+            if key and key != "N/A" and key not in seen_keys:
+                seen_keys.add(key)
+                fresh.append(card)
+        return fresh
+
+    def next_batch(scroll_index):
+        if snapshots is not None:
+            snapshots.put(driver.page_source, url=driver.current_url, scroll_index=scroll_index,
+                          **(snapshot_meta or {}))
+        cards = new_cards()
+        return cutoff.filter(cards) if cutoff else cards
+
+    # Cards already rendered before the first scroll
+    yield from next_batch(0)
+
+    timeouts_in_a_row = 0
+    for scroll in range(max_scrolls):
+        if cutoff and cutoff.reached:
+            print(f"⏹️ Reached {cutoff.consecutive_seen} already-stored jobs in a row, stopping early.")
+            return
+        if waiter:
+            outcome = waiter.scroll_and_wait(driver, results_pane)
+            timeouts_in_a_row = timeouts_in_a_row + 1 if outcome["timed_out"] else 0
+        else:
+            driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", results_pane)
+            if pause:
+                pause()
+        cards = next_batch(scroll + 1)
+        print(f"Scrolled {scroll + 1} times... {len(cards)} new cards")
+        yield from cards
+
+        # Two scrolls in a row with nothing new rendering: the list is exhausted
+        if timeouts_in_a_row >= 2:
+            print("Reached the end of job listings.")
+            return
@@ -0,0 +1,132 @@
+"""
+Streaming export of the jobs table to CSV, JSON Lines or Parquet
+
+Rows are read from one SQLite cursor in fixed-size chunks, in (scraped_at,
+job_id) order straight off the scraped_at index, and each chunk is written
+before the next is fetched (one Parquet row group per chunk), so memory use
+does not grow with the table. Every export returns a cursor for the last row
+written; passing it back as `since` exports only jobs stored after it. The
+cursor never moves past rows stamped with the second the export ran in (a job
+stored later in that second may have a lower job ID), so those rows can appear
+again in the next incremental export, but none are skipped.
+
+    python job_export.py linkedin_jobs.jsonl
+    python job_export.py new_jobs.csv --state export_cursor.txt   # incremental, cursor kept in a file
+"""
+
+import argparse
+import csv
+import json
+from pathlib import Path
+
+from database_storage import connect
+
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".parquet": "parquet"}
+INTEGER_COLUMNS = {"job_id", "cluster_id", "seen_count"}
+
+EXPORT_SQL = '''
+    SELECT * FROM jobs WHERE (scraped_at, job_id) > (?, ?)
+    ORDER BY scraped_at, job_id
+'''
+
+
+def parse_since(since):
+    """(scraped_at, job_id) from an export cursor; a bare timestamp means everything stored at or after it"""
+    if not since:
+        return "", -1
+    scraped_at, _, job_id = since.partition("|")
+    return scraped_at, int(job_id) if job_id else -1
+
+
+def _csv_writer(path, columns):
+    f = open(path, "w", newline="", encoding="utf-8")
+    writer = csv.writer(f)
+    writer.writerow(columns)
+    return writer.writerows, f.close
+
+
+def _jsonl_writer(path, columns):
+    f = open(path, "w", encoding="utf-8")
+
+    def write(rows):
+        f.writelines(json.dumps(dict(zip(columns, row))) + "\n" for row in rows)
+
+    return write, f.close
+
+
+def _parquet_writer(path, columns):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export needs the pyarrow package (pip install pyarrow)") from None
+
+    schema = pa.schema([(column, pa.int64() if column in INTEGER_COLUMNS else pa.string()) for column in columns])
+    writer = pq.ParquetWriter(path, schema)
+
+    def write(rows):
+        # One row group per chunk
+        writer.write_table(pa.Table.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)], schema=schema))
+
+    return write, writer.close
+
+
+WRITERS = {"csv": _csv_writer, "jsonl": _jsonl_writer, "parquet": _parquet_writer}
+
+
+def export_jobs(path, db_name="linkedin_jobs.db", fmt=None, since=None, chunk_size=50_000):
+    """Stream jobs stored after `since` to path; returns (rows written, cursor for the next export)"""
+    fmt = fmt or FORMATS.get(Path(path).suffix.lower())
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown export format for {path}; use one of {', '.join(FORMATS)} or pass fmt")
+
+    conn = connect(db_name)
+    try:
+        (now,) = conn.execute("SELECT CURRENT_TIMESTAMP").fetchone()
+        cursor = conn.execute(EXPORT_SQL, parse_since(since))
+        columns = [column[0] for column in cursor.description]
+        scraped_at, job_id = columns.index("scraped_at"), columns.index("job_id")
+        write, close = WRITERS[fmt](path, columns)
+        exported = 0
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                write(rows)
+                exported += len(rows)
+                # Rows are in scraped_at order: the cursor is the last one stamped before this second
+                for row in reversed(rows):
+                    if row[scraped_at] < now:
+                        since = f"{row[scraped_at]}|{row[job_id]}"
+                        break
+        finally:
+            close()
+    finally:
+        conn.close()
+    return exported, since
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="output file (.csv, .jsonl or .parquet)")
+    parser.add_argument("--db", default="linkedin_jobs.db")
+    parser.add_argument("--format", choices=sorted(WRITERS), help="default: from the file extension")
+    parser.add_argument("--since", help="export cursor (or timestamp) of an earlier export")
+    parser.add_argument("--state", help="file holding the cursor: read before the export, updated after it")
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    args = parser.parse_args()
+
+    since = args.since
+    state = Path(args.state) if args.state else None
+    if since is None and state and state.exists():
+        since = state.read_text().strip()
+    exported, cursor = export_jobs(args.path, args.db, args.format, since, args.chunk_size)
+    if state and cursor:
+        state.write_text(cursor + "\n")
+    print(f"✅ Exported {exported} jobs to {args.path}" + (f" (next --since '{cursor}')" if cursor else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""
+LinkedIn job IDs and links
+
+Kept free of Selenium and the extraction code, so storage, the seen-set and the
+run archive can key jobs without importing the scraper.
+"""
+
+import re
+
+LINKEDIN_ROOT = "https://www.linkedin.com"
+
+_JOB_ID_RE = re.compile(r"(\d{6,})")
+_JOB_VIEW_RE = re.compile(r"/jobs/view/(?:[^/?#]*?-)?(\d+)")
+
+
+def parse_job_id(value):
+    """Pull the numeric LinkedIn job ID out of a data-job-id, URN or /jobs/view/ link."""
+    if value is None:
+        return None
+    value = str(value)
+    match = _JOB_VIEW_RE.search(value) or _JOB_ID_RE.search(value)
+    return int(match.group(1)) if match else None
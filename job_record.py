@@ -0,0 +1,137 @@
+"""
+Typed job record shared by the scrapers, storage and analysis
+
+Job is a slotted dataclass (no per-record __dict__, attribute access instead of
+'Job Title'-style string keys). JobBatch stores many jobs column by column, one
+list per field, and hands those lists straight to pandas or pyarrow, so no
+per-row dict is built on the way to a DataFrame. The 'Job Title', 'Company', ...
+labels only appear at the edges (CSV headers, DataFrame columns); Job.from_record
+still reads dicts in that format and in the lowercase format of older scrapers.
+"""
+
+from dataclasses import dataclass
+from operator import attrgetter
+
+from job_ids import parse_job_id
+
+FIELDS = ("job_id", "title", "company", "location", "post_date", "link", "search_keywords", "search_location")
+
+# CSV header / DataFrame column of each field
+LABELS = {
+    "job_id": "Job ID",
+    "title": "Job Title",
+    "company": "Company",
+    "location": "Location",
+    "post_date": "Post Date",
+    "link": "Link",
+    "search_keywords": "Search Keywords",
+    "search_location": "Search Location",
+}
+
+# Dict keys seen in older records and CSV files, mapped to fields
+_KEY_ALIASES = {**{field: field for field in FIELDS}, **{label: field for field, label in LABELS.items()},
+                "Date Posted": "post_date", "date": "post_date"}
+
+_values = attrgetter(*FIELDS)
+
+
+@dataclass(slots=True)
+class Job:
+    job_id: int | None
+    title: str = "N/A"
+    company: str = "N/A"
+    location: str = "N/A"
+    post_date: str = "N/A"
+    link: str = "N/A"
+    search_keywords: str | None = None
+    search_location: str | None = None
+
+    @classmethod
+    def from_card(cls, card, search_keywords=None, search_location=None):
+        """Job from a normalized card (job_card_extractor.normalize_card)"""
+        return cls(card["job_id"], card["title"], card["company"], card["location"], card["post_date"],
+                   card["link"], search_keywords, search_location)
+
+    @classmethod
+    def from_record(cls, record):
+        """Job from a dict with 'Job Title'-style or lowercase keys"""
+        values = {_KEY_ALIASES[key]: value for key, value in record.items() if key in _KEY_ALIASES}
+        job_id = parse_job_id(values.pop("job_id", None)) or parse_job_id(values.get("link"))
+        return cls(job_id, **values)
+
+    def key(self):
+        """Dedup key: the job ID, or the link when a card had no ID"""
+        return self.job_id if self.job_id is not None else self.link
+
+    def as_row(self):
+        """Field values in FIELDS order (CSV rows, SQL parameters)"""
+        return _values(self)
+
+    def to_labeled(self):
+        return dict(zip(LABELS.values(), _values(self)))
+
+
+def to_job(record):
+    return record if isinstance(record, Job) else Job.from_record(record)
+
+
+class JobBatch:
+    """Jobs stored column by column; iterating yields Job records"""
+
+    __slots__ = ("columns",)
+
+    def __init__(self, jobs=()):
+        self.columns = {field: [] for field in FIELDS}
+        self.extend(jobs)
+
+    def append(self, job):
+        for column, value in zip(self.columns.values(), _values(to_job(job))):
+            column.append(value)
+
+    def extend(self, jobs):
+        for job in jobs:
+            self.append(job)
+
+    def __len__(self):
+        return len(self.columns["job_id"])
+
+    def __iter__(self):
+        return (Job(*row) for row in zip(*self.columns.values()))
+
+    def to_frame(self, labels=True):
+        """DataFrame with 'Job Title'-style columns (field names with labels=False)"""
+        import pandas as pd
+
+        data = {(LABELS[field] if labels else field): values for field, values in self.columns.items()}
+        job_id = LABELS["job_id"] if labels else "job_id"
+        data[job_id] = pd.array(data[job_id], dtype="Int64")
+        return pd.DataFrame(data)
+
+    def to_arrow(self):
+        """pyarrow Table with field-name columns (requires pyarrow)"""
+        import pyarrow as pa
+
+        types = {field: pa.string() for field in FIELDS}
+        types["job_id"] = pa.int64()
+        return pa.table({field: pa.array(values, type=types[field]) for field, values in self.columns.items()})
+
+    @classmethod
+    def from_frame(cls, df):
+        """Batch from a DataFrame with 'Job Title'-style or field-name columns"""
+        batch = cls()
+        columns = {_KEY_ALIASES[column]: column for column in df.columns if column in _KEY_ALIASES}
+        rows = len(df)
+        for field in FIELDS:
+            if field in columns:
+                values = df[columns[field]].astype(object).where(df[columns[field]].notna(), None).tolist()
+            else:
+                values = [None] * rows if field in ("job_id", "search_keywords", "search_location") else ["N/A"] * rows
+            batch.columns[field] = values
+        batch.columns["job_id"] = [parse_job_id(job_id) or parse_job_id(link)
+                                   for job_id, link in zip(batch.columns["job_id"], batch.columns["link"])]
+        return batch
+
+
+def as_frame(records):
+    """Labeled DataFrame from a JobBatch, Job records or older record dicts"""
+    return (records if isinstance(records, JobBatch) else JobBatch(records)).to_frame()
@@ -0,0 +1,149 @@
+"""
+"Lean load" browser profile: skip the resources the job extractor never reads
+
+Results pages normally download every company logo, profile photo, web font,
+autoplay video and analytics beacon. With lean loading these requests are
+blocked through the DevTools Network domain (Network.setBlockedURLs via
+execute_cdp_cmd), the page load strategy is "eager" (return at DOMContentLoaded
+instead of waiting for every subresource), and the number of blocked requests
+is read back from Chrome's performance log and reported per page.
+"""
+
+import json
+import os
+from collections import Counter
+
+# Matched by Chrome against the full request URL ('*' is a wildcard)
+BLOCKED_URL_PATTERNS = [
+    # Images (LinkedIn serves logos and photos from media.licdn.com). Not .ico: session_store
+    # restores cookies from the linkedin.com favicon, which must still load
+    "*media.licdn.com/dms/image*",
+    "*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.svg*",
+    # Fonts
+    "*.woff*", "*.ttf*", "*.otf*", "*.eot*",
+    # Media
+    "*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*", "*dms.licdn.com/playlist*",
+    # Analytics and ad trackers
+    "*px.ads.linkedin.com*",
+    "*linkedin.com/li/track*",
+    "*linkedin.com/platform-telemetry*",
+    "*snap.licdn.com*",
+    "*doubleclick.net*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*bat.bing.com*",
+    "*connect.facebook.net*",
+]
+
+# Resource types reported separately; everything else blocked counts as a tracker
+REPORTED_TYPES = {"Image": "images", "Font": "fonts", "Media": "media"}
+
+
+def lean_load_enabled():
+    """LEAN_LOAD=false in .env turns the lean profile off (it is on by default)"""
+    return os.getenv("LEAN_LOAD", "true").lower() == "true"
+
+
+def apply_lean_options(chrome_options):
+    """Eager page loads plus the performance log used to count blocked requests"""
+    chrome_options.page_load_strategy = "eager"
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return chrome_options
+
+
+def enable_request_blocking(driver, patterns=BLOCKED_URL_PATTERNS):
+    """Block the lean-load URL patterns in the current tab (call again for every new tab)"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        return True
+    except Exception as e:
+        print(f"⚠️ Warning: Could not enable request blocking: {e}")
+        return False
+
+
+def summarize_network_log(entries):
+    """Count requests, received bytes and blocked requests per tab from performance log entries.
+
+    Returns {tab handle: {"requests": int, "bytes": int, "blocked": Counter}}. ChromeDriver
+    window handles are the DevTools target ids reported as "webview" in each entry.
+    """
+    pages = {}
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        event = message.get("message", {})
+        method = event.get("method")
+        params = event.get("params", {})
+        page = pages.setdefault(message.get("webview"), {"requests": 0, "bytes": 0, "blocked": Counter()})
+
+        if method == "Network.requestWillBeSent":
+            page["requests"] += 1
+        elif method == "Network.loadingFinished":
+            page["bytes"] += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            page["blocked"][REPORTED_TYPES.get(params.get("type"), "trackers")] += 1
+    return pages
+
+
+class LeanLoad:
+    """Applies request blocking to tabs and reports what was blocked on each page"""
+
+    def __init__(self, patterns=BLOCKED_URL_PATTERNS):
+        self.patterns = list(patterns)
+        self.totals = Counter()
+        self.pages_reported = 0
+        self._pending = {}
+
+    def setup_tab(self, driver):
+        """Enable blocking in the driver's current tab"""
+        return enable_request_blocking(driver, self.patterns)
+
+    def _drain(self, driver):
+        try:
+            self.ingest(driver.get_log("performance"))
+        except Exception:
+            return
+
+    def ingest(self, entries):
+        """Add performance log entries read by another consumer (get_log drains the log)"""
+        for handle, page in summarize_network_log(entries).items():
+            pending = self._pending.setdefault(handle, {"requests": 0, "bytes": 0, "blocked": Counter()})
+            pending["requests"] += page["requests"]
+            pending["bytes"] += page["bytes"]
+            pending["blocked"].update(page["blocked"])
+
+    def reset(self, driver):
+        """Discard counts gathered so far (e.g. login traffic) before the next page loads"""
+        self._drain(driver)
+        self._pending.clear()
+
+    def page_report(self, driver, label):
+        """Print and return the network counts for the current tab since its last report"""
+        self._drain(driver)
+        page = self._pending.pop(driver.current_window_handle, None)
+        if page is None:
+            return None
+
+        blocked = page["blocked"]
+        self.pages_reported += 1
+        self.totals.update(blocked)
+        self.totals["requests"] += page["requests"]
+        self.totals["bytes"] += page["bytes"]
+
+        detail = ", ".join(f"{kind} {count}" for kind, count in blocked.most_common())
+        print(f"🚫 {label}: blocked {sum(blocked.values())} of {page['requests']} requests"
+              f"{f' ({detail})' if detail else ''}, {page['bytes'] / 1024:.0f} KB received")
+        return page
+
+    def summary(self):
+        """Totals over every reported page"""
+        blocked = sum(v for k, v in self.totals.items() if k not in ("requests", "bytes"))
+        return {
+            "pages": self.pages_reported,
+            "requests": self.totals["requests"],
+            "blocked": blocked,
+            "kb_received": round(self.totals["bytes"] / 1024, 1),
+        }
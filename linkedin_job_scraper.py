@@ -1,5 +1,4 @@
 import time
-import pandas as pd
 import matplotlib.pyplot as plt
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -11,6 +10,9 @@ from collections import Counter
 import getpass
 import os
 
+from job_ids import parse_job_id
+from job_record import Job, JobBatch
+
 def setup_driver():
     """Set up Chrome WebDriver with options"""
     chrome_options = Options()
@@ -140,13 +142,8 @@ def extract_job_data(driver):
             if link != "N/A":
                 link = f"https://www.linkedin.com{link}"
             
-            jobs_data.append({
-                'Job Title': title,
-                'Company': company,
-                'Location': location,
-                'Post Date': post_date,
-                'Link': link
-            })
+            job_id = parse_job_id(card.get('data-job-id')) or parse_job_id(link)
+            jobs_data.append(Job(job_id, title, company, location, post_date, link))
         except Exception as e:
             print(f"Error extracting job data: {e}")
             continue
@@ -161,7 +158,7 @@ def save_to_csv(data, filename='linkedin_jobs.csv'):
         return
     
     # Convert to DataFrame
-    df = pd.DataFrame(data)
+    df = JobBatch(data).to_frame()
     
     # Remove duplicates based on job title and company
     df_cleaned = df.drop_duplicates(subset=['Job Title', 'Company'], keep='first')
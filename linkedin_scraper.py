@@ -1,6 +1,3 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -14,31 +11,16 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from pathlib import Path
 from dotenv import load_dotenv
-from webdriver_manager.chrome import ChromeDriverManager
+
+from driver_setup import create_driver
 
 # Configuration
 PROJECT_DIR = Path(__file__).parent
 load_dotenv(PROJECT_DIR / ".env")
 
 def get_driver():
-    chrome_options = Options()
-    chrome_options.add_experimental_option("detach", True)
-    chrome_options.add_argument("--window-size=1280,800")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option("useAutomationExtension", False)
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    
-    try:
-        S = Service('./chromedriver.exe')
-        driver = webdriver.Chrome(service=S, options=chrome_options)
-        print("WebDriver initialized (local driver).")
-    except Exception:
-        S = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=S, options=chrome_options)
-        print("WebDriver initialized (webdriver-manager).")
-    
-    driver.set_page_load_timeout(30)
+    driver = create_driver(detach=True)
+    print("WebDriver initialized.")
     return driver
 
 def linkedin_login(driver, email, password):
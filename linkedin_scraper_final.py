@@ -1,61 +1,20 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
 import time
-import pandas as pd
 from datetime import datetime
 import os
 
-def create_driver():
-    """Create and configure the Chrome WebDriver"""
-    chrome_options = Options()
-    chrome_options.add_experimental_option("detach", True)  # Keep window open after script ends
-    chrome_options.add_argument("--window-size=1920,1080")
-    
-    # Anti-Detection Flags
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
-    chrome_options.add_experimental_option("useAutomationExtension", False)
+import driver_setup
+from database_storage import drop_duplicate_jobs
+from job_card_extractor import extract_job_cards, stream_job_cards
+from job_record import Job, JobBatch
+from scroll_wait import AdaptiveScrollWait
+from snapshot_store import SnapshotStore, snapshots_enabled
 
-    # Stability Flags
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-infobars")
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--disable-default-apps")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--lang=en-US")
-    
-    # User Agent
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
-    print("🔧 Installing/finding ChromeDriver...")
-    
-    # Auto-install ChromeDriver
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    driver.set_page_load_timeout(30)
-    
-    # Execute CDP commands to mask automation
-    try:
-        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-            "source": """
-                Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                window.chrome = {runtime: {}};
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en']
-                });
-            """
-        })
-    except Exception as e:
-        print(f"⚠️ Warning: Could not execute CDP command: {e}")
-    
-    return driver
+def create_driver():
+    """Create the shared Chrome WebDriver, kept open after the script ends"""
+    return driver_setup.create_driver(detach=True)
 
 def check_and_wait_for_login(driver):
     """Check if logged in, if not wait for manual login"""
@@ -151,17 +110,15 @@ def scroll_job_results(driver, max_scrolls=5):
         scroll_count = 0
         consecutive_same_height = 0
         max_consecutive_same = 3
+        waiter = AdaptiveScrollWait.from_env()
         
         while scroll_count < max_scrolls and consecutive_same_height < max_consecutive_same:
-            # Scroll to bottom of results pane
-            driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", results_pane)
-            print(f"⬇️ Scroll #{scroll_count + 1} completed")
-            
-            # Wait for new content to load (increased time)
-            time.sleep(4)
+            # Scroll to bottom and wait only until new content renders (or the timeout hits)
+            outcome = waiter.scroll_and_wait(driver, results_pane)
+            print(f"⬇️ Scroll #{scroll_count + 1} completed in {outcome['total_ms'] / 1000:.1f}s")
             
             # Check new scroll height
-            new_height = driver.execute_script("return arguments[0].scrollHeight", results_pane)
+            new_height = outcome["height"]
             print(f"📊 New scroll height: {new_height}")
             
             # If height didn't change, increment counter
@@ -175,6 +132,7 @@ def scroll_job_results(driver, max_scrolls=5):
             scroll_count += 1
             
         print(f"✅ Completed {scroll_count} scroll operations")
+        print(f"⏱️ Scroll waits: {waiter.summary()}")
         return True
         
     except Exception as e:
@@ -183,138 +141,65 @@ def scroll_job_results(driver, max_scrolls=5):
         traceback.print_exc()
         return False
 
-def extract_job_data(driver):
+def extract_job_data(driver, mode="js"):
     """Extract job data using multiple strategies"""
     print("🔍 Extracting job data with multiple strategies...")
     
     # Wait a bit for content to settle
     time.sleep(2)
     
-    # Get page source after scrolling
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
-    
-    # Try multiple strategies to find job cards
-    job_cards = []
-    
-    # Strategy 1: Main job card container
-    cards = soup.find_all('div', class_='job-card-container')
-    if cards:
-        job_cards.extend(cards)
-        print(f"✅ Found {len(cards)} job cards with 'job-card-container'")
-    
-    # Strategy 2: List item approach
-    if not job_cards:
-        cards = soup.find_all('li', class_='jobs-search-results__list-item')
-        if cards:
-            job_cards.extend(cards)
-            print(f"✅ Found {len(cards)} job cards with 'jobs-search-results__list-item'")
-    
-    # Strategy 3: Data attribute approach
-    if not job_cards:
-        cards = soup.find_all('div', {'data-job-id': True})
-        if cards:
-            job_cards.extend(cards)
-            print(f"✅ Found {len(cards)} job cards with 'data-job-id'")
-    
-    # Strategy 4: Any job card link
-    if not job_cards:
-        cards = soup.find_all('a', class_='job-card-list__title')
-        if cards:
-            # Get parent containers
-            for card_link in cards:
-                parent = card_link.find_parent('div', class_='job-card-container')
-                if parent and parent not in job_cards:
-                    job_cards.append(parent)
-            print(f"✅ Found {len(job_cards)} job cards by parent search")
-    
-    print(f"📊 Total job cards found: {len(job_cards)}")
+    # Walk the job cards inside the page (falls back to BeautifulSoup over page_source)
+    cards = extract_job_cards(driver, mode=mode)
+    print(f"📊 Total job cards found: {len(cards)}")
     
-    if not job_cards:
-        # Print a portion of the page source for debugging
-        print("❌ No job cards found. Printing first 2000 chars of page source for debugging:")
-        print("="*50)
-        print(driver.page_source[:2000])
-        print("="*50)
+    if not cards:
+        # Keep the whole page for offline debugging (python snapshot_store.py replay)
+        digest = SnapshotStore().put(driver.page_source, url=driver.current_url, reason="no_cards")
+        print(f"❌ No job cards found. Page saved as snapshot {digest[:12]} for offline replay.")
         return []
     
     data = []
-    for i, card in enumerate(job_cards):
-        try:
-            # Multiple strategies for each data point
-            # Job Title
-            title_elem = (card.find('a', class_='job-card-list__title') or 
-                         card.find('h3', class_='base-search-card__title') or
-                         card.find('span', class_='sr-only') or
-                         card.find('a', {'data-tracking-control-name': 'public_jobs_jserp-result_search-card'}))
+    for i, card in enumerate(cards):
+        # Only add if we have a title
+        if card['title'] != 'N/A':
+            data.append(Job.from_card(card))
             
-            # Company Name
-            company_elem = (card.find('a', class_='job-card-container__company-name') or
-                           card.find('h4', class_='base-search-card__subtitle') or
-                           card.find('a', class_='hidden-nested-link') or
-                           card.find('span', class_='job-card-container__primary-description'))
-            
-            # Location
-            location_elem = (card.find('span', class_='job-card-container__metadata-item') or
-                            card.find('span', class_='job-search-card__location') or
-                            card.find('li', class_='job-card-container__metadata-item') or
-                            card.find('span', class_='job-card-container__workplace-type'))
-            
-            # Post Date
-            date_elem = card.find('time')
-            
-            # Job Link
-            link_elem = (card.find('a', class_='job-card-list__title') or
-                        card.find('a', class_='base-card__full-link') or
-                        card.find('a', href=lambda x: x and '/jobs/view/' in x))
-            
-            # Extract text with fallbacks
-            title = title_elem.get_text(strip=True) if title_elem else 'N/A'
-            company = company_elem.get_text(strip=True) if company_elem else 'N/A'
-            location = location_elem.get_text(strip=True) if location_elem else 'N/A'
-            post_date = date_elem.get('datetime', '') if date_elem and date_elem.get('datetime') else (date_elem.get_text(strip=True) if date_elem else 'N/A')
-            job_link = link_elem.get('href', 'N/A') if link_elem else 'N/A'
-            
-            # Clean up link
-            if job_link != 'N/A':
-                # Handle relative links
-                if job_link.startswith('/'):
-                    job_link = 'https://www.linkedin.com' + job_link
-                # Remove tracking parameters
-                if '?' in job_link:
-                    job_link = job_link.split('?')[0]
-            
-            # Only add if we have a title
-            if title != 'N/A':
-                data.append({
-                    'Job Title': title,
-                    'Company': company,
-                    'Location': location,
-                    'Post Date': post_date,
-                    'Link': job_link
-                })
-                
-                # Print first few extractions for debugging
-                if i < 3:
-                    print(f"   📋 Job {i+1}: {title} at {company}")
-            
-        except Exception as e:
-            print(f"⚠️ Error extracting job {i+1}: {e}")
-            continue
+            # Print first few extractions for debugging
+            if i < 3:
+                print(f"   📋 Job {i+1}: {card['title']} at {card['company']}")
     
     print(f"✅ Successfully extracted {len(data)} jobs")
     return data
 
+def stream_job_data(driver, max_scrolls=5, mode="js"):
+    """Scroll the results and yield job records as each scroll's new cards render"""
+    try:
+        results_pane = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-search-results-list"))
+        )
+    except Exception as e:
+        print(f"❌ Job results pane not found: {e}")
+        return
+    
+    waiter = AdaptiveScrollWait.from_env()
+    snapshots = SnapshotStore() if snapshots_enabled() else None
+    for card in stream_job_cards(driver, results_pane, max_scrolls, mode=mode, waiter=waiter, snapshots=snapshots):
+        # Only yield if we have a title
+        if card['title'] != 'N/A':
+            yield Job.from_card(card)
+    print(f"⏱️ Scroll waits: {waiter.summary()}")
+
 def save_data(data, filename_prefix="linkedin_jobs"):
     """Save data to CSV file"""
     if not data:
         print("❌ No data to save")
         return None
     
-    df = pd.DataFrame(data)
+    df = JobBatch(data).to_frame()
     print(f"📊 DataFrame created with {len(df)} rows")
     
-    # Remove duplicates based on job title and company
-    df_cleaned = df.drop_duplicates(subset=['Job Title', 'Company'], keep='first')
+    # Remove duplicates based on the LinkedIn job ID
+    df_cleaned = drop_duplicate_jobs(df)
     print(f"🧹 Removed {len(df) - len(df_cleaned)} duplicate entries")
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -354,14 +239,9 @@ def main():
         print("⏳ Waiting for initial content to load...")
         time.sleep(3)
         
-        # Scroll to load more jobs
-        if not scroll_job_results(driver, max_scrolls=6):
-            print("❌ Scrolling failed")
-            return
-        
-        # Extract job data
+        # Scroll to load more jobs, extracting only the newly appended cards after each scroll
         print("🔍 Extracting job data...")
-        job_data = extract_job_data(driver)
+        job_data = list(stream_job_data(driver, max_scrolls=6))
         
         if job_data:
             filename = save_data(job_data)
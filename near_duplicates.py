@@ -0,0 +1,186 @@
+"""
+Near-duplicate (repost) detection with MinHash + LSH
+
+Recruiters repost a role under a new job ID with a slightly edited title, so
+exact job-ID dedup keeps both. Each job gets a MinHash signature over the
+character 3-grams and words of its normalized title; the signature is split
+into LSH bands whose bucket keys also hash the normalized company, city and
+seniority words (a repost is the same level at the same company and place).
+Buckets are stored in SQLite (lsh_buckets, keyed by band and bucket), so
+finding repost candidates for a new job is one indexed probe per band, all
+bands in a single query, no matter how many jobs are stored. A job whose best
+candidate is similar enough joins that job's cluster; otherwise it starts its
+own (cluster_id = its job ID).
+
+    python near_duplicates.py report --db linkedin_jobs.db
+"""
+
+import argparse
+import hashlib
+import re
+
+import numpy as np
+
+NUM_PERM = 64
+BANDS = 16  # 16 bands x 4 rows: >99% of pairs at 0.75 Jaccard share a bucket
+SIMILARITY_THRESHOLD = 0.75
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_PERMUTATIONS = np.random.RandomState(1).randint(1, (1 << 61) - 1, size=(2, NUM_PERM), dtype=np.uint64)
+
+# Words that recruiters add or drop between reposts of the same role
+_NOISE_WORDS = {"urgent", "urgently", "hiring", "new", "remote", "hybrid", "onsite", "on", "site",
+                "immediate", "start", "f", "m", "d", "w", "x"}
+_SENIORITY_WORDS = {"intern", "junior", "associate", "mid", "senior", "staff", "principal", "lead", "head",
+                    "director", "vp", "chief"}
+_AREA_WORDS = {"greater", "metropolitan", "metro", "area", "bay", "city", "region"}
+_ABBREVIATIONS = {"sr": "senior", "jr": "junior", "eng": "engineer", "engr": "engineer", "mgr": "manager",
+                  "dev": "developer", "swe": "software engineer", "ml": "machine learning", "ii": "2", "iii": "3"}
+
+
+def normalize_title(title):
+    words = re.sub(r"[^a-z0-9]+", " ", (title or "").lower()).split()
+    words = [_ABBREVIATIONS.get(word, word) for word in words if word not in _NOISE_WORDS]
+    return " ".join(words)
+
+
+def normalize_company(company):
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", (company or "").lower()).split())
+
+
+def normalize_city(location):
+    """'San Francisco, CA' and 'San Francisco Bay Area' both become 'san francisco'"""
+    words = re.sub(r"[^a-z0-9]+", " ", (location or "").split(",")[0].lower()).split()
+    return " ".join(word for word in words if word not in _AREA_WORDS)
+
+
+def shingles(title):
+    """Feature set of a title: character 3-grams and words of its normalized form"""
+    title = normalize_title(title)
+    features = {"t:" + title[i:i + 3] for i in range(max(1, len(title) - 2))}
+    features.update("w:" + word for word in title.split())
+    return features
+
+
+def minhash(features):
+    """MinHash signature (NUM_PERM uint32 values) of a feature set"""
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(f.encode(), digest_size=4).digest(), "little") for f in features),
+        dtype=np.uint64, count=len(features))
+    a, b = _PERMUTATIONS
+    permuted = (np.outer(hashes, a) + b) % _MERSENNE_PRIME & _MAX_HASH
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+# All LSH bands probed in one statement
+_PROBE_SQL = ("SELECT lsh_buckets.job_id FROM (VALUES " + ", ".join(["(?, ?)"] * BANDS) + ") AS probe "
+              "CROSS JOIN lsh_buckets ON lsh_buckets.band = probe.column1 AND lsh_buckets.bucket = probe.column2")
+
+
+def band_buckets(signature, company, location, title):
+    """One signed 64-bit bucket key per LSH band, scoped to the company, city and seniority"""
+    rows = len(signature) // BANDS
+    seniority = " ".join(sorted(_SENIORITY_WORDS.intersection(normalize_title(title).split())))
+    scope = f"{normalize_company(company)}|{normalize_city(location)}|{seniority}".encode()
+    return [int.from_bytes(hashlib.blake2b(scope + signature[i * rows:(i + 1) * rows].tobytes(),
+                                           digest_size=8).digest(), "little", signed=True)
+            for i in range(BANDS)]
+
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures"""
+    return float(np.mean(sig_a == sig_b))
+
+
+class NearDuplicateIndex:
+    """Incremental MinHash-LSH index living next to the jobs table"""
+
+    def __init__(self, conn, threshold=SIMILARITY_THRESHOLD):
+        self.conn = conn
+        self.threshold = threshold
+
+    def create_tables(self):
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS job_minhash (
+                job_id INTEGER PRIMARY KEY,
+                signature BLOB NOT NULL,
+                cluster_id INTEGER NOT NULL
+            )
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS lsh_buckets (
+                band INTEGER,
+                bucket INTEGER,
+                job_id INTEGER,
+                PRIMARY KEY (band, bucket, job_id)
+            ) WITHOUT ROWID
+        ''')
+
+    def candidates(self, signature, company, location, title, exclude=None):
+        """Jobs at the same company, city and level sharing at least one LSH bucket with the signature"""
+        return self._probe(band_buckets(signature, company, location, title), exclude)
+
+    def _probe(self, buckets, exclude=None):
+        # One primary-key search per (band, bucket) row of the probe
+        found = {job_id for (job_id,) in self.conn.execute(_PROBE_SQL, [v for pair in enumerate(buckets) for v in pair])}
+        found.discard(exclude)
+        return found
+
+    def match(self, signature, company, location, title, exclude=None, buckets=None):
+        """(cluster_id, similarity) of the most similar stored job above the threshold, else (None, 0.0)"""
+        best = (None, 0.0)
+        if buckets is None:
+            buckets = band_buckets(signature, company, location, title)
+        for job_id in self._probe(buckets, exclude):
+            row = self.conn.execute(
+                "SELECT signature, cluster_id FROM job_minhash WHERE job_id = ?", (job_id,)).fetchone()
+            score = similarity(signature, np.frombuffer(row[0], dtype=np.uint32))
+            if score >= self.threshold and score > best[1]:
+                best = (row[1], score)
+        return best
+
+    def add(self, job_id, title, company, location):
+        """Index one job and return its cluster ID (its own job ID if it is not a repost)"""
+        signature = minhash(shingles(title))
+        buckets = band_buckets(signature, company, location, title)
+        cluster_id, _ = self.match(signature, company, location, title, exclude=job_id, buckets=buckets)
+        cluster_id = cluster_id or job_id
+        self.conn.execute("INSERT OR REPLACE INTO job_minhash (job_id, signature, cluster_id) VALUES (?, ?, ?)",
+                          (job_id, signature.tobytes(), cluster_id))
+        self.conn.executemany("INSERT OR IGNORE INTO lsh_buckets (band, bucket, job_id) VALUES (?, ?, ?)",
+                              [(band, bucket, job_id) for band, bucket in enumerate(buckets)])
+        return cluster_id
+
+
+def report(db_name, limit=20):
+    """Print the largest repost clusters"""
+    from database_storage import connect
+
+    conn = connect(db_name)
+    try:
+        clusters = conn.execute('''
+            SELECT cluster_id, COUNT(*) AS jobs, MIN(job_title), MIN(company)
+            FROM jobs WHERE cluster_id IS NOT NULL
+            GROUP BY cluster_id HAVING COUNT(*) > 1
+            ORDER BY jobs DESC LIMIT ?
+        ''', (limit,)).fetchall()
+    finally:
+        conn.close()
+    if not clusters:
+        print("✅ No reposted jobs found")
+    for cluster_id, jobs, title, company in clusters:
+        print(f"🔁 {jobs} postings of '{title}' at {company} (cluster {cluster_id})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["report"])
+    parser.add_argument("--db", default="linkedin_jobs.db")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    report(args.db, args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Network capture mode: read job data from LinkedIn's JSON API responses
+
+When logged in, the results pane is filled from Voyager API responses
+(voyagerJobsDashJobCards / graphql) that already carry structured job cards.
+This mode reads those responses from Chrome's performance log, fetches each
+body with the DevTools Network.getResponseBody command and decodes it straight
+into job records, so no HTML is parsed and CSS class changes don't matter.
+Guest pages are rendered server-side, so callers fall back to DOM extraction
+when nothing is captured.
+"""
+
+import base64
+import json
+from datetime import datetime, timezone
+
+from job_card_extractor import normalize_card
+
+# URL fragments of the job-search API calls that carry job cards
+JOB_API_MARKERS = (
+    "voyagerJobsDashJobCards",
+    "voyagerJobsDashJobPostingCards",
+    "voyagerJobsDashJobPostings",
+    "/voyager/api/search/hits",
+)
+
+JOB_CARD_TYPES = (
+    "com.linkedin.voyager.dash.jobs.JobPostingCard",
+    "com.linkedin.voyager.jobs.JobPostingCard",
+)
+JOB_POSTING_TYPES = (
+    "com.linkedin.voyager.dash.jobs.JobPosting",
+    "com.linkedin.voyager.jobs.JobPosting",
+)
+
+
+def enable_performance_log(chrome_options):
+    """Network events are read from ChromeDriver's performance log"""
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return chrome_options
+
+
+def is_job_api_url(url):
+    return "/voyager/api/" in url and any(marker in url for marker in JOB_API_MARKERS)
+
+
+def _text(value):
+    """Voyager text fields are either plain strings or {"text": ...} view models"""
+    if isinstance(value, dict):
+        value = value.get("text")
+    return " ".join(value.split()) if isinstance(value, str) else None
+
+
+def _listed_date(card):
+    for item in card.get("footerItems") or []:
+        if item.get("type") == "LISTED_DATE" and item.get("timeAt"):
+            return datetime.fromtimestamp(item["timeAt"] / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
+    listed_at = card.get("listedAt")
+    if listed_at:
+        return datetime.fromtimestamp(listed_at / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
+    return None
+
+
+def _entities(payload):
+    """Yield every dict in a (possibly nested) Voyager response"""
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            yield node
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def decode_job_cards(payload):
+    """Decode one Voyager job-search response into normalized cards, in response order"""
+    if isinstance(payload, (str, bytes)):
+        payload = json.loads(payload)
+
+    cards = []
+    postings = {}
+    for entity in _entities(payload):
+        entity_type = entity.get("$type")
+        if entity_type in JOB_CARD_TYPES:
+            cards.append(entity)
+        elif entity_type in JOB_POSTING_TYPES:
+            postings[entity.get("entityUrn")] = entity
+
+    records = []
+    for card in cards:
+        # Cards reference the full posting, which may carry the title or listing date
+        posting = postings.get(card.get("*jobPosting") or card.get("jobPostingUrn"), {})
+        records.append(normalize_card({
+            "job_id": card.get("jobPostingUrn") or card.get("*jobPosting") or card.get("entityUrn"),
+            "title": _text(card.get("jobPostingTitle")) or _text(card.get("title")) or _text(posting.get("title")),
+            "company": _text(card.get("primaryDescription")) or _text(card.get("companyName")),
+            "location": _text(card.get("secondaryDescription")) or _text(card.get("formattedLocation")),
+            "post_date": _listed_date(card) or _listed_date(posting),
+        }))
+    return records
+
+
+class NetworkCapture:
+    """Collects job cards from the job-search API responses seen by the current tab"""
+
+    def __init__(self, driver, lean_load=None):
+        self.driver = driver
+        self.lean_load = lean_load  # Receives the same performance log entries
+        self.responses = 0
+        self._pending = {}  # requestId -> URL of job API responses still loading
+        self._seen_job_ids = set()
+
+    def start(self):
+        """Enable the Network domain so response bodies stay retrievable"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            return True
+        except Exception as e:
+            print(f"⚠️ Warning: Could not enable network capture: {e}")
+            return False
+
+    def _response_body(self, request_id):
+        result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        body = result.get("body", "")
+        if result.get("base64Encoded"):
+            body = base64.b64decode(body).decode("utf-8")
+        return body
+
+    def collect(self):
+        """Return cards from job API responses finished since the last call (new job IDs only)"""
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            print(f"⚠️ Performance log unavailable: {e}")
+            return []
+        if self.lean_load:
+            self.lean_load.ingest(entries)
+
+        cards = []
+        for entry in entries:
+            try:
+                event = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            method, params = event.get("method"), event.get("params", {})
+
+            if method == "Network.responseReceived":
+                url = params.get("response", {}).get("url", "")
+                if is_job_api_url(url):
+                    self._pending[params.get("requestId")] = url
+            elif method == "Network.loadingFinished" and params.get("requestId") in self._pending:
+                url = self._pending.pop(params["requestId"])
+                try:
+                    decoded = decode_job_cards(self._response_body(params["requestId"]))
+                except Exception as e:
+                    print(f"⚠️ Could not decode job API response {url[:80]}: {e}")
+                    continue
+                self.responses += 1
+                for card in decoded:
+                    if card["job_id"] and card["job_id"] not in self._seen_job_ids:
+                        self._seen_job_ids.add(card["job_id"])
+                        cards.append(card)
+        return cards
+
+
+def stream_captured_cards(driver, results_pane, capture, max_scrolls=5, waiter=None, cutoff=None):
+    """Scroll the results pane and yield job cards decoded from the API responses each scroll triggers.
+
+    Same contract as job_card_extractor.stream_job_cards, without touching the DOM.
+    """
+    def next_batch():
+        cards = capture.collect()
+        return cutoff.filter(cards) if cutoff else cards
+
+    yield from next_batch()
+
+    timeouts_in_a_row = 0
+    for scroll in range(max_scrolls):
+        if cutoff and cutoff.reached:
+            print(f"⏹️ Reached {cutoff.consecutive_seen} already-stored jobs in a row, stopping early.")
+            return
+        if waiter:
+            outcome = waiter.scroll_and_wait(driver, results_pane)
+            timeouts_in_a_row = timeouts_in_a_row + 1 if outcome["timed_out"] else 0
+        else:
+            driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", results_pane)
+        cards = next_batch()
+        print(f"Scrolled {scroll + 1} times... {len(cards)} new cards from {capture.responses} API responses")
+        yield from cards
+
+        if timeouts_in_a_row >= 2:
+            print("Reached the end of job listings.")
+            return
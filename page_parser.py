@@ -0,0 +1,121 @@
+"""
+Shared HTML parser layer for the BeautifulSoup extraction paths
+
+A LinkedIn results page is several hundred KB of markup, but the extractors only
+read the job cards. parse_results_html() parses with lxml (C) instead of
+html.parser (pure Python) and, through a parse-only filter built from the card
+selectors, only builds BeautifulSoup objects for the card subtrees. Every
+parse is timed and its tree size recorded, so the speedup over a full
+html.parser tree can be measured per page.
+"""
+
+import re
+import statistics
+import time
+from collections import deque
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from bs4.filter import ElementFilter  # bs4 >= 4.13 parse-only API
+except ImportError:
+    ElementFilter = None
+
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = "lxml"
+except ImportError:  # Slower, but keeps working without lxml
+    DEFAULT_PARSER = "html.parser"
+
+_SIMPLE_SELECTOR = re.compile(r"^(\w+)(?:\.([\w-]+)|\[([\w-]+)\])$")
+
+
+def card_root_rules(selectors):
+    """Turn "tag.class" / "tag[attr]" card selectors into (tag, class, attr) rules"""
+    rules = []
+    for selector in selectors:
+        match = _SIMPLE_SELECTOR.match(selector)
+        if not match:
+            raise ValueError(f"Card selector too complex for the parse-only filter: {selector}")
+        rules.append(match.groups())
+    return rules
+
+
+def _is_card_root(name, attrs, rules):
+    for tag, css_class, attr in rules:
+        if name != tag:
+            continue
+        if attr and attr in attrs:
+            return True
+        if css_class:
+            classes = attrs.get("class") or ()
+            if isinstance(classes, str):
+                classes = classes.split()
+            if css_class in classes:
+                return True
+    return False
+
+
+def card_strainer(selectors):
+    """Parse-only filter that keeps the outermost job-card elements and everything inside them.
+
+    Returns None (parse the whole page) if a card selector is too complex for the filter.
+    """
+    try:
+        rules = card_root_rules(selectors)
+    except ValueError as e:
+        print(f"⚠️ {e}; parsing whole pages instead.")
+        return None
+    if ElementFilter is not None:
+        class CardRootFilter(ElementFilter):
+            def allow_tag_creation(self, nsprefix, name, attrs):
+                return _is_card_root(name, attrs or {}, rules)
+
+            def allow_string_creation(self, string):
+                return False
+
+        return CardRootFilter()
+    return SoupStrainer(lambda name, attrs: _is_card_root(name, dict(attrs or {}), rules))
+
+
+class ParseStats:
+    """Parse time and tree size for the most recently parsed pages"""
+
+    def __init__(self, keep=1000):
+        self.pages = deque(maxlen=keep)
+
+    def record(self, parser, restricted, html_bytes, parse_ms, nodes):
+        page = {"parser": parser, "restricted": restricted, "html_kb": round(html_bytes / 1024, 1),
+                "parse_ms": round(parse_ms, 2), "nodes": nodes}
+        self.pages.append(page)
+        return page
+
+    def summary(self):
+        if not self.pages:
+            return {"pages": 0}
+        return {
+            "pages": len(self.pages),
+            "parse_ms_mean": round(statistics.mean(p["parse_ms"] for p in self.pages), 2),
+            "parse_ms_max": round(max(p["parse_ms"] for p in self.pages), 2),
+            "nodes_mean": round(statistics.mean(p["nodes"] for p in self.pages)),
+        }
+
+    def reset(self):
+        self.pages.clear()
+
+
+# Process-wide stats, read by benchmarks and scrapers
+parse_stats = ParseStats()
+
+
+def parse_results_html(html, strainer=None, parser=None, stats=parse_stats):
+    """Parse a results page into BeautifulSoup, keeping only the subtrees the strainer allows"""
+    parser = parser or DEFAULT_PARSER
+    started = time.perf_counter()
+    soup = BeautifulSoup(html, parser, parse_only=strainer)
+    parse_ms = (time.perf_counter() - started) * 1000
+
+    if stats is not None:
+        html_bytes = len(html.encode("utf-8")) if isinstance(html, str) else len(html)
+        stats.record(parser, strainer is not None, html_bytes, parse_ms, sum(1 for _ in soup.find_all(True)))
+    return soup
@@ -0,0 +1,137 @@
+"""
+Pagination-by-URL fetch mode for LinkedIn job search results
+
+Instead of scrolling one results pane with fixed sleeps, each results page is
+requested directly with &start=0,25,50,... and parsed on its own. Up to
+`concurrency` pages load at the same time in separate browser tabs, so scrape
+time depends on the number of pages rather than on sequential scroll waits.
+"""
+
+import time
+from urllib.parse import quote
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from job_card_extractor import CARD_SELECTORS, extract_job_cards
+
+SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+PAGE_SIZE = 25
+
+# True once the document has finished loading and either cards or the
+# "no results" banner are present
+PAGE_READY_JS = """
+if (document.readyState !== 'complete') return false;
+for (const sel of arguments[0]) {
+    if (document.querySelector(sel)) return true;
+}
+return !!document.querySelector('.jobs-search-no-results-banner, .jobs-search-two-pane__no-results-banner--expand');
+"""
+
+# Scroll the results pane to the bottom so lazily rendered (occluded) cards fill in
+RENDER_PAGE_JS = """
+const pane = document.querySelector('.jobs-search-results-list') || document.scrollingElement;
+pane.scrollTop = pane.scrollHeight;
+"""
+
+
+def build_search_url(keywords, location, start=0, sort_by_date=False):
+    """Build a job search URL for one results page"""
+    url = f"{SEARCH_URL}?keywords={quote(keywords)}&location={quote(location)}"
+    if sort_by_date:
+        url += "&sortBy=DD"
+    if start:
+        url += f"&start={start}"
+    return url
+
+
+def _open_page_tab(driver, url, lean_load=None):
+    """Open url in a new tab without waiting for it to load; returns the tab handle"""
+    driver.switch_to.new_window("tab")
+    if lean_load:
+        # Request blocking is per tab, so it must be set before the page starts loading
+        lean_load.setup_tab(driver)
+    # Assigning location from script returns immediately, so several tabs load at once
+    driver.execute_script("window.location.href = arguments[0];", url)
+    return driver.current_window_handle
+
+
+def _collect_page_tab(driver, handle, mode, page_timeout, render_pause, lean_load=None, label=""):
+    """Wait for a tab's results page, extract its cards and close the tab; None if it failed to load"""
+    driver.switch_to.window(handle)
+    try:
+        WebDriverWait(driver, page_timeout, poll_frequency=0.2).until(
+            lambda d: d.execute_script(PAGE_READY_JS, CARD_SELECTORS)
+        )
+        driver.execute_script(RENDER_PAGE_JS)
+        if render_pause:
+            time.sleep(render_pause)
+        cards = extract_job_cards(driver, mode=mode)
+        if lean_load:
+            lean_load.page_report(driver, label)
+        return cards
+    except Exception as e:
+        print(f"⚠️ Results page did not load: {e}")
+        return None
+    finally:
+        driver.close()
+
+
+def fetch_paginated_jobs(driver, keywords, location, max_pages=5, concurrency=3, mode="js",
+                         cutoff=None, sort_by_date=False, page_timeout=20, render_pause=1.0, lean_load=None,
+                         on_page=None):
+    """Fetch results pages by URL (&start=N) across browser tabs and yield their cards.
+
+    Pages are loaded in waves of `concurrency` tabs and yielded in page order. Fetching
+    stops at the first empty page, or once a KnownJobCutoff reports a run of stored jobs;
+    a page that fails to load (timeout, error) is skipped rather than taken as the end.
+    A LeanLoad enables request blocking in every new tab and reports it per page.
+    on_page() is called for every page loaded, including pages discarded after a stop.
+    """
+    origin_handle = driver.current_window_handle
+    open_tabs = []
+    page = 0
+    try:
+        while page < max_pages:
+            wave = range(page, min(page + concurrency, max_pages))
+            for page_index in wave:
+                url = build_search_url(keywords, location, page_index * PAGE_SIZE, sort_by_date)
+                open_tabs.append((page_index, _open_page_tab(driver, url, lean_load)))
+                if on_page:
+                    on_page()
+
+            stop = False
+            while open_tabs:
+                page_index, handle = open_tabs.pop(0)
+                if stop:
+                    # Pages past the end of results or the cutoff are discarded unread
+                    driver.switch_to.window(handle)
+                    driver.close()
+                    continue
+
+                cards = _collect_page_tab(driver, handle, mode, page_timeout, render_pause,
+                                          lean_load, f"Page {page_index + 1}")
+                if cards is None:
+                    print(f"⚠️ Page {page_index + 1} failed to load, skipping it")
+                    continue
+                print(f"📄 Page {page_index + 1}: {len(cards)} job cards")
+                if not cards:
+                    stop = True
+                    continue
+
+                if cutoff:
+                    cards = cutoff.filter(cards)
+                yield from cards
+
+                if cutoff and cutoff.reached:
+                    print(f"⏹️ Reached {cutoff.consecutive_seen} already-stored jobs in a row, stopping early.")
+                    stop = True
+
+            if stop:
+                return
+            page += concurrency
+    finally:
+        # Close tabs left open if the caller stopped consuming mid-wave
+        for _, handle in open_tabs:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(origin_handle)
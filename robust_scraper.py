@@ -1,18 +1,18 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from bs4 import BeautifulSoup
 import time
 import getpass
 import sys
 import os
 from pathlib import Path
 from dotenv import load_dotenv
-from webdriver_manager.chrome import ChromeDriverManager
+
+import driver_setup
+from job_card_extractor import extract_job_cards
+from job_record import Job
+from scroll_wait import AdaptiveScrollWait
 
 # --- Configuration ---
 PROJECT_DIR = Path(__file__).parent
@@ -35,44 +35,10 @@ def prompt_linkedin_credentials():
         return None, None
 
 def create_driver():
-    """Create and configure Chrome WebDriver with robust settings"""
+    """Create the shared Chrome WebDriver with robust timeouts"""
     try:
         print("🔧 Configuring Chrome WebDriver...")
-        
-        # Define Chrome Options for anti-detection and stability
-        chrome_options = Options()
-        chrome_options.add_experimental_option("detach", True) 
-        chrome_options.add_argument("--window-size=1280,800")
-        
-        # Essential anti-detection flags
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-
-        # Stability flags to handle connection issues
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-default-apps")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-background-timer-throttling")
-        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-        chrome_options.add_argument("--disable-renderer-backgrounding")
-        chrome_options.add_argument("--disable-background-networking")
-        
-        # User Agent
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
-        print("🔄 Attempting to auto-install/load ChromeDriver...")
-        
-        # Use webdriver_manager to get the perfect Service instance
-        service = Service(ChromeDriverManager().install())
-        service.log_path = "chromedriver.log"  # Enable logging
-        
-        # Create driver with increased timeout
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.set_page_load_timeout(60)  # Increase timeout
+        driver = driver_setup.create_driver(page_load_timeout=60, detach=True)
         driver.implicitly_wait(10)
         
         print("✅ WebDriver initialized successfully.")
@@ -195,8 +161,8 @@ def navigate_to_jobs(driver, keywords, location):
             return None
     return None
 
-def scroll_and_scrape_jobs(driver, max_scrolls=3):
-    """Scrolls through the job listings and extracts job data using BeautifulSoup."""
+def scroll_and_scrape_jobs(driver, max_scrolls=3, extraction="js"):
+    """Scrolls through the job listings and extracts job data (in-page JS, BeautifulSoup fallback)."""
     # Wait for job results to load
     wait = WebDriverWait(driver, 20)
     try:
@@ -212,15 +178,13 @@ def scroll_and_scrape_jobs(driver, max_scrolls=3):
 
     print("🔍 Starting to scroll and collect job data...")
     
+    waiter = AdaptiveScrollWait.from_env()
     while scrolls < max_scrolls:
-        # Scroll to the bottom of the job list container
-        driver.execute_script("arguments[0].scrollTo(0, arguments[0].scrollHeight);", job_list_container)
-        
-        # Wait for new jobs to load
-        time.sleep(5)  # Increased wait time
+        # Scroll to the bottom and wait until new jobs render (or the timeout hits)
+        outcome = waiter.scroll_and_wait(driver, job_list_container)
         
         # Check if we've reached the end of the scrollable area
-        new_height = driver.execute_script("return arguments[0].scrollHeight;", job_list_container)
+        new_height = outcome["height"]
         if new_height == last_height:
             print("Reached the end of job listings.")
             break
@@ -230,65 +194,15 @@ def scroll_and_scrape_jobs(driver, max_scrolls=3):
         
         print(f"Completed scroll {scrolls}/{max_scrolls}")
     
-    # After scrolling, extract job data
-    print("📄 Extracting job data with BeautifulSoup...")
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
-    
-    # Find job cards - LinkedIn's structure may vary, so we'll look for common classes
-    job_cards = soup.find_all('li', class_='jobs-search-results__list-item')
-    
-    if not job_cards:
-        # Try alternative selector
-        job_cards = soup.find_all('div', {'data-job-id': True})
-        
-    if not job_cards:
-        # Try another alternative selector
-        job_cards = soup.find_all('a', class_='base-card__full-link')
+    print(f"⏱️ Scroll waits: {waiter.summary()}")
     
+    # After scrolling, extract job data in one in-page script call
+    print("📄 Extracting job data...")
+    job_cards = extract_job_cards(driver, mode=extraction)
     print(f"Found {len(job_cards)} job cards.")
     
     for card in job_cards:
-        try:
-            # Extract job title
-            title_elem = card.find('h3', class_='base-search-card__title') or card.find('a', class_='job-card-list__title') or card.find('span', class_='sr-only')
-            title = title_elem.get_text(strip=True) if title_elem else "N/A"
-            
-            # Extract company name
-            company_elem = card.find('h4', class_='base-search-card__subtitle') or card.find('a', class_='job-card-container__company-name') or card.find('a', class_='hidden-nested-link')
-            company = company_elem.get_text(strip=True) if company_elem else "N/A"
-            
-            # Extract location
-            location_elem = card.find('span', class_='job-search-card__location') or card.find('span', class_='job-result-card__location')
-            location = location_elem.get_text(strip=True) if location_elem else "N/A"
-            
-            # Extract job link
-            link_elem = card.find('a', class_='base-card__full-link') or card.find('a', class_='job-card-list__title') or card
-            link = ""
-            if link_elem.has_attr('href'):
-                link = link_elem['href']
-            elif link_elem.name == 'a':
-                link = link_elem.get('href', '')
-            else:
-                # Look for href in parent elements
-                parent_link = link_elem.find_parent('a')
-                if parent_link and parent_link.has_attr('href'):
-                    link = parent_link['href']
-            
-            # If still no link, try to construct from job id
-            if not link or link == "N/A":
-                job_id = card.get('data-job-id') or card.get('data-entity-urn')
-                if job_id:
-                    link = f"https://www.linkedin.com/jobs/view/{job_id}"
-            
-            job_data.append({
-                'title': title,
-                'company': company,
-                'location': location,
-                'link': link if link else "N/A"
-            })
-        except Exception as e:
-            print(f"Error parsing job card: {e}")
-            continue
+        job_data.append(Job.from_card(card))
     
     return job_data
 
@@ -325,10 +239,10 @@ def main():
                 job_data = scroll_and_scrape_jobs(driver, max_scrolls=3)
                 print(f"\n📈 Extracted {len(job_data)} job listings:")
                 for i, job in enumerate(job_data[:10], 1):  # Show first 10 jobs
-                    print(f"\n{i}. {job['title']}")
-                    print(f"   Company: {job['company']}")
-                    print(f"   Location: {job['location']}")
-                    print(f"   Link: {job['link']}")
+                    print(f"\n{i}. {job.title}")
+                    print(f"   Company: {job.company}")
+                    print(f"   Location: {job.location}")
+                    print(f"   Link: {job.link}")
             
             # Pause for visibility before the script ends
             print(f"\n⏳ Keeping browser open for 30 seconds for inspection...")
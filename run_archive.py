@@ -0,0 +1,183 @@
+"""
+Date-partitioned Parquet archive of every scrape run
+
+Each run appends one Parquet file to a Hive-style dataset:
+
+    archive/date=2026-10-17/search=data_analyst_new_york/run-093012-1a2b3c4d.parquet
+
+with one row group per saved batch. The schema is compact: strings are
+dictionary-encoded (a run repeats the same companies, locations and search
+terms), and the link is only stored for jobs without an ID, since
+/jobs/view/<id> rebuilds it. Readers go through pyarrow.dataset, so a date
+range or search filter only opens the matching partition directories and only
+the requested columns are decoded. Needs pyarrow; without it the scrapers skip
+archiving.
+
+    python run_archive.py list
+    python run_archive.py show --since 2026-10-01 --search data_analyst_new_york
+"""
+
+import argparse
+import os
+import re
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # archiving is skipped without it
+    pa = ds = pq = None
+
+from job_ids import LINKEDIN_ROOT
+from job_record import LABELS, JobBatch
+
+ARCHIVE_DIR = Path(os.getenv("ARCHIVE_DIR", Path(__file__).parent / "archive"))
+STRING_COLUMNS = ("title", "company", "location", "post_date", "link", "search_keywords", "search_location")
+
+
+def archive_enabled():
+    """ARCHIVE_RUNS=false turns the run archive off; it is also off when pyarrow is missing"""
+    return pa is not None and os.getenv("ARCHIVE_RUNS", "true").lower() == "true"
+
+
+def search_slug(search_keywords, search_location):
+    """Partition value for a search: 'Data Analyst', 'New York' -> 'data_analyst_new_york'"""
+    slug = re.sub(r"[^a-z0-9]+", "_", f"{search_keywords or ''} {search_location or ''}".lower()).strip("_")
+    return slug or "all"
+
+
+def archived_partitions(root=ARCHIVE_DIR):
+    """Sorted (date, search) pairs present in the archive, from the directory names alone"""
+    root = Path(root)
+    return sorted((date_dir.name.split("=", 1)[1], search_dir.name.split("=", 1)[1])
+                  for date_dir in root.glob("date=*") for search_dir in date_dir.glob("search=*"))
+
+
+def _schema():
+    text = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([("job_id", pa.int64()), *((column, text) for column in STRING_COLUMNS),
+                      ("run_at", pa.timestamp("s"))])
+
+
+def _partitioning():
+    return ds.partitioning(pa.schema([("date", pa.string()), ("search", pa.string())]), flavor="hive")
+
+
+class RunArchive:
+    """One run's file in the archive; append() writes each batch as a row group"""
+
+    def __init__(self, search_keywords=None, search_location=None, root=ARCHIVE_DIR, run_at=None):
+        if pa is None:
+            raise RuntimeError("The run archive needs the pyarrow package (pip install pyarrow)")
+        self.search = (search_keywords, search_location)
+        self.run_at = (run_at or datetime.now()).replace(microsecond=0)
+        partition = Path(root) / f"date={self.run_at:%Y-%m-%d}" / f"search={search_slug(*self.search)}"
+        self.path = partition / f"run-{self.run_at:%H%M%S}-{uuid.uuid4().hex[:8]}.parquet"
+        # Dataset discovery ignores dot-files, so readers never see a run that is still being written
+        self._tmp = partition / ("." + self.path.name)
+        self._writer = None
+        self.rows = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def append(self, jobs):
+        batch = jobs if isinstance(jobs, JobBatch) else JobBatch(jobs)
+        if not len(batch):
+            return
+        schema = _schema()
+        job_ids = batch.columns["job_id"]
+        columns = {"job_id": pa.array(job_ids, type=pa.int64())}
+        for column in STRING_COLUMNS:
+            values = batch.columns[column]
+            if column == "link":
+                values = [None if job_id is not None else link for job_id, link in zip(job_ids, values)]
+            elif column in ("search_keywords", "search_location"):
+                search = self.search[column == "search_location"]
+                values = [value or search for value in values]
+            columns[column] = pa.array(values, type=pa.string()).dictionary_encode()
+        columns["run_at"] = pa.array([self.run_at] * len(batch), type=pa.timestamp("s"))
+
+        if self._writer is None:
+            self._tmp.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self._tmp, schema, compression="zstd")
+        self._writer.write_table(pa.Table.from_arrays(list(columns.values()), schema=schema))
+        self.rows += len(batch)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            os.replace(self._tmp, self.path)
+            self._writer = None
+
+
+def read_archive(root=ARCHIVE_DIR, columns=None, since=None, until=None, searches=None, labels=False):
+    """Archived jobs as a DataFrame, opening only the partitions and columns asked for.
+
+    since/until are inclusive 'YYYY-MM-DD' dates, searches a list of search
+    slugs or (keywords, location) pairs. columns are job_record field names
+    plus run_at, date and search; labels=True renames fields to 'Job Title'-style.
+    """
+    import pandas as pd
+
+    if pa is None:
+        raise RuntimeError("Reading the run archive needs the pyarrow package (pip install pyarrow)")
+    if not Path(root).exists():
+        return pd.DataFrame(columns=columns or [])
+
+    wanted = list(columns) if columns else None
+    read = None if wanted is None else list(dict.fromkeys(
+        wanted + (["job_id"] if "link" in wanted else [])))  # links are rebuilt from job IDs
+    conditions = []
+    if since:
+        conditions.append(ds.field("date") >= str(since))
+    if until:
+        conditions.append(ds.field("date") <= str(until))
+    if searches:
+        slugs = [search if isinstance(search, str) else search_slug(*search) for search in searches]
+        conditions.append(ds.field("search").isin(slugs))
+    condition = None
+    for expression in conditions:
+        condition = expression if condition is None else condition & expression
+
+    dataset = ds.dataset(str(root), format="parquet", partitioning=_partitioning())
+    # Int64 keeps job IDs integral when some are missing
+    df = dataset.to_table(columns=read, filter=condition).to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
+
+    if "link" in df.columns:
+        # Built from the string form of the Int64 IDs: map() would hand the lambda floats
+        rebuilt = f"{LINKEDIN_ROOT}/jobs/view/" + df["job_id"].astype("string")
+        df["link"] = df["link"].astype(object).where(df["link"].notna(), rebuilt.astype(object))
+    if wanted is not None:
+        df = df[wanted]
+    return df.rename(columns=LABELS) if labels else df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--root", default=ARCHIVE_DIR, help="archive directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list the archived dates and searches")
+    show = commands.add_parser("show", help="summarize archived jobs")
+    show.add_argument("--since", help="first date (YYYY-MM-DD)")
+    show.add_argument("--until", help="last date (YYYY-MM-DD)")
+    show.add_argument("--search", action="append", help="search slug (repeatable)")
+    args = parser.parse_args()
+
+    if args.command == "list":
+        for date, search in archived_partitions(args.root):
+            print(f"📦 {date}  {search}")
+        return
+    df = read_archive(args.root, ["job_id", "company", "date"], args.since, args.until, args.search)
+    print(f"📦 {len(df)} archived sightings of {df['job_id'].nunique()} jobs on {df['date'].nunique()} days")
+    print(df["company"].value_counts().head(10).to_string())
+
+
+if __name__ == "__main__":
+    main()
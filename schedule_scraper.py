@@ -5,8 +5,13 @@ Script to demonstrate scheduling the LinkedIn job scraper
 import subprocess
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from driver_pool import DriverPool
+from lean_load import LeanLoad, lean_load_enabled
+
 def run_scraper():
     """Run the LinkedIn job scraper"""
     try:
@@ -40,6 +45,71 @@ def run_scraper():
         print(f"Error running scraper: {e}")
         return False
 
+def run_searches_with_pool(pool, searches, fetch_mode="scroll", incremental=True):
+    """Run searches in-process on warm, logged-in drivers leased from the pool"""
+    from scraper_bot_refined import iter_paginated_jobs, iter_scraped_jobs, navigate_to_jobs, stream_and_save_jobs
+
+    def run_search(search):
+        keywords, location = search
+        with pool.lease() as lease:
+            driver = lease.driver
+            # Pooled drivers already block requests in their first tab; this reports it per page
+            lean_load = LeanLoad() if lean_load_enabled() else None
+            if lean_load:
+                lean_load.reset(driver)
+            if fetch_mode == "paginate":
+                # Every results tab counts towards the driver's recycle budget
+                records = iter_paginated_jobs(driver, keywords, location, incremental=incremental,
+                                              lean_load=lean_load, on_page=lease.record_page)
+            else:
+                if not navigate_to_jobs(driver, keywords, location, sort_by_date=incremental):
+                    return keywords, location, 0
+                lease.record_page()
+                records = iter_scraped_jobs(driver, keywords, location, incremental=incremental,
+                                            lean_load=lean_load)
+
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            slug = f"{keywords}_{location}".lower().replace(' ', '_')
+            saved, _ = stream_and_save_jobs(records, csv_filename=f"linkedin_jobs_{slug}_{timestamp}.csv",
+                                            search_keywords=keywords, search_location=location,
+                                            incremental=incremental)
+            return keywords, location, saved
+
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        return list(executor.map(run_search, searches))
+
+def run_schedule(searches, interval_minutes=60, runs=None, pool_size=1, fetch_mode="scroll"):
+    """Run searches every interval_minutes in this process, reusing the same browsers between runs"""
+    from scraper_bot_refined import linkedin_login, prompt_linkedin_credentials
+    from session_store import ensure_logged_in
+
+    def login(driver):
+        # Saved session first; credentials are only needed when it has expired
+        def form_login():
+            email, password = prompt_linkedin_credentials()
+            return bool(email and password) and linkedin_login(driver, email, password)
+
+        if not ensure_logged_in(driver, form_login):
+            raise RuntimeError("LinkedIn login failed")
+
+    with DriverPool(size=pool_size, warmup=login) as pool:
+        pool.prewarm()
+        run = 0
+        while runs is None or run < runs:
+            started = time.time()
+            print(f"\n⏰ Scheduled run {run + 1} started at {datetime.now()}")
+            for keywords, location, saved in run_searches_with_pool(pool, searches, fetch_mode):
+                print(f"   {keywords} in {location}: {saved} new jobs")
+
+            metrics = pool.metrics()
+            print(f"📊 Pool: {metrics['hits']} hits, {metrics['misses']} misses, "
+                  f"{metrics['recycled']} recycled, mean lease wait {metrics['mean_wait_sec']:.2f}s")
+
+            run += 1
+            if runs is None or run < runs:
+                time.sleep(max(0, interval_minutes * 60 - (time.time() - started)))
+    return True
+
 def create_windows_task():
     """Create a Windows Task Scheduler entry (Windows only)"""
     try:
@@ -92,6 +162,8 @@ if __name__ == "__main__":
     # Show scheduling instructions
     print("\nScheduling Options:")
     print("-" * 20)
+    print("In-process: run_schedule([('Data Analyst', 'New York City Metro Area')], interval_minutes=60)")
+    print("            keeps logged-in browsers warm between runs instead of starting a new process")
     print("Windows: Run create_windows_task() to generate a batch file")
     print("Mac/Linux: Add this line to your crontab (crontab -e):")
     print("0 9 * * * cd /path/to/web_scraper && python scraper_bot_refined.py")
\ No newline at end of file
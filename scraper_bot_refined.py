@@ -1,28 +1,54 @@
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from bs4 import BeautifulSoup
 import time
 import getpass
 import sys
 import os
-import random
 from pathlib import Path
 from dotenv import load_dotenv
-from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
 import matplotlib.pyplot as plt
 from datetime import datetime
 import collections
+import contextlib
+import csv
+
+from database_storage import JobStore, drop_duplicate_jobs, get_known_job_ids
+from driver_setup import create_driver
+from job_card_extractor import SELECTOR_PLAN, KnownJobCutoff, stream_job_cards
+from job_record import LABELS, Job, as_frame, to_job
+from lean_load import LeanLoad, lean_load_enabled
+from paginated_fetch import build_search_url, fetch_paginated_jobs
+from run_archive import RunArchive, archive_enabled
+from http_fetcher import GuestJobFetcher
+from page_parser import parse_stats
+from network_capture import NetworkCapture, stream_captured_cards
+from scroll_wait import AdaptiveScrollWait
+from snapshot_store import SnapshotStore, snapshots_enabled
+from selector_stats import LAYOUT_FINGERPRINT_JS, LAYOUT_MARKERS, probe_cascade, selector_stats
+from seen_set import SeenSet, cross_run_dedup_enabled, seen_jobs
+from session_store import ensure_logged_in
 
 # --- Configuration ---
 PROJECT_DIR = Path(__file__).parent
 load_dotenv(PROJECT_DIR / ".env")
 
+INCREMENTAL_CRAWL = os.getenv("INCREMENTAL_CRAWL", "false").lower() == "true"
+FETCH_MODE = os.getenv("FETCH_MODE", "scroll")  # "scroll" or "paginate"
+PAGE_CONCURRENCY = int(os.getenv("PAGE_CONCURRENCY", "3"))
+CHROME_PROFILE_DIR = os.getenv("CHROME_PROFILE_DIR")  # Optional persistent --user-data-dir
+LEAN_LOAD = lean_load_enabled()  # Block images, fonts, media and trackers while scraping
+FETCH_ENGINE = os.getenv("FETCH_ENGINE", "selenium")  # "selenium" or "http" (public guest pages, no browser)
+EXTRACTION_MODE = os.getenv("EXTRACTION_MODE", "js")  # "js", "soup" or "network" (API response capture)
+CROSS_RUN_DEDUP = cross_run_dedup_enabled()  # Skip jobs already written by earlier runs (seen_jobs.npy)
+SAVE_SNAPSHOTS = snapshots_enabled()  # Keep every results page in snapshots/ for offline replay
+ARCHIVE_RUNS = archive_enabled()  # Append every run to the date/search-partitioned Parquet archive in archive/
+
+CSV_FIELDS = list(LABELS.values())
+
 # --- Core Functions ---
 
 def prompt_linkedin_credentials():
@@ -68,15 +94,12 @@ def linkedin_login(driver, email, password):
         print(f"❌ Login failed! Check credentials or selectors. Error: {e}")
         return False
 
-def navigate_to_jobs(driver, keywords, location):
+def navigate_to_jobs(driver, keywords, location, sort_by_date=False):
     """Constructs the job search URL and navigates the browser."""
     
-    # Simple URL encoding (replacing spaces with %20)
-    keywords_encoded = keywords.replace(' ', '%20')
-    location_encoded = location.replace(' ', '%20')
-
-    # Construct the search URL
-    jobs_url = f"https://www.linkedin.com/jobs/search/?keywords={keywords_encoded}&location={location_encoded}"
+    # Construct the search URL (sorting newest first lets incremental crawls
+    # hit already-stored jobs at the end of the list)
+    jobs_url = build_search_url(keywords, location, sort_by_date=sort_by_date)
 
     driver.get(jobs_url)
     wait = WebDriverWait(driver, 15)
@@ -90,8 +113,20 @@ def navigate_to_jobs(driver, keywords, location):
         print(f"❌ Failed to load job search results page: {e}")
         return None
 
-def scrape_jobs(driver: webdriver.Chrome, keywords: str, location: str):
-    """Scrolls through the job listings and extracts job data using BeautifulSoup."""
+def iter_scraped_jobs(driver: webdriver.Chrome, keywords: str, location: str, max_scrolls: int = 5, extraction: str = "js",
+                      incremental: bool = False, stop_after_seen: int = 10, db_name: str = "linkedin_jobs.db",
+                      lean_load: LeanLoad = None):
+    """Scrolls through the job listings and yields each job record as soon as its card renders.
+
+    In incremental mode, jobs already stored for this search are skipped and scrolling
+    stops after stop_after_seen consecutive already-seen cards. extraction="network"
+    decodes the job-search API responses instead of the rendered cards.
+    """
+    cutoff = None
+    if incremental:
+        cutoff = KnownJobCutoff(get_known_job_ids(keywords, location, db_name), stop_after_seen)
+        print(f"🔁 Incremental crawl: {len(cutoff.known_job_ids)} jobs already stored for this search.")
+
     # Wait for job results to load
     wait = WebDriverWait(driver, 15)
     try:
@@ -102,99 +137,199 @@ def scrape_jobs(driver: webdriver.Chrome, keywords: str, location: str):
         print("✅ Job results panel found.")
     except TimeoutException:
         print("❌ Job results container not found.")
-        return []
+        return
 
-    # Scroll the job results panel to load all listings
+    # Scroll the job results panel, pulling only newly appended cards after each scroll
     print("🔍 Starting scroll and job collection...")
-    
-    scroll_count = 0
-    max_scrolls = 5  # Adjust this number based on how many jobs you want to collect
-    
-    while scroll_count < max_scrolls:
-        # Scroll down within the results pane
-        driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", results_pane)
-        # Add random pause for better stealth
-        time.sleep(random.uniform(1.0, 3.0))
-        scroll_count += 1
-        print(f"Scrolled {scroll_count} times...")
-        
-    # Get the full page source after scrolling
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
-    
-    # List to hold all scraped job data
-    data = []
-    
-    # Find all job card containers
-    # Try multiple selectors to accommodate LinkedIn's changing UI
-    job_cards = soup.find_all('div', class_='job-card-container--clickable') 
-    
-    if not job_cards:
-        # Fallback selectors
-        job_cards = soup.find_all('li', class_='jobs-search-results__list-item')
-        
-    if not job_cards:
-        # Another fallback
-        job_cards = soup.find_all('div', {'data-job-id': True})
-    
-    print(f"Found {len(job_cards)} job cards on the page.")
+    # Wait only until new cards render; random stealth floor is configured separately
+    waiter = AdaptiveScrollWait.from_env()
+    if extraction == "network":
+        capture = NetworkCapture(driver, lean_load)
+        capture.start()
+        for card in stream_captured_cards(driver, results_pane, capture, max_scrolls, waiter=waiter, cutoff=cutoff):
+            yield Job.from_card(card, keywords, location)
+        if capture.responses:
+            print(f"⏱️ Scroll waits: {waiter.summary()}")
+            if lean_load:
+                lean_load.page_report(driver, f"Results for '{keywords}'")
+            return
+        # Guest pages are server-rendered and make no job API calls
+        print("⚠️ No job API responses captured, falling back to in-page extraction.")
+        extraction = "js"
 
-    for card in job_cards:
-        try:
-            # Locate job title, company, and post date within each card
-            title_el = card.find('h3', class_='base-search-card__title')
-            company_el = card.find('h4', class_='base-search-card__subtitle')
-            location_el = card.find('span', class_='job-search-card__location')
-            date_el = card.find('time', class_='job-search-card__listdate')
-            link_el = card.find('a', class_='base-card__full-link')
-
-            # Extract text and link, handling potential missing elements
-            title = title_el.text.strip() if title_el else 'N/A'
-            company = company_el.text.strip() if company_el else 'N/A'
-            location = location_el.text.strip() if location_el else 'N/A'
-            post_date = date_el['datetime'].strip() if date_el and 'datetime' in date_el.attrs else (date_el.text.strip() if date_el else 'N/A')
-            job_link = link_el['href'].split('?')[0] if link_el else 'N/A'  # Clean up the link
-
-            data.append({
-                'Job Title': title,
-                'Company': company,
-                'Location': location,
-                'Post Date': post_date,
-                'Link': job_link,
-                'Search Keywords': keywords,
-                'Search Location': location
-            })
-        except Exception as e:
-            # Skip any card that causes an unexpected error during parsing
-            print(f"Skipping job card due to error: {e}")
-            continue
-            
+    cards = stream_job_cards(
+        driver,
+        results_pane,
+        max_scrolls=max_scrolls,
+        mode=extraction,
+        cutoff=cutoff,
+        waiter=waiter,
+        snapshots=SnapshotStore() if SAVE_SNAPSHOTS else None,
+        snapshot_meta={"query": keywords, "location": location},
+    )
+    for card in cards:
+        yield Job.from_card(card, keywords, location)
+    print(f"⏱️ Scroll waits: {waiter.summary()}")
+
+    if lean_load:
+        lean_load.page_report(driver, f"Results for '{keywords}'")
+
+def iter_paginated_jobs(driver: webdriver.Chrome, keywords: str, location: str, max_pages: int = 5, concurrency: int = 3,
+                        extraction: str = "js", incremental: bool = False, stop_after_seen: int = 10,
+                        db_name: str = "linkedin_jobs.db", lean_load: LeanLoad = None, on_page=None):
+    """Fetches results pages directly by URL (&start=N) across tabs and yields job records.
+
+    on_page() is called once per results page loaded (e.g. DriverLease.record_page).
+    """
+    cutoff = None
+    if incremental:
+        cutoff = KnownJobCutoff(get_known_job_ids(keywords, location, db_name), stop_after_seen)
+        print(f"🔁 Incremental crawl: {len(cutoff.known_job_ids)} jobs already stored for this search.")
+
+    if extraction == "network":
+        # Each page is read from its own tab, so paginated fetch extracts in-page
+        extraction = "js"
+
+    print(f"🔍 Fetching up to {max_pages} results pages, {concurrency} at a time...")
+    cards = fetch_paginated_jobs(
+        driver, keywords, location,
+        max_pages=max_pages,
+        concurrency=concurrency,
+        mode=extraction,
+        cutoff=cutoff,
+        sort_by_date=incremental,
+        lean_load=lean_load,
+        on_page=on_page,
+    )
+    for card in cards:
+        yield Job.from_card(card, keywords, location)
+
+def iter_http_jobs(keywords: str, location: str, max_pages: int = 5, concurrency: int = 4, incremental: bool = False,
+                   stop_after_seen: int = 10, db_name: str = "linkedin_jobs.db"):
+    """Fetches the public guest job pages over plain HTTP (no browser, no login) and yields job records."""
+    cutoff = None
+    if incremental:
+        cutoff = KnownJobCutoff(get_known_job_ids(keywords, location, db_name), stop_after_seen)
+        print(f"🔁 Incremental crawl: {len(cutoff.known_job_ids)} jobs already stored for this search.")
+
+    print(f"🌐 Fetching up to {max_pages} guest results pages over HTTP, {concurrency} at a time...")
+    with GuestJobFetcher(concurrency=concurrency, snapshots=SnapshotStore() if SAVE_SNAPSHOTS else None) as fetcher:
+        for card in fetcher.iter_jobs(keywords, location, max_pages=max_pages, cutoff=cutoff, sort_by_date=incremental):
+            yield Job.from_card(card, keywords, location)
+        print(f"🌐 HTTP engine: {fetcher.stats()}")
+        print(f"🧩 Parsing: {parse_stats.summary()}")
+
+def scrape_jobs(driver: webdriver.Chrome, keywords: str, location: str, max_scrolls: int = 5, extraction: str = "js"):
+    """Scrolls through the job listings and extracts job data (in-page JS, BeautifulSoup fallback)."""
+    data = list(iter_scraped_jobs(driver, keywords, location, max_scrolls, extraction))
+    print(f"Found {len(data)} job cards on the page.")
     return data
 
-def process_and_save_data(data: list[dict], output_filename: str = 'linkedin_jobs_raw.csv'):
-    """Converts data to DataFrame, removes duplicates, and saves to CSV."""
+def stream_and_save_jobs(records, db_name: str = "linkedin_jobs.db", batch_size: int = 25, csv_filename: str = None,
+                         seen: SeenSet = None, search_keywords: str = None, search_location: str = None,
+                         incremental: bool = False):
+    """Writes Job records to a timestamped CSV and SQLite while they are still being scraped.
+
+    Rows are written to the CSV and committed to SQLite every batch_size records (one
+    transaction per batch on a single JobStore connection), so only one batch is ever
+    held in memory. Each batch is first checked in bulk against the
+    cross-run seen-set, so jobs saved by earlier runs are not written to the CSV
+    again; SQLite still gets every job, to update its last_seen and record the run,
+    and so does the run's file in the Parquet archive when ARCHIVE_RUNS is on.
+    Pass incremental=True when records come from a KnownJobCutoff crawl, so the
+    run is not used to detect closed jobs.
+    """
+    if seen is None and CROSS_RUN_DEDUP:
+        seen = seen_jobs
+    if csv_filename:
+        final_filename = csv_filename
+    else:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        final_filename = f'linkedin_jobs_{timestamp}.csv'
+    store = JobStore(db_name, search_keywords=search_keywords, search_location=search_location,
+                     incremental=incremental)
+    archive = RunArchive(search_keywords, search_location) if ARCHIVE_RUNS else None
+
+    written = 0
+    duplicates = 0
+    previously_seen = 0
+    seen_keys = set()
+    batch = []
+    with store, archive or contextlib.nullcontext(), open(final_filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_FIELDS)
+
+        def write_batch(batch):
+            nonlocal written, previously_seen
+            store.insert(batch)
+            if archive is not None:
+                archive.append(batch)
+            if seen is not None:
+                new = seen.claim(job.job_id for job in batch)
+                previously_seen += len(batch) - int(new.sum())
+                batch = [job for job, is_new in zip(batch, new) if is_new]
+            if not batch:
+                return
+            writer.writerows(job.as_row() for job in batch)
+            csvfile.flush()
+            written += len(batch)
+
+        for job in map(to_job, records):
+            # Same duplicate rule as process_and_save_data: one row per LinkedIn job ID
+            key = job.key()
+            if key in seen_keys:
+                duplicates += 1
+                continue
+            seen_keys.add(key)
+
+            batch.append(job)
+            if len(batch) >= batch_size:
+                write_batch(batch)
+                batch = []
+        if batch:
+            write_batch(batch)
+    if archive is not None and archive.rows:
+        print(f"📦 Archived {archive.rows} jobs to {archive.path}")
+    if seen is not None:
+        seen.flush()
+
+    if not written:
+        os.remove(final_filename)
+        print(f"No new data to save ({previously_seen} jobs already saved by earlier runs).")
+        return 0, None
+
+    print(f"Duplicates removed: {duplicates}, already saved by earlier runs: {previously_seen}")
+    print(f"✅ Streamed {written} unique listings to {final_filename} and {db_name} "
+          f"({store.inserted} new in the database, {store.reseen} seen before, {store.reposted} reposts of stored jobs).")
+    return written, final_filename
+
+def process_and_save_data(data, output_filename: str = 'linkedin_jobs_raw.csv'):
+    """Converts Job records (or older record dicts) to a DataFrame, removes duplicates, and saves to CSV."""
     if not data:
         print("No data to save.")
         return None
 
-    df = pd.DataFrame(data)
+    df = as_frame(data)
     print(f"Raw listings collected: {len(df)}")
     
     # Step 5: Add Duplicate Removal
-    # We keep the first instance of a job based on the combination of Title and Company/Link
-    # Handle both data formats (old and new)
-    if 'Job Title' in df.columns:
-        # New format
-        df_cleaned = df.drop_duplicates(subset=['Job Title', 'Company', 'Link'], keep='first')
-    else:
-        # Old format
-        df_cleaned = df.drop_duplicates(subset=['title', 'company', 'link'], keep='first')
+    # We keep the first instance of each LinkedIn job ID
+    df_cleaned = drop_duplicate_jobs(df)
+
+    # Jobs already written by an earlier run are dropped too (bulk check against the seen-set)
+    previously_seen = 0
+    if CROSS_RUN_DEDUP:
+        new = seen_jobs.claim(None if pd.isna(job_id) else int(job_id) for job_id in df_cleaned['Job ID'])
+        previously_seen = len(df_cleaned) - int(new.sum())
+        df_cleaned = df_cleaned[new]
+        seen_jobs.flush()
     
     # Save the cleaned data with a timestamped filename
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     final_filename = f'linkedin_jobs_{timestamp}.csv'
     df_cleaned.to_csv(final_filename, index=False)
     
-    print(f"Duplicates removed: {len(df) - len(df_cleaned)}")
+    print(f"Duplicates removed: {len(df) - len(df_cleaned) - previously_seen}, already saved by earlier runs: {previously_seen}")
     print(f"✅ Final data saved to {final_filename} with {len(df_cleaned)} unique listings.")
     
     return df_cleaned, final_filename
@@ -265,16 +400,20 @@ def audit_selectors(driver):
         ".jobs-search-results__list-item"
     ]
     
-    found_selector = None
-    for selector in selectors:
+    def find(selector):
         try:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            if elements:
-                found_selector = selector
-                print(f"✅ Found job results with selector: {selector} ({len(elements)} elements)")
-                break
-        except Exception as e:
-            continue
+            return driver.find_elements(By.CSS_SELECTOR, selector)
+        except Exception:
+            return []
+
+    # Probe the selectors that worked on this layout before first
+    layout = driver.execute_script(LAYOUT_FINGERPRINT_JS, LAYOUT_MARKERS)
+    order, skipped = selector_stats.plan(layout, "results_container", selectors)
+    elements, probes = probe_cascade(order, skipped, find)
+    selector_stats.record(layout, "results_container", probes)
+    found_selector = probes[-1][0] if elements else None
+    if found_selector:
+        print(f"✅ Found job results with selector: {found_selector} ({len(elements)} elements)")
     
     if not found_selector:
         print("❌ Could not find job results container with any known selectors")
@@ -288,16 +427,12 @@ def audit_selectors(driver):
         "[data-job-id]"
     ]
     
-    found_card_selector = None
-    for selector in card_selectors:
-        try:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            if elements:
-                found_card_selector = selector
-                print(f"✅ Found job cards with selector: {selector} ({len(elements)} elements)")
-                break
-        except Exception as e:
-            continue
+    order, skipped = selector_stats.plan(layout, "audit_cards", card_selectors)
+    elements, probes = probe_cascade(order, skipped, find)
+    selector_stats.record(layout, "audit_cards", probes)
+    found_card_selector = probes[-1][0] if elements else None
+    if found_card_selector:
+        print(f"✅ Found job cards with selector: {found_card_selector} ({len(elements)} elements)")
     
     if not found_card_selector:
         print("❌ Could not find job cards with any known selectors")
@@ -306,92 +441,89 @@ def audit_selectors(driver):
     print("✅ Selector audit completed successfully")
     return True
 
+def report_field_matches():
+    """Print which fallback selector resolved each card field so far, to spot markup changes early."""
+    for field, counts in SELECTOR_PLAN.match_report().items():
+        matched = [f"{selector} ×{count}" for selector, count in counts.items() if count]
+        if matched:
+            print(f"🧩 {field}: {', '.join(matched)}")
+
+def visualize_saved_jobs(saved_count: int, csv_filename: str):
+    """Reads the saved CSV back and charts it."""
+    if not saved_count:
+        print("No data was scraped.")
+        return
+    df_cleaned = pd.read_csv(csv_filename)
+    
+    # Step 6: Create visualization
+    if not df_cleaned.empty:
+        png_filename = create_visualization(df_cleaned, csv_filename)
+        print(f"📊 Data visualization completed: {png_filename}")
+    else:
+        print("❌ No data to visualize")
+
 if __name__ == "__main__":
     
     # Define job search parameters
     search_term = "Data Analyst"
     location = "New York City Metro Area"
 
+    if FETCH_ENGINE == "http":
+        # Public guest pages need neither a browser nor a login
+        saved_count, csv_filename = stream_and_save_jobs(
+            iter_http_jobs(search_term, location, concurrency=PAGE_CONCURRENCY, incremental=INCREMENTAL_CRAWL),
+            search_keywords=search_term, search_location=location, incremental=INCREMENTAL_CRAWL
+        )
+        report_field_matches()
+        visualize_saved_jobs(saved_count, csv_filename)
+        sys.exit(0)
+
     driver = None
     try:
-        # --- 1. WebDriver Setup (reusing your setup logic) ---
-        # NOTE: If running visibly, ensure you remove the driver.quit() line until you're done debugging!
-        # This block needs to be updated to match the final driver setup you're using.
-        # Assuming the driver setup from the last exchange is working:
-        
-        # --- Simplified Setup for Demo ---
-        # We will assume get_driver() (or similar function) is defined and handles options/fallbacks.
-        # Since the interface wasn't opening, ensure HEADLESS=False or remove the flag for debugging.
-        
-        # --- Using the most recent (complex) setup logic ---
-        # The full setup block from your last exchange should be placed here.
-        # (To keep it clean, let's use the function from a previous Cursor turn that defines Options)
-        
-        # Create Options for visible mode
-        chrome_options = Options()
-        chrome_options.add_experimental_option("detach", True) # Keep window open after script ends
-        chrome_options.add_argument("--window-size=1280,800")
-        
-        # Anti-Detection Flags
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-
-        # Stability Flags
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-default-apps")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        
-        # User Agent
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
-        print("Attempting to auto-install/load ChromeDriver...")
-        
-        # If the local driver failed, we must install the manager dependency:
-        S = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=S, options=chrome_options)
-        driver.set_page_load_timeout(45)
+        # --- 1. WebDriver Setup ---
+        # Shared options (lean load, profile, anti-detection); the window stays open after the script ends
+        driver = create_driver(page_load_timeout=45, user_data_dir=CHROME_PROFILE_DIR, lean=LEAN_LOAD,
+                               detach=True, performance_log=EXTRACTION_MODE == "network")
         print("✅ WebDriver initialized successfully. Browser should be open.")
-
-        # Run the CDP tweak script immediately after driver initialization
-        try:
-            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-                "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-            })
-        except Exception:
-            pass
+        lean_load = LeanLoad() if LEAN_LOAD else None
         
         # --- 2. Login and Navigation ---
-        email, password = prompt_linkedin_credentials()
-        if not email or not password:
-            sys.exit(1)
+        def login_with_credentials():
+            email, password = prompt_linkedin_credentials()
+            if not email or not password:
+                sys.exit(1)
+            return linkedin_login(driver, email, password)
         
-        if linkedin_login(driver, email, password):
-            url = navigate_to_jobs(driver, keywords=search_term, location=location)
-            print(f"Navigating to: {url}")
+        # Reuse the saved session when it is still valid; form login only when it expired
+        if ensure_logged_in(driver, login_with_credentials, uses_profile=bool(CHROME_PROFILE_DIR)):
+            if lean_load:
+                lean_load.reset(driver)
+            if FETCH_MODE == "paginate":
+                # Results pages are requested directly by URL, no scrolling needed
+                url = build_search_url(search_term, location, sort_by_date=INCREMENTAL_CRAWL)
+                records = iter_paginated_jobs(driver, search_term, location, concurrency=PAGE_CONCURRENCY,
+                                              extraction=EXTRACTION_MODE, incremental=INCREMENTAL_CRAWL,
+                                              lean_load=lean_load)
+            else:
+                url = navigate_to_jobs(driver, keywords=search_term, location=location, sort_by_date=INCREMENTAL_CRAWL)
+                print(f"Navigating to: {url}")
+                if url:
+                    # Audit selectors before scraping
+                    audit_selectors(driver)
+                    records = iter_scraped_jobs(driver, search_term, location, extraction=EXTRACTION_MODE,
+                                                incremental=INCREMENTAL_CRAWL, lean_load=lean_load)
             
             # --- 3. Scraping, Processing, and Saving ---
             if url:
-                # Audit selectors before scraping
-                audit_selectors(driver)
-                
-                scraped_data = scrape_jobs(driver, search_term, location)
+                # Step 4, 5: Scrape and save while results are still loading
+                saved_count, csv_filename = stream_and_save_jobs(records, search_keywords=search_term,
+                                                                 search_location=location,
+                                                                 incremental=INCREMENTAL_CRAWL)
+                if lean_load:
+                    print(f"🚫 Lean load summary: {lean_load.summary()}")
+                report_field_matches()
                 
-                # Step 4, 5: Process and Save
-                if scraped_data:
-                    df_cleaned, csv_filename = process_and_save_data(scraped_data)
-                    
-                    # Step 6: Create visualization
-                    if df_cleaned is not None and not df_cleaned.empty:
-                        png_filename = create_visualization(df_cleaned, csv_filename)
-                        print(f"📊 Data visualization completed: {png_filename}")
-                    else:
-                        print("❌ No data to visualize")
-                else:
-                    print("No data was scraped.")
+                visualize_saved_jobs(saved_count, csv_filename)
             else:
                 print("Failed to navigate to job search page.")
         else:
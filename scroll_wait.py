@@ -0,0 +1,176 @@
+"""
+Adaptive scroll waits: return as soon as new job cards render instead of sleeping
+
+Each scroll is one async script call: it records the rendered card count and the
+pane's scrollHeight, scrolls to the bottom, and resolves on the first DOM
+mutation (MutationObserver, backed by a short poll) that adds cards or height,
+or when the timeout hits. Jitter for stealth is a separate floor: if content
+arrives faster than a random floor, the remainder is slept, so human-looking
+pacing no longer costs a fixed 4-5s per scroll. Every wait is recorded so the
+timeout and floor can be tuned from real distributions.
+"""
+
+import json
+import os
+import random
+import statistics
+import time
+
+from job_card_extractor import CARD_SELECTORS
+
+SCROLL_AND_WAIT_JS = """
+const [pane, selectors, timeoutMs, pollMs, done] = arguments;
+const rendered = () => {
+    let best = 0;
+    for (const sel of selectors) {
+        let n = 0;
+        for (const el of pane.querySelectorAll(sel)) if (el.textContent.trim()) n++;
+        if (n > best) best = n;
+    }
+    return best;
+};
+const startCards = rendered(), startHeight = pane.scrollHeight, t0 = performance.now();
+let finished = false, observer = null, poll = null, timer = null;
+const finish = (changed) => {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearInterval(poll);
+    clearTimeout(timer);
+    done({changed: changed, cards: rendered(), height: pane.scrollHeight, waited_ms: performance.now() - t0});
+};
+const check = () => {
+    if (rendered() > startCards || pane.scrollHeight > startHeight) finish(true);
+};
+observer = new MutationObserver(check);
+observer.observe(pane, {childList: true, subtree: true, characterData: true});
+// Layout-only growth does not always produce a mutation under the pane
+poll = setInterval(check, pollMs);
+timer = setTimeout(() => finish(false), timeoutMs);
+pane.scrollTop = pane.scrollHeight;
+"""
+
+# Synchronous snapshot used by the polling fallback
+PANE_STATE_JS = """
+const [pane, selectors] = arguments;
+let best = 0;
+for (const sel of selectors) {
+    let n = 0;
+    for (const el of pane.querySelectorAll(sel)) if (el.textContent.trim()) n++;
+    if (n > best) best = n;
+}
+return [best, pane.scrollHeight];
+"""
+
+SCROLL_PANE_JS = "arguments[0].scrollTop = arguments[0].scrollHeight;"
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class AdaptiveScrollWait:
+    """Scroll a results pane and wait only until new cards render (or timeout).
+
+    timeout: longest wait for new content per scroll, in seconds
+    poll_interval: fallback poll period, in seconds
+    stealth_floor: (min, max) seconds; each scroll takes at least a random value in this range
+    log_path: optional JSON-lines file that every wait is appended to
+    """
+
+    def __init__(self, timeout=6.0, poll_interval=0.15, stealth_floor=(0.5, 1.5), log_path=None):
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.stealth_floor = stealth_floor
+        self.log_path = log_path
+        self.records = []
+        self._use_observer = True
+        self._script_timeout_set = set()
+
+    @classmethod
+    def from_env(cls):
+        """Configure from SCROLL_WAIT_TIMEOUT, SCROLL_STEALTH_FLOOR ("min,max") and SCROLL_WAIT_LOG"""
+        low, high = (float(x) for x in os.getenv("SCROLL_STEALTH_FLOOR", "0.5,1.5").split(","))
+        return cls(
+            timeout=float(os.getenv("SCROLL_WAIT_TIMEOUT", "6")),
+            stealth_floor=(low, high),
+            log_path=os.getenv("SCROLL_WAIT_LOG") or None,
+        )
+
+    def _observe(self, driver, pane):
+        if id(driver) not in self._script_timeout_set:
+            # The async script must be allowed to run for the whole wait
+            driver.set_script_timeout(self.timeout + 10)
+            self._script_timeout_set.add(id(driver))
+        return driver.execute_async_script(
+            SCROLL_AND_WAIT_JS, pane, CARD_SELECTORS, int(self.timeout * 1000), int(self.poll_interval * 1000)
+        )
+
+    def _poll(self, driver, pane):
+        start = time.perf_counter()
+        start_cards, start_height = driver.execute_script(PANE_STATE_JS, pane, CARD_SELECTORS)
+        driver.execute_script(SCROLL_PANE_JS, pane)
+        while True:
+            cards, height = driver.execute_script(PANE_STATE_JS, pane, CARD_SELECTORS)
+            waited = time.perf_counter() - start
+            if cards > start_cards or height > start_height or waited >= self.timeout:
+                changed = cards > start_cards or height > start_height
+                return {"changed": changed, "cards": cards, "height": height, "waited_ms": waited * 1000}
+            time.sleep(self.poll_interval)
+
+    def scroll_and_wait(self, driver, pane):
+        """Scroll pane to the bottom and return once new content renders or the timeout hits.
+
+        Returns {"changed", "cards", "height", "waited_ms", "total_ms", "timed_out"}.
+        """
+        start = time.perf_counter()
+        floor = random.uniform(*self.stealth_floor) if self.stealth_floor else 0.0
+
+        outcome = None
+        if self._use_observer:
+            try:
+                outcome = self._observe(driver, pane)
+            except Exception as e:
+                print(f"⚠️ MutationObserver wait unavailable, polling instead: {e}")
+                self._use_observer = False
+        if outcome is None:
+            outcome = self._poll(driver, pane)
+
+        # Stealth floor is applied on top of the content wait, never instead of it
+        remaining = floor - (time.perf_counter() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+
+        outcome = dict(outcome)
+        outcome["timed_out"] = not outcome["changed"]
+        outcome["total_ms"] = (time.perf_counter() - start) * 1000
+        self._record(outcome)
+        return outcome
+
+    def _record(self, outcome):
+        record = {
+            "waited_ms": round(outcome["waited_ms"], 1),
+            "total_ms": round(outcome["total_ms"], 1),
+            "timed_out": outcome["timed_out"],
+            "cards": outcome["cards"],
+        }
+        self.records.append(record)
+        if self.log_path:
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"ts": time.time(), **record}) + "\n")
+
+    def summary(self):
+        """Wait distribution over every scroll so far (milliseconds)"""
+        if not self.records:
+            return {"scrolls": 0}
+        waits = [r["waited_ms"] for r in self.records]
+        totals = [r["total_ms"] for r in self.records]
+        return {
+            "scrolls": len(self.records),
+            "timeouts": sum(r["timed_out"] for r in self.records),
+            "wait_p50_ms": round(statistics.median(waits), 1),
+            "wait_p90_ms": round(_percentile(waits, 0.9), 1),
+            "wait_max_ms": round(max(waits), 1),
+            "total_mean_ms": round(statistics.mean(totals), 1),
+        }
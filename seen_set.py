@@ -0,0 +1,222 @@
+"""
+Persistent cross-run seen-set of LinkedIn job IDs
+
+Every job ID ever written is kept in a sorted uint64 array on disk
+(seen_jobs.npy), memory-mapped rather than loaded, plus a small sorted delta
+file for recent runs that is folded into the base once it grows past 1/8 of it.
+Membership for a whole batch is one vectorized np.searchsorted per array, so
+checking a batch against tens of millions of historical postings touches only a
+few pages of the file and never needs the old CSVs in memory.
+
+    python seen_set.py stats
+    python seen_set.py seed --db linkedin_jobs.db linkedin_jobs_*.csv
+"""
+
+import argparse
+import atexit
+import contextlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+
+SEEN_SET_FILE = Path(os.getenv("SEEN_SET_FILE", Path(__file__).parent / "seen_jobs.npy"))
+
+
+def cross_run_dedup_enabled():
+    """CROSS_RUN_DEDUP=false writes every job found, even if an earlier run saved it"""
+    return os.getenv("CROSS_RUN_DEDUP", "true").lower() == "true"
+
+
+def _open_sorted(path):
+    if not path.exists():
+        return np.empty(0, dtype=np.uint64)
+    array = np.load(path, mmap_mode="r")
+    return array if len(array) else np.empty(0, dtype=np.uint64)
+
+
+def _member(sorted_ids, ids):
+    """Vectorized membership of ids in a sorted array"""
+    if not len(sorted_ids) or not len(ids):
+        return np.zeros(len(ids), dtype=bool)
+    positions = np.minimum(np.searchsorted(sorted_ids, ids), len(sorted_ids) - 1)
+    return sorted_ids[positions] == ids
+
+
+def _save_sorted(path, ids):
+    # Each save gets its own temp file, so concurrent writers never replace each other's half-written file
+    with tempfile.NamedTemporaryFile("wb", dir=path.parent, prefix=f"{path.name}.", suffix=".tmp",
+                                     delete=False) as f:
+        np.save(f, ids)
+    os.replace(f.name, path)
+
+
+@contextlib.contextmanager
+def _file_lock(path):
+    """Exclusive lock on a sidecar file, held across processes for the with-block"""
+    with open(path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class SeenSet:
+    """Sorted, memory-mapped uint64 job-ID set: base file + delta file + in-memory pending IDs"""
+
+    def __init__(self, path=SEEN_SET_FILE, compact_ratio=0.125):
+        self.path = Path(path)
+        self.delta_path = self.path.with_name(self.path.stem + ".delta.npy")
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.compact_ratio = compact_ratio
+        self._lock = threading.RLock()
+        self._base = None
+        self._delta = None
+        self._pending = np.empty(0, dtype=np.uint64)
+
+    def _arrays(self):
+        if self._base is None:
+            self._base = _open_sorted(self.path)
+            self._delta = _open_sorted(self.delta_path)
+        return self._base, self._delta, self._pending
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(array) for array in self._arrays())
+
+    def contains(self, job_ids):
+        """Boolean array: which of the (integer) job IDs were already seen"""
+        ids = np.asarray(job_ids, dtype=np.uint64)
+        with self._lock:
+            seen = np.zeros(len(ids), dtype=bool)
+            for array in self._arrays():
+                seen |= _member(array, ids)
+        return seen
+
+    def claim(self, job_ids):
+        """Mark a batch as seen; returns a mask of the entries that are new.
+
+        None entries (no job ID) are always new. Repeats within the batch count
+        once, at their first position.
+        """
+        job_ids = list(job_ids)
+        has_id = np.fromiter((job_id is not None and job_id == job_id for job_id in job_ids), bool, len(job_ids))
+        ids = np.fromiter((job_id for job_id, ok in zip(job_ids, has_id) if ok), np.uint64, int(has_id.sum()))
+
+        first = np.zeros(len(ids), dtype=bool)
+        first[np.unique(ids, return_index=True)[1]] = True
+        with self._lock:
+            fresh = first & ~self.contains(ids)
+            self._pending = np.union1d(self._pending, ids[fresh])
+
+        new = np.ones(len(job_ids), dtype=bool)
+        new[has_id] = fresh
+        return new
+
+    def flush(self):
+        """Write pending IDs to the delta file, folding it into the base file once it is large.
+
+        The files are re-read under a file lock, so IDs flushed meanwhile by another
+        process (or another SeenSet on the same path) are merged rather than overwritten.
+        """
+        with self._lock:
+            if not len(self._pending):
+                return
+            self._base = self._delta = None  # Release the memory maps; they may be stale
+            with _file_lock(self.lock_path):
+                base = _open_sorted(self.path)
+                delta = np.union1d(_open_sorted(self.delta_path), self._pending)
+                if len(delta) > self.compact_ratio * len(base):
+                    merged = np.union1d(base, delta)
+                    del base  # Release the memory map before replacing the file
+                    _save_sorted(self.path, merged)
+                    self.delta_path.unlink(missing_ok=True)
+                else:
+                    del base
+                    _save_sorted(self.delta_path, delta)
+            self._pending = np.empty(0, dtype=np.uint64)
+
+    def stats(self):
+        with self._lock:
+            base, delta, pending = self._arrays()
+            return {"base": len(base), "delta": len(delta), "pending": len(pending),
+                    "file_mb": round(sum(p.stat().st_size for p in (self.path, self.delta_path) if p.exists()) / 1e6, 2)}
+
+
+# Process-wide seen-set shared by the savers; pending IDs are written on exit
+seen_jobs = SeenSet()
+atexit.register(seen_jobs.flush)
+
+
+def seed_from_csv(seen, csv_files, chunksize=100_000):
+    """Add the job IDs of existing CSVs, reading only the ID/link columns in chunks"""
+    import pandas as pd
+
+    from job_ids import parse_job_id
+
+    added = 0
+    for csv_file in csv_files:
+        columns = [c for c in ("Job ID", "Link") if c in pd.read_csv(csv_file, nrows=0).columns]
+        if not columns:
+            print(f"⚠️ {csv_file}: no 'Job ID' or 'Link' column, skipped")
+            continue
+        for chunk in pd.read_csv(csv_file, usecols=columns, dtype=str, chunksize=chunksize):
+            ids = chunk["Link"].map(parse_job_id) if "Link" in columns else None
+            if "Job ID" in columns:
+                ids = chunk["Job ID"].map(parse_job_id).fillna(ids) if ids is not None else chunk["Job ID"].map(parse_job_id)
+            added += int(seen.claim(int(job_id) for job_id in ids.dropna()).sum())
+    return added
+
+
+def seed_from_database(seen, db_name):
+    import sqlite3
+
+    conn = sqlite3.connect(db_name)
+    try:
+        added = 0
+        cursor = conn.execute("SELECT job_id FROM jobs WHERE job_id IS NOT NULL")
+        while True:
+            rows = cursor.fetchmany(100_000)
+            if not rows:
+                return added
+            added += int(seen.claim(job_id for (job_id,) in rows).sum())
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--path", default=SEEN_SET_FILE, help="seen-set file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="show the seen-set size")
+    seed = commands.add_parser("seed", help="add job IDs from earlier CSVs and/or the database")
+    seed.add_argument("csv_files", nargs="*")
+    seed.add_argument("--db", help="also add every job ID stored in this SQLite database")
+    args = parser.parse_args()
+
+    seen = SeenSet(args.path)
+    if args.command == "seed":
+        added = seed_from_csv(seen, args.csv_files)
+        if args.db:
+            added += seed_from_database(seen, args.db)
+        seen.flush()
+        print(f"✅ Added {added} job IDs to {seen.path}")
+    for key, value in seen.stats().items():
+        print(f"📦 {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Declarative selector plan for job card fields
+
+The card and per-field fallback selectors live in selectors.json, so a LinkedIn
+markup change is a data edit. SelectorPlan compiles every simple selector into a
+matcher and resolves all fields of a card in ONE walk over its descendants,
+keeping for each field the highest-priority alternative that matched (the same
+result as trying each selector in order with select_one, without re-walking the
+card once per alternative). Which alternative matched is counted per field and
+shown in the scraper's run summary.
+"""
+
+import json
+import os
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+
+from bs4 import Tag
+
+SELECTORS_FILE = Path(os.getenv("LINKEDIN_SELECTORS_FILE", Path(__file__).parent / "selectors.json"))
+
+# tag? then any number of .class / [attr] / [attr='v'] / [attr*='v'] parts
+_TAG_RE = re.compile(r"^(\*|[a-zA-Z][\w-]*)?")
+_PART_RE = re.compile(r"""\.([\w-]+)|\[([\w-]+)(?:(\*?=)(['"])(.*?)\4)?\]""")
+
+
+def compile_selector(selector):
+    """Compile a compound CSS selector into a predicate over bs4 Tags, or None if unsupported"""
+    tag = _TAG_RE.match(selector).group(1)
+    position = len(tag or "")
+    classes, attrs = [], []
+    while position < len(selector):
+        part = _PART_RE.match(selector, position)
+        if not part:
+            return None  # Combinators, pseudo-classes etc. resolve through select_one instead
+        css_class, attr, op, _, value = part.groups()
+        if css_class:
+            classes.append(css_class)
+        else:
+            attrs.append((attr, op, value))
+        position = part.end()
+    tag = None if tag in (None, "*") else tag
+
+    def matches(el):
+        if tag and el.name != tag:
+            return False
+        if classes:
+            el_classes = el.get("class") or ()
+            if any(c not in el_classes for c in classes):
+                return False
+        for attr, op, value in attrs:
+            actual = el.get(attr)
+            if actual is None:
+                return False
+            if isinstance(actual, list):
+                actual = " ".join(actual)
+            if op == "=" and actual != value:
+                return False
+            if op == "*=" and value not in actual:
+                return False
+        return True
+
+    return matches
+
+
+class SelectorPlan:
+    """Card selectors plus compiled per-field fallback chains"""
+
+    def __init__(self, cards, fields):
+        self.cards = list(cards)
+        self.fields = {name: list(alternatives) for name, alternatives in fields.items()}
+        self._compiled = {
+            name: [(selector, compile_selector(selector)) for selector in alternatives]
+            for name, alternatives in self.fields.items()
+        }
+        self.hits = Counter()    # (field, selector) -> cards where that alternative won
+        self.misses = Counter()  # field -> cards where no alternative matched
+        self._lock = threading.Lock()  # Pool threads extract cards through the shared plan
+
+    @classmethod
+    def load(cls, path=SELECTORS_FILE):
+        with open(path, encoding="utf-8") as f:
+            spec = json.load(f)
+        return cls(spec["cards"], spec["fields"])
+
+    def resolve(self, card):
+        """Return {field: element or None} for one card with a single descendant walk"""
+        best = {name: (len(alts), None) for name, alts in self._compiled.items()}
+        open_fields = [name for name, alts in self._compiled.items() if alts]
+
+        for el in card.descendants:
+            if not open_fields:
+                break  # Every field already has its first-choice match
+            if not isinstance(el, Tag):
+                continue
+            for name in list(open_fields):
+                rank_to_beat = best[name][0]
+                for rank, (_, matcher) in enumerate(self._compiled[name][:rank_to_beat]):
+                    if matcher is not None and matcher(el):
+                        best[name] = (rank, el)
+                        if rank == 0:
+                            open_fields.remove(name)
+                        break
+
+        # Unsupported selectors ranked above the single-pass winner get a CSS query
+        for name, alts in self._compiled.items():
+            rank_to_beat = best[name][0]
+            for rank, (selector, matcher) in enumerate(alts[:rank_to_beat]):
+                if matcher is None:
+                    el = card.select_one(selector)
+                    if el is not None:
+                        best[name] = (rank, el)
+                        break
+
+        return {name: self._record(name, rank, el) for name, (rank, el) in best.items()}
+
+    def _record(self, name, rank, el):
+        with self._lock:
+            if el is None:
+                self.misses[name] += 1
+            else:
+                self.hits[(name, self.fields[name][rank])] += 1
+        return el
+
+    def record_ranks(self, ranks):
+        """Count matched alternatives reported by the in-page extractor (-1 = no match)"""
+        for name, rank in ranks.items():
+            if name in self.fields:
+                self._record(name, rank, None if rank is None or rank < 0 else True)
+
+    def match_report(self):
+        """Per field: how often each alternative matched, in plan order"""
+        report = {}
+        with self._lock:
+            for name, alternatives in self.fields.items():
+                report[name] = {selector: self.hits[(name, selector)] for selector in alternatives}
+                report[name]["(none)"] = self.misses[name]
+        return report
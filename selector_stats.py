@@ -0,0 +1,183 @@
+"""
+Persisted selector statistics: probe the selectors that work for this layout first
+
+Card selectors are a cascade (try each until one matches), and each miss is a
+full-document search. SelectorStats records hits, misses and probe latency per
+selector, keyed by a cheap page-layout fingerprint (which known layout marker
+classes the page has). For a known layout the cascade is reordered by hit rate
+and latency, selectors that keep missing are skipped, and skipped selectors are
+re-probed every `reprobe_every` pages so a layout rollback is noticed. Skipped
+selectors are still tried when nothing else matched, so skipping never loses cards.
+Stats persist to selector_stats.json between runs.
+"""
+
+import atexit
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+STATS_FILE = Path(os.getenv("SELECTOR_STATS_FILE", Path(__file__).parent / "selector_stats.json"))
+
+# Class names that tell LinkedIn's page layouts apart (logged-in two-pane, guest SERP, ...)
+LAYOUT_MARKERS = [
+    "jobs-search-two-pane__layout",
+    "scaffold-layout",
+    "jobs-search-results-list",
+    "jobs-search-results__list-item",
+    "base-serp-page",
+    "jobs-search__results-list",
+    "base-card",
+]
+
+# Same fingerprint computed inside the page; arguments[0] = LAYOUT_MARKERS
+LAYOUT_FINGERPRINT_JS = """
+return arguments[0].filter(m => document.getElementsByClassName(m).length > 0).join('|') || 'unknown';
+"""
+# Reused by EXTRACT_CARDS_JS, which takes the markers as its fourth argument
+LAYOUT_FINGERPRINT_EXPR = "arguments[3].filter(m => document.getElementsByClassName(m).length > 0).join('|') || 'unknown'"
+
+_MARKER_PATTERNS = [(m, re.compile(r"""class=["'][^"']*\b%s\b""" % re.escape(m))) for m in LAYOUT_MARKERS]
+
+
+def layout_fingerprint(html):
+    """Fingerprint of raw HTML: the layout marker classes present, joined with '|'"""
+    return "|".join(m for m, pattern in _MARKER_PATTERNS if pattern.search(html)) or "unknown"
+
+
+class SelectorStats:
+    """Hit/miss/latency counts per (layout, selector group, selector), persisted as JSON"""
+
+    def __init__(self, path=STATS_FILE, dead_after=5, reprobe_every=25, autosave_every=20):
+        self.path = Path(path) if path else None
+        self.dead_after = dead_after
+        self.reprobe_every = reprobe_every
+        self.autosave_every = autosave_every
+        self._lock = threading.Lock()
+        self._unsaved = 0
+        self.journal = None
+        self.layouts = {}
+        if self.path and self.path.exists():
+            try:
+                self.layouts = json.loads(self.path.read_text(encoding="utf-8"))
+            except ValueError:
+                print(f"⚠️ Ignoring unreadable selector stats in {self.path}")
+
+    def _group(self, fingerprint, group):
+        return self.layouts.setdefault(fingerprint, {}).setdefault(group, {"pages": 0, "selectors": {}})
+
+    def plan(self, fingerprint, group, selectors):
+        """Split selectors into (probe order, skipped) for this layout"""
+        with self._lock:
+            stats = self._group(fingerprint, group)
+            seen = {selector: dict(entry) for selector, entry in stats["selectors"].items()}
+            reprobe = stats["pages"] % self.reprobe_every == 0
+
+        def is_dead(selector):
+            entry = seen.get(selector)
+            return bool(entry) and entry["streak_misses"] >= self.dead_after
+
+        def rank(indexed):
+            index, selector = indexed
+            entry = seen.get(selector)
+            if not entry:
+                return (1, 0.0, 0.0, index)  # Unknown selectors keep their file order
+            probes = entry["hits"] + entry["misses"]
+            return (0, -entry["hits"] / probes, entry["total_ms"] / probes, index)
+
+        ordered = [s for _, s in sorted(enumerate(selectors), key=rank)]
+        if reprobe:
+            return ordered, []
+        return [s for s in ordered if not is_dead(s)], [s for s in ordered if is_dead(s)]
+
+    def record(self, fingerprint, group, probes):
+        """probes: [(selector, matched, ms)] in the order they were tried for one page"""
+        with self._lock:
+            stats = self._group(fingerprint, group)
+            stats["pages"] += 1
+            for selector, matched, ms in probes:
+                entry = stats["selectors"].setdefault(
+                    selector, {"hits": 0, "misses": 0, "total_ms": 0.0, "streak_misses": 0, "last_hit": None})
+                entry["total_ms"] += ms
+                if matched:
+                    entry["hits"] += 1
+                    entry["streak_misses"] = 0
+                    entry["last_hit"] = time.time()
+                else:
+                    entry["misses"] += 1
+                    entry["streak_misses"] += 1
+            if self.journal is not None:
+                self.journal.append((fingerprint, group, list(probes)))
+            self._unsaved += 1
+            due = self.autosave_every and self._unsaved >= self.autosave_every
+        if due:
+            self.save()
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            if not self._unsaved:
+                return
+            # Each save gets its own temp file, so threads and other processes saving at the
+            # same time never replace (or remove) each other's half-written file
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=self.path.parent,
+                                             prefix=f"{self.path.stem}.", suffix=".tmp", delete=False) as f:
+                json.dump(self.layouts, f, indent=1)
+            os.replace(f.name, self.path)
+            self._unsaved = 0
+
+    def start_journal(self):
+        """For pool workers: stop saving and keep what record() saw for the parent to merge"""
+        with self._lock:
+            self.path = None
+            self.journal = []
+
+    def drain_journal(self):
+        """[(fingerprint, group, probes)] recorded since the last drain; replay each with record()"""
+        with self._lock:
+            entries = self.journal or []
+            if self.journal is not None:
+                self.journal = []
+        return entries
+
+    def known_layouts(self, group):
+        with self._lock:
+            return [fingerprint for fingerprint, groups in self.layouts.items() if group in groups]
+
+    def report(self, fingerprint, group):
+        """Selectors of one layout/group with hit rate and mean probe latency"""
+        with self._lock:
+            entries = dict(self._group(fingerprint, group)["selectors"])
+        rows = {}
+        for selector, entry in entries.items():
+            probes = entry["hits"] + entry["misses"]
+            rows[selector] = {
+                "hit_rate": round(entry["hits"] / probes, 3) if probes else 0.0,
+                "mean_ms": round(entry["total_ms"] / probes, 3) if probes else 0.0,
+                "dead": entry["streak_misses"] >= self.dead_after,
+            }
+        return rows
+
+
+def probe_cascade(selectors, skipped, probe):
+    """Try selectors in order (then the skipped ones) until probe(selector) returns results.
+
+    Returns (results, probes) where probes is [(selector, matched, ms)] for SelectorStats.record.
+    """
+    probes = []
+    for selector in list(selectors) + list(skipped):
+        started = time.perf_counter()
+        results = probe(selector)
+        probes.append((selector, bool(results), (time.perf_counter() - started) * 1000))
+        if results:
+            return results, probes
+    return [], probes
+
+
+# Process-wide store shared by the extractors; flushed on exit
+selector_stats = SelectorStats()
+atexit.register(selector_stats.save)
@@ -0,0 +1,149 @@
+"""
+Persisted LinkedIn session (cookies + localStorage) so runs can skip the form login
+
+The session is serialized to an encrypted file (Fernet from the `cryptography`
+package). The key comes from LINKEDIN_SESSION_KEY, or is generated once and kept
+in ~/.linkedin_scraper/session.key with owner-only permissions. On the next run
+the session is restored and validated with one lightweight page check; the full
+form login only runs when the session has expired.
+
+Alternatively set CHROME_PROFILE_DIR to reuse a Chrome --user-data-dir profile,
+which keeps the session in the browser itself (one browser per profile at a time).
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # Sessions are not persisted without cryptography
+    Fernet = None
+    InvalidToken = Exception
+
+PROJECT_DIR = Path(__file__).parent
+SESSION_FILE = PROJECT_DIR / ".linkedin_session"
+KEY_FILE = Path.home() / ".linkedin_scraper" / "session.key"
+
+LINKEDIN_HOME = "https://www.linkedin.com"
+# A tiny same-origin resource: cookies can only be set once the browser is on the domain
+COOKIE_ORIGIN_URL = "https://www.linkedin.com/favicon.ico"
+SESSION_CHECK_URL = "https://www.linkedin.com/feed/"
+AUTH_COOKIE = "li_at"
+
+EXPORT_LOCAL_STORAGE_JS = "return JSON.stringify(Object.assign({}, window.localStorage));"
+IMPORT_LOCAL_STORAGE_JS = """
+const items = JSON.parse(arguments[0]);
+for (const [key, value] of Object.entries(items)) window.localStorage.setItem(key, value);
+"""
+
+
+def _session_cipher():
+    """Fernet cipher for the session file, or None if encryption is unavailable"""
+    if Fernet is None:
+        print("⚠️ Install 'cryptography' to persist LinkedIn sessions between runs.")
+        return None
+
+    key = os.getenv("LINKEDIN_SESSION_KEY")
+    if not key:
+        if not KEY_FILE.exists():
+            KEY_FILE.parent.mkdir(parents=True, exist_ok=True)
+            KEY_FILE.write_bytes(Fernet.generate_key())
+            os.chmod(KEY_FILE, 0o600)
+        key = KEY_FILE.read_bytes()
+    return Fernet(key)
+
+
+def save_session(driver, session_file=SESSION_FILE):
+    """Encrypt and store the current cookies and localStorage"""
+    cipher = _session_cipher()
+    if cipher is None:
+        return False
+
+    try:
+        local_storage = driver.execute_script(EXPORT_LOCAL_STORAGE_JS)
+    except Exception:
+        local_storage = "{}"
+    payload = {
+        "saved_at": time.time(),
+        "cookies": driver.get_cookies(),
+        "local_storage": local_storage,
+    }
+
+    session_file = Path(session_file)
+    session_file.write_bytes(cipher.encrypt(json.dumps(payload).encode("utf-8")))
+    os.chmod(session_file, 0o600)
+    print(f"🔐 Session saved to {session_file}")
+    return True
+
+
+def load_session(session_file=SESSION_FILE):
+    """Decrypt a stored session, or return None if it is missing or unreadable"""
+    session_file = Path(session_file)
+    if not session_file.exists():
+        return None
+    cipher = _session_cipher()
+    if cipher is None:
+        return None
+    try:
+        return json.loads(cipher.decrypt(session_file.read_bytes()))
+    except (InvalidToken, ValueError):
+        print("⚠️ Stored session could not be decrypted, ignoring it.")
+        return None
+
+
+def has_live_auth_cookie(cookies, now=None):
+    """Cheap offline check: is the LinkedIn auth cookie present and unexpired?"""
+    now = now or time.time()
+    for cookie in cookies:
+        if cookie.get("name") == AUTH_COOKIE:
+            expiry = cookie.get("expiry")
+            return expiry is None or expiry > now
+    return False
+
+
+def restore_session(driver, session_file=SESSION_FILE):
+    """Load stored cookies and localStorage into the browser; True if a usable session was found"""
+    session = load_session(session_file)
+    if not session or not has_live_auth_cookie(session["cookies"]):
+        return False
+
+    driver.get(COOKIE_ORIGIN_URL)
+    for cookie in session["cookies"]:
+        cookie = {k: v for k, v in cookie.items() if k in ("name", "value", "domain", "path", "secure", "httpOnly", "expiry")}
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            continue
+    try:
+        driver.execute_script(IMPORT_LOCAL_STORAGE_JS, session["local_storage"])
+    except Exception:
+        pass
+    return True
+
+
+def is_logged_in(driver):
+    """One lightweight page check: an expired session is redirected to login/authwall"""
+    driver.get(SESSION_CHECK_URL)
+    url = driver.current_url
+    return "/feed" in url and "login" not in url and "authwall" not in url
+
+
+def ensure_logged_in(driver, login, session_file=SESSION_FILE, uses_profile=False):
+    """Reuse the stored session if it is still valid, otherwise run login() and save the new session.
+
+    login is a zero-argument callable performing the form login and returning True on success.
+    Pass uses_profile=True when the driver runs on a persistent --user-data-dir profile.
+    """
+    start = time.time()
+    if (uses_profile or restore_session(driver, session_file)) and is_logged_in(driver):
+        print(f"✅ Reused saved LinkedIn session ({time.time() - start:.1f}s)")
+        return True
+
+    print("🔑 No valid saved session, logging in with credentials...")
+    if not login():
+        return False
+    if not uses_profile:
+        save_session(driver, session_file)
+    return True
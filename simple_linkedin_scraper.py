@@ -1,54 +1,17 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+import driver_setup
+from job_card_extractor import CARD_STRAINER
+from job_ids import parse_job_id
+from job_record import Job, JobBatch
+from page_parser import parse_results_html
 import time
-import pandas as pd
 from datetime import datetime
 
 def create_driver():
-    """Create and configure the Chrome WebDriver"""
-    chrome_options = Options()
-    # Remove headless option so you can see what's happening
-    chrome_options.add_experimental_option("detach", True)  # Keep window open after script ends
-    chrome_options.add_argument("--window-size=1280,800")
-    
-    # Anti-Detection Flags
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
-    chrome_options.add_experimental_option("useAutomationExtension", False)
-
-    # Stability Flags
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-infobars")
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--disable-default-apps")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    # User Agent
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-
-    print("Installing/finding ChromeDriver...")
-    
-    # Auto-install ChromeDriver
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    driver.set_page_load_timeout(45)
-    
-    # Execute CDP commands to mask automation
-    try:
-        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-            "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-        })
-    except Exception as e:
-        print(f"Warning: Could not execute CDP command: {e}")
-    
-    return driver
+    """Create the shared Chrome WebDriver, kept open after the script ends"""
+    return driver_setup.create_driver(detach=True, page_load_timeout=45)
 
 def navigate_to_search(driver, keywords="Data Analyst", location="New York City Metro Area"):
     """Navigate directly to job search results"""
@@ -123,7 +86,7 @@ def extract_job_data(driver):
     print("🔍 Extracting job data...")
     
     # Get page source after scrolling
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
+    soup = parse_results_html(driver.page_source, CARD_STRAINER)
     
     # Try multiple selectors for job cards
     job_cards = []
@@ -192,13 +155,8 @@ def extract_job_data(driver):
             if job_link != 'N/A':
                 job_link = job_link.split('?')[0] if '?' in job_link else job_link
             
-            data.append({
-                'Job Title': title,
-                'Company': company,
-                'Location': location,
-                'Post Date': post_date,
-                'Link': job_link
-            })
+            job_id = parse_job_id(card.get('data-job-id')) or parse_job_id(job_link)
+            data.append(Job(job_id, title, company, location, post_date, job_link))
             
             print(f"Extracted job {i+1}: {title} at {company}")
             
@@ -214,7 +172,7 @@ def save_data(data, filename_prefix="linkedin_jobs"):
         print("No data to save")
         return
     
-    df = pd.DataFrame(data)
+    df = JobBatch(data).to_frame()
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"{filename_prefix}_{timestamp}.csv"
     df.to_csv(filename, index=False)
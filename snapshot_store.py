@@ -0,0 +1,209 @@
+"""
+Offline snapshot store and replay for results-page HTML
+
+Every results page the scrapers see can be saved here: the HTML is stored once
+per content hash (sha256), compressed with zstd when the `zstandard` package is
+installed and gzip otherwise, and each capture appends a metadata line (query,
+location, url, scroll index, timestamp) to index.jsonl. `replay` re-runs the
+current BeautifulSoup extractor over the stored pages in a process pool, so a
+selector fix can be checked and backfilled without opening LinkedIn.
+
+    python snapshot_store.py stats
+    python snapshot_store.py replay --workers 8 --out replayed_jobs.jsonl --save-db
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:  # gzip keeps working without it
+    zstandard = None
+
+SNAPSHOT_DIR = Path(os.getenv("SNAPSHOT_DIR", Path(__file__).parent / "snapshots"))
+CODECS = {"zst": ".html.zst", "gz": ".html.gz"}
+
+
+def snapshots_enabled():
+    """SAVE_SNAPSHOTS=true turns on page capture in the scrapers"""
+    return os.getenv("SAVE_SNAPSHOTS", "false").lower() == "true"
+
+
+def _compress(data, codec):
+    if codec == "zst":
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def _decompress(data, codec):
+    if codec == "zst":
+        if zstandard is None:
+            raise RuntimeError("Snapshot is zstd-compressed but the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+class SnapshotStore:
+    """Content-addressed page snapshots under root/objects plus a JSON-lines index"""
+
+    def __init__(self, root=SNAPSHOT_DIR, codec=None):
+        self.root = Path(root)
+        self.codec = codec or ("zst" if zstandard is not None else "gz")
+        self.index_path = self.root / "index.jsonl"
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest, codec):
+        return self.root / "objects" / digest[:2] / (digest + CODECS[codec])
+
+    def put(self, html, **meta):
+        """Store one page (deduplicated by content) and index this capture; returns the hash"""
+        data = html.encode("utf-8") if isinstance(html, str) else html
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest, self.codec)
+        entry = {"hash": digest, "codec": self.codec, "bytes": len(data),
+                 "captured_at": datetime.now().isoformat(timespec="seconds"), **meta}
+
+        with self._lock:
+            if not any(self._object_path(digest, codec).exists() for codec in CODECS):
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                tmp.write_bytes(_compress(data, self.codec))
+                os.replace(tmp, path)
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+        return digest
+
+    def get(self, digest):
+        """The stored HTML for a hash"""
+        for codec in CODECS:
+            path = self._object_path(digest, codec)
+            if path.exists():
+                return _decompress(path.read_bytes(), codec).decode("utf-8")
+        raise KeyError(digest)
+
+    def entries(self, query=None):
+        """Index entries in capture order, optionally only for one search query"""
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if query is None or entry.get("query") == query:
+                    yield entry
+
+    def latest_entries(self, query=None):
+        """One entry per stored page (its most recent capture)"""
+        return list({entry["hash"]: entry for entry in self.entries(query)}.values())
+
+    def stats(self):
+        entries = list(self.entries())
+        stored = sum(path.stat().st_size for path in self.root.glob("objects/*/*.html.*"))
+        pages = {entry["hash"]: entry["bytes"] for entry in entries}
+        return {
+            "captures": len(entries),
+            "pages": len(pages),
+            "html_mb": round(sum(pages.values()) / 1e6, 2),
+            "stored_mb": round(stored / 1e6, 2),
+            "queries": dict(Counter(entry.get("query") for entry in entries)),
+        }
+
+
+def _init_replay_worker():
+    # Workers never write selector_stats.json themselves; their probes are merged by the parent
+    from selector_stats import selector_stats
+
+    selector_stats.start_journal()
+
+
+def _replay_one(root, digest):
+    # Runs in a worker process: load one snapshot and run the current extractor on it
+    from job_card_extractor import extract_cards_from_html
+    from selector_stats import selector_stats
+
+    cards = extract_cards_from_html(SnapshotStore(root).get(digest))
+    return digest, cards, selector_stats.drain_journal()
+
+
+def replay(store, workers=None, query=None, limit=None, chunksize=16):
+    """Yield (entry, cards) for stored pages, extracted in a process pool"""
+    from selector_stats import selector_stats
+
+    entries = store.latest_entries(query)[:limit]
+    by_hash = {entry["hash"]: entry for entry in entries}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_replay_worker) as executor:
+        roots = [str(store.root)] * len(entries)
+        for digest, cards, probes in executor.map(_replay_one, roots, list(by_hash), chunksize=chunksize):
+            for fingerprint, group, page_probes in probes:
+                selector_stats.record(fingerprint, group, page_probes)
+            yield by_hash[digest], cards
+
+
+def run_replay(args):
+    from job_record import Job, JobBatch
+
+    store = SnapshotStore(args.root)
+    started = time.perf_counter()
+    pages = cards_total = empty = 0
+    records = JobBatch()
+    out = open(args.out, "w", encoding="utf-8") if args.out else None
+    try:
+        for entry, cards in replay(store, args.workers, args.query, args.limit):
+            pages += 1
+            cards_total += len(cards)
+            if not cards:
+                empty += 1
+                print(f"⚠️ No cards in snapshot {entry['hash'][:12]} ({entry.get('url', 'no url')})")
+            for card in cards:
+                if out:
+                    out.write(json.dumps({**card, "snapshot": entry["hash"], "query": entry.get("query")}) + "\n")
+                if args.save_db and card["title"] != "N/A":
+                    records.append(Job.from_card(card, entry.get("query"), entry.get("location")))
+    finally:
+        if out:
+            out.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"🔁 Replayed {pages} pages in {elapsed:.1f}s ({pages / elapsed if elapsed else 0:.0f} pages/sec): "
+          f"{cards_total} cards, {empty} pages without cards")
+    if records:
+        from database_storage import save_to_database
+
+        save_to_database(records, args.db)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--root", default=SNAPSHOT_DIR, help="snapshot directory")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("stats", help="show what is stored")
+
+    replay_cmd = commands.add_parser("replay", help="re-run the extractor over stored pages")
+    replay_cmd.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    replay_cmd.add_argument("--query", help="only pages captured for this search query")
+    replay_cmd.add_argument("--limit", type=int, help="replay at most this many pages")
+    replay_cmd.add_argument("--out", help="write the extracted cards as JSON lines")
+    replay_cmd.add_argument("--save-db", action="store_true", help="save the extracted jobs to SQLite")
+    replay_cmd.add_argument("--db", default="linkedin_jobs.db")
+
+    args = parser.parse_args()
+    if args.command == "stats":
+        for key, value in SnapshotStore(args.root).stats().items():
+            print(f"📦 {key}: {value}")
+    else:
+        run_replay(args)
+
+
+if __name__ == "__main__":
+    main()
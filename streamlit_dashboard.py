@@ -5,15 +5,33 @@ from pathlib import Path
 import glob
 from collections import Counter
 
+from run_archive import archive_enabled, archived_partitions, read_archive
+
 st.set_page_config(page_title="LinkedIn Jobs Dashboard", page_icon="💼", layout="wide")
 
 st.title("💼 LinkedIn Job Scraper Dashboard")
 st.markdown("Explore and visualize LinkedIn job data")
 
+# Columns the dashboard shows; the archive reads only these from the partitions picked below
+ARCHIVE_COLUMNS = ["title", "company", "location", "post_date", "link"]
+
 csv_files = glob.glob("*.csv")
 csv_files = [f for f in csv_files if f.startswith("linkedin_jobs") or f.startswith("comprehensive_test")]
 
-if csv_files:
+partitions = archived_partitions() if archive_enabled() else []
+sources = (["Parquet archive"] if partitions else []) + ["CSV files"]
+source = st.sidebar.radio("Data source", sources) if len(sources) > 1 else sources[0]
+
+if source == "Parquet archive":
+    dates = sorted({date for date, _ in partitions})
+    since, until = st.sidebar.select_slider("Run dates", dates, value=(dates[max(len(dates) - 7, 0)], dates[-1]))
+    searches = st.sidebar.multiselect("Searches", sorted({search for _, search in partitions}))
+    selected_file = f"archive {since} to {until}"
+
+    if st.sidebar.button("Reload Data"):
+        st.cache_data.clear()
+        st.rerun()
+elif csv_files:
     selected_file = st.sidebar.selectbox("Select CSV file", csv_files, index=0)
     
     if st.sidebar.button("Reload Data"):
@@ -28,6 +46,9 @@ uploaded_file = st.sidebar.file_uploader("Or upload a CSV file", type=['csv'])
 if uploaded_file is not None:
     df = pd.read_csv(uploaded_file)
     st.sidebar.success(f"Loaded {len(df)} jobs from uploaded file")
+elif source == "Parquet archive":
+    df = read_archive(columns=ARCHIVE_COLUMNS, since=since, until=until, searches=searches, labels=True)
+    st.sidebar.success(f"Loaded {len(df)} archived jobs")
 elif selected_file:
     df = pd.read_csv(selected_file)
     st.sidebar.success(f"Loaded {len(df)} jobs from {selected_file}")
@@ -71,6 +92,24 @@ st.dataframe(
     height=400
 )
 
+if Path("linkedin_jobs.db").exists():
+    st.markdown("### 🔎 Search Stored Jobs")
+    query = st.text_input("Title, company or location (\"exact phrase\", prefix*, OR)")
+    if query:
+        from database_storage import search_jobs
+
+        filters = {}
+        if selected_company != 'All':
+            filters['company'] = selected_company
+        if selected_location != 'All':
+            filters['location'] = selected_location
+        results = search_jobs(query, filters, limit=50)
+        if results.empty:
+            st.info("No stored jobs match that search")
+        else:
+            st.dataframe(results[['job_title', 'company', 'location', 'post_date', 'last_seen', 'link']],
+                         use_container_width=True)
+
 if 'Link' in filtered_df.columns:
     st.markdown("### 🔗 Quick Links")
     for idx, row in filtered_df.head(10).iterrows():
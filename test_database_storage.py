@@ -0,0 +1,214 @@
+"""
+Tests for job-ID keyed storage and the schema migration of older databases
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+
+import database_storage
+from database_storage import (JobStore, connect, drop_duplicate_jobs, fts_query, get_closed_jobs, get_company_stats,
+                              get_known_job_ids, get_posting_lifetimes, save_to_database, search_jobs)
+from job_card_extractor import KnownJobCutoff
+
+
+def job(job_id, title="Data Analyst", company="Tech Corp", link=None):
+    return {'Job ID': job_id, 'Job Title': title, 'Company': company, 'Location': 'Remote',
+            'Post Date': '2026-10-01', 'Link': link or f'https://www.linkedin.com/jobs/view/{job_id}',
+            'Search Keywords': 'Data Analyst', 'Search Location': 'Remote'}
+
+
+def test_jobs_are_keyed_by_integer_job_id():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "jobs.db")
+        assert save_to_database([job(3712345601), job(3712345602), job(3712345601, title="Renamed")], db) == 2
+        # Same job with a tracking-parameter link is still a duplicate; no ID at all is skipped
+        assert save_to_database([job(None, link="https://www.linkedin.com/jobs/view/3712345602/?refId=x"),
+                                 job(None, link="N/A")], db) == 0
+        assert get_known_job_ids("Data Analyst", "Remote", db) == {3712345601, 3712345602}
+
+        conn = connect(db)
+        assert conn.execute("SELECT job_title FROM jobs WHERE job_id = 3712345601").fetchone() == ("Data Analyst",)
+        # No key index beside the rowid, only the query indexes
+        assert {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'postings'")} == {
+            "idx_postings_scraped_at", "idx_postings_company", "idx_postings_location", "idx_postings_search",
+            "idx_postings_last_seen"}
+        conn.close()
+
+
+def test_old_text_keyed_database_is_migrated():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "old.db")
+        conn = sqlite3.connect(db)
+        conn.execute('''
+            CREATE TABLE jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, job_title TEXT, company TEXT, location TEXT,
+                post_date TEXT, link TEXT, search_keywords TEXT, search_location TEXT,
+                scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, UNIQUE(job_title, company, link))
+        ''')
+        rows = [("Old title", "https://www.linkedin.com/jobs/view/3712345601"),
+                ("New title", "https://www.linkedin.com/jobs/view/senior-analyst-3712345601/?trk=x"),
+                ("Other", "https://www.linkedin.com/jobs/view/3712345609"),
+                ("No link", "N/A")]
+        conn.executemany("INSERT INTO jobs (job_title, company, link) VALUES (?, 'Acme', ?)", rows)
+        conn.commit()
+        conn.close()
+
+        conn = connect(db)
+        assert conn.execute("PRAGMA user_version").fetchone()[0] >= 1
+        assert conn.execute("SELECT job_id, job_title FROM jobs ORDER BY job_id").fetchall() == [
+            (3712345601, "Old title"), (3712345609, "Other")]
+        # Rows that cannot be keyed are kept aside, not deleted
+        assert conn.execute("SELECT job_title, link FROM jobs_without_id").fetchall() == [("No link", "N/A")]
+        conn.close()
+
+
+def test_drop_duplicate_jobs_by_id():
+    df = pd.DataFrame([job(3712345601), job(None, link="https://www.linkedin.com/jobs/view/3712345601/"),
+                       job(3712345602, title="Data Analyst"), job(None, link="N/A"), job(None, link="N/A")])
+    cleaned = drop_duplicate_jobs(df)
+    assert cleaned['Job ID'].tolist()[:2] == [3712345601, 3712345602]
+    assert len(cleaned) == 4  # Rows without an ID are kept
+
+
+def test_job_store_bulk_inserts_on_one_connection():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "jobs.db")
+        with JobStore(db) as store:
+            assert store.conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+            pm = job(3712345602, title="Product Manager")
+            assert store.insert([job(3712345601), pm, job(3712345601), job(None, link="N/A")]) == 2
+            assert store.insert([pm, job(3712345603, title="Data Analyst - Urgent Hiring")]) == 1
+            assert (store.inserted, store.reposted, store.without_id) == (3, 1, 1)
+
+        conn = connect(db)
+        assert conn.execute("SELECT job_id, cluster_id FROM jobs ORDER BY job_id").fetchall() == [
+            (3712345601, 3712345601), (3712345602, 3712345602), (3712345603, 3712345601)]
+        conn.close()
+
+
+def test_hot_queries_use_indexes():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = connect(os.path.join(tmp, "jobs.db"))
+
+        def plan(sql, params):
+            return " | ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+
+        # Queries on the jobs view resolve to index searches on postings and dimension-key lookups
+        assert plan(database_storage.LATEST_JOBS_SQL, (10,)).startswith("SCAN postings USING INDEX idx_postings_scraped_at")
+        assert "SEARCH postings USING INDEX idx_postings_search" in plan(database_storage.LATEST_SEARCH_JOBS_SQL, ("a", "b", 10))
+        assert "TEMP B-TREE" not in plan(database_storage.LATEST_SEARCH_JOBS_SQL, ("a", "b", 10))
+        assert "SEARCH postings USING INDEX idx_postings_search" in plan(database_storage.KNOWN_JOB_IDS_SQL, ("a", "b"))
+        assert "USING COVERING INDEX idx_postings_company" in plan(database_storage.COMPANY_STATS_SQL, (10,))
+        assert "USING COVERING INDEX idx_postings_location" in plan(database_storage.LOCATION_STATS_SQL, (10,))
+        assert "USING INDEX idx_postings_last_seen (last_seen>?)" in plan(database_storage.POSTING_LIFETIMES_SQL, ("2026",))
+        assert "SCAN" not in plan(database_storage.CLOSED_JOBS_SQL, (1, 2))
+        conn.close()
+
+
+def test_runs_track_sightings_and_closed_jobs():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "jobs.db")
+        search = {"search_keywords": "Data Analyst", "search_location": "Remote"}
+        with JobStore(db, **search) as store:
+            assert store.insert([job(3712345601), job(3712345602, title="Product Manager")]) == 2
+            assert store.insert([job(3712345601)]) == 0  # Same run: not counted again
+        with JobStore(db, **search) as store:
+            assert store.insert([job(3712345601), job(3712345603, title="Designer")]) == 1
+            assert store.reseen == 1
+
+        conn = connect(db)
+        assert conn.execute("SELECT job_id, seen_count, first_seen <= last_seen FROM jobs ORDER BY job_id").fetchall() == [
+            (3712345601, 2, 1), (3712345602, 1, 1), (3712345603, 1, 1)]
+        assert conn.execute("SELECT run_id, job_id FROM observations").fetchall() == [
+            (1, 3712345601), (1, 3712345602), (2, 3712345601), (2, 3712345603)]
+        assert conn.execute("SELECT jobs_seen FROM runs ORDER BY run_id").fetchall() == [(2,), (2,)]
+        conn.close()
+
+        assert get_closed_jobs(db, **search)["job_id"].tolist() == [3712345602]
+        assert get_closed_jobs(db, "Other", "Remote").empty
+        assert get_posting_lifetimes(db).set_index("job_id")["seen_count"].to_dict() == {
+            3712345601: 2, 3712345602: 1, 3712345603: 1}
+
+        # An incremental crawl stops at stored jobs, so it never sees 3712345603 again
+        listing = [{"job_id": job_id} for job_id in (3712345604, 3712345601, 3712345603, 3712345602)]
+        cutoff = KnownJobCutoff(get_known_job_ids(**search, db_name=db), stop_after_seen=1)
+        with JobStore(db, **search, incremental=True) as store:
+            store.insert([job(card["job_id"], title="Data Scientist") for card in cutoff.filter(listing)])
+        assert get_closed_jobs(db, **search)["job_id"].tolist() == [3712345602]
+
+
+def test_full_text_search_ranks_prefix_and_phrase_matches():
+    assert fts_query('"data analyst" C++ eng* OR') == '"data analyst" "C++" "eng"*'
+    assert fts_query("a OR NOT b") == '"a" NOT "b"'
+    assert fts_query("data OR OR analyst") == '"data" OR "analyst"'
+    assert fts_query("data OR analyst", operators=False) == '"data" "OR" "analyst"'
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "jobs.db")
+        save_to_database([job(3712345601, title="Senior Data Analyst", company="Acme"),
+                          job(3712345602, title="Data Engineer", company="Analytix"),
+                          job(3712345603, title="Analyst, Data Platform", company="Globex")], db)
+
+        assert search_jobs('"data analyst"', db_name=db)["job_id"].tolist() == [3712345601]
+        # Title matches rank above the company-name match
+        assert search_jobs("analy*", db_name=db)["job_id"].tolist()[-1] == 3712345602
+        assert search_jobs("data", {"company": "Globex"}, db_name=db)["job_id"].tolist() == [3712345603]
+        # Stray operators from the search box no longer reach FTS5 as a syntax error
+        assert search_jobs("engineer OR OR platform", db_name=db)["job_id"].tolist() == [3712345602, 3712345603]
+
+        # Triggers keep the index in sync with edits and deletes
+        conn = connect(db)
+        with conn:
+            conn.execute("UPDATE postings SET job_title = 'Product Manager' WHERE job_id = 3712345601")
+            conn.execute("DELETE FROM jobs WHERE job_id = 3712345603")
+        conn.close()
+        assert search_jobs("analyst", db_name=db).empty
+        assert search_jobs("product", db_name=db)["job_id"].tolist() == [3712345601]
+
+
+def test_flat_jobs_table_moves_to_dimension_tables():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "flat.db")
+        conn = sqlite3.connect(db)
+        with conn:
+            for migration in database_storage.MIGRATIONS[:5]:
+                migration(conn)
+            conn.execute("PRAGMA user_version = 5")
+            conn.executemany("INSERT INTO jobs (job_id, job_title, company, location, search_keywords, search_location) "
+                             "VALUES (?, ?, ?, 'Remote', 'Data Analyst', 'Remote')",
+                             [(3712345601, "Data Analyst", "Acme"), (3712345602, "Designer", "Acme"),
+                              (3712345603, "Data Engineer", "Globex")])
+        before = conn.execute("SELECT * FROM jobs ORDER BY job_id").fetchall()
+        conn.close()
+
+        conn = connect(db)
+        assert conn.execute("SELECT * FROM jobs ORDER BY job_id").fetchall() == before
+        assert conn.execute("SELECT COUNT(*) FROM companies").fetchone() == (2,)
+        assert conn.execute("SELECT COUNT(*) FROM searches").fetchone() == (1,)
+        # Old-style writers can still insert into the view
+        with conn:
+            conn.execute("INSERT INTO jobs (job_id, job_title, company, location) VALUES (3712345604, 'Recruiter', 'Initech', 'Remote')")
+        assert conn.execute("SELECT company, search_keywords FROM jobs WHERE job_id = 3712345604").fetchone() == ("Initech", "")
+        conn.close()
+
+        stats = get_company_stats(db)
+        assert stats.iloc[0].tolist() == ["Acme", 2] and set(stats["company"]) == {"Acme", "Globex", "Initech"}
+        assert search_jobs("initech", db_name=db)["job_id"].tolist() == [3712345604]
+
+
+if __name__ == "__main__":
+    print("🔍 Testing database storage...")
+    test_jobs_are_keyed_by_integer_job_id()
+    test_old_text_keyed_database_is_migrated()
+    test_drop_duplicate_jobs_by_id()
+    test_job_store_bulk_inserts_on_one_connection()
+    test_hot_queries_use_indexes()
+    test_runs_track_sightings_and_closed_jobs()
+    test_full_text_search_ranks_prefix_and_phrase_matches()
+    test_flat_jobs_table_moves_to_dimension_tables()
+    print("✅ All database storage tests passed")
@@ -0,0 +1,107 @@
+"""
+Tests for the warm WebDriver pool (uses stand-in drivers, no browser needed)
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from driver_pool import DriverPool
+
+
+class StubDriver:
+    created = 0
+
+    def __init__(self):
+        StubDriver.created += 1
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+def make_pool(**kwargs):
+    StubDriver.created = 0
+    return DriverPool(factory=StubDriver, max_rss_mb=None, **kwargs)
+
+
+def test_leases_reuse_warm_drivers():
+    pool = make_pool(size=2)
+    with pool.lease() as first:
+        pass
+    with pool.lease() as second:
+        pass
+    assert first.driver is second.driver
+    assert StubDriver.created == 1
+    metrics = pool.metrics()
+    assert metrics["misses"] == 1 and metrics["hits"] == 1
+
+
+def test_warmup_runs_once_per_driver():
+    warmed = []
+    pool = make_pool(size=2, warmup=warmed.append)
+    pool.prewarm()
+    for _ in range(5):
+        with pool.lease():
+            pass
+    assert len(warmed) == 2
+    assert pool.metrics()["hits"] == 5
+
+
+def test_recycles_after_page_budget():
+    pool = make_pool(size=1, max_pages=3)
+    with pool.lease() as lease:
+        lease.record_page(3)
+    assert lease.driver.quit_called
+    with pool.lease() as fresh:
+        pass
+    assert fresh.driver is not lease.driver
+    assert pool.metrics()["recycled"] == 1
+
+
+def test_broken_driver_is_not_returned():
+    pool = make_pool(size=1)
+    try:
+        with pool.lease() as lease:
+            raise ValueError("page crashed")
+    except ValueError:
+        pass
+    assert lease.driver.quit_called
+    assert pool.metrics()["live_drivers"] == 0
+
+
+def test_lease_wait_is_measured_when_pool_is_full():
+    pool = make_pool(size=1)
+    held = pool.acquire()
+    threading.Timer(0.2, pool.release, args=(held,)).start()
+    with pool.lease(timeout=5) as lease:
+        assert lease.driver is held.driver
+    metrics = pool.metrics()
+    assert metrics["lease_waits"] == 1
+    assert metrics["max_wait_sec"] >= 0.15
+
+
+def test_lease_times_out():
+    pool = make_pool(size=1)
+    pool.acquire()
+    start = time.perf_counter()
+    try:
+        pool.acquire(timeout=0.2)
+        assert False, "expected TimeoutError"
+    except TimeoutError:
+        pass
+    assert time.perf_counter() - start < 2
+
+
+if __name__ == "__main__":
+    print("🔍 Testing driver pool...")
+    test_leases_reuse_warm_drivers()
+    test_warmup_runs_once_per_driver()
+    test_recycles_after_page_budget()
+    test_broken_driver_is_not_returned()
+    test_lease_wait_is_measured_when_pool_is_full()
+    test_lease_times_out()
+    print("✅ All driver pool tests passed")
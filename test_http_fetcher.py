@@ -0,0 +1,127 @@
+"""
+Tests for the driverless HTTP engine against a local stand-in server serving the guest fixture
+"""
+
+import gzip
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from http_fetcher import GUEST_PAGE_SIZE, GuestJobFetcher, build_guest_url, create_session
+from job_card_extractor import KnownJobCutoff
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+with open(os.path.join(FIXTURES_DIR, "search_results_guest.html"), encoding="utf-8") as f:
+    GUEST_PAGE = f.read()
+
+
+def guest_page(page_index):
+    """The fixture page with job IDs shifted so every page has distinct jobs"""
+    return GUEST_PAGE.replace("37987654", f"37987{page_index:02d}4")
+
+
+class GuestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    pages = 3
+    failing = set()
+    requests_seen = []
+    client_ports = set()
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        page_index = int(query["start"][0]) // GUEST_PAGE_SIZE
+        GuestHandler.requests_seen.append(page_index)
+        GuestHandler.client_ports.add(self.client_address[1])
+        if page_index in self.failing:
+            self.send_response(429)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = guest_page(page_index).encode() if page_index < self.pages else b""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve():
+    GuestHandler.requests_seen = []
+    GuestHandler.client_ports = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GuestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/jobs-guest/jobs/api/seeMoreJobPostings/search"
+
+
+def test_build_guest_url():
+    assert build_guest_url("Data Analyst", "Remote", start=25, sort_by_date=True) == (
+        "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+        "?keywords=Data%20Analyst&location=Remote&sortBy=DD&start=25")
+
+
+def test_fetches_pages_in_order_until_empty_page():
+    server, base_url = serve()
+    try:
+        with GuestJobFetcher(concurrency=2, base_url=base_url) as fetcher:
+            cards = list(fetcher.iter_jobs("Software Engineer", "San Francisco", max_pages=10))
+            stats = fetcher.stats()
+    finally:
+        server.shutdown()
+
+    assert len(cards) == 15
+    assert cards[0]["job_id"] == 3798700401 and cards[0]["title"] == "Software Engineer"
+    assert cards[-1]["job_id"] == 3798702405
+    assert stats["cards"] == 15 and stats["pages"] >= 4
+    # At most `concurrency` requests ahead of the empty page; connections are reused
+    assert max(GuestHandler.requests_seen) <= 4
+    assert len(GuestHandler.client_ports) <= 2
+
+
+def test_http_fetch_stops_at_known_jobs():
+    server, base_url = serve()
+    try:
+        known = {card_id for page in range(1, 3) for card_id in range(3798700401 + page * 1000, 3798700406 + page * 1000)}
+        cutoff = KnownJobCutoff(known, stop_after_seen=3)
+        with GuestJobFetcher(concurrency=1, base_url=base_url) as fetcher:
+            cards = list(fetcher.iter_jobs("Software Engineer", "San Francisco", max_pages=10, cutoff=cutoff))
+    finally:
+        server.shutdown()
+    assert [card["job_id"] for card in cards] == list(range(3798700401, 3798700406))
+    assert GuestHandler.requests_seen == [0, 1]
+
+
+def test_failed_page_is_skipped_not_taken_as_the_end():
+    server, base_url = serve()
+    GuestHandler.failing = {1}
+    try:
+        with GuestJobFetcher(concurrency=1, base_url=base_url, session=create_session(pool_size=1, retries=0)) as fetcher:
+            cards = list(fetcher.iter_jobs("Software Engineer", "San Francisco", max_pages=10))
+            stats = fetcher.stats()
+    finally:
+        GuestHandler.failing = set()
+        server.shutdown()
+    # Page 2 was rate limited; page 3 is still fetched and only the empty page 4 ends the crawl
+    assert [card["job_id"] // 1000 for card in cards] == [3798700] * 5 + [3798702] * 5
+    assert GuestHandler.requests_seen == [0, 1, 2, 3]
+    assert stats["errors"] == 1
+
+
+if __name__ == "__main__":
+    print("🔍 Testing HTTP fetch engine...")
+    test_build_guest_url()
+    test_fetches_pages_in_order_until_empty_page()
+    test_http_fetch_stops_at_known_jobs()
+    test_failed_page_is_skipped_not_taken_as_the_end()
+    print("✅ All HTTP fetch engine tests passed")
@@ -0,0 +1,122 @@
+"""
+Tests for the shared job card extractor against the saved fixture pages
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from job_card_extractor import (
+    KnownJobCutoff,
+    extract_cards_from_html,
+    normalize_card,
+    parse_job_id,
+    stream_job_cards,
+)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_parse_job_id():
+    """Job IDs come from data-job-id, URNs and /jobs/view/ links"""
+    assert parse_job_id("3712345601") == 3712345601
+    assert parse_job_id("urn:li:jobPosting:3798765401") == 3798765401
+    assert parse_job_id("https://www.linkedin.com/jobs/view/3712345601/?refId=x") == 3712345601
+    assert parse_job_id("https://www.linkedin.com/jobs/view/software-engineer-at-google-3798765401") == 3798765401
+    assert parse_job_id(None) is None
+    assert parse_job_id("N/A") is None
+
+
+def test_normalize_card_builds_link_from_job_id():
+    """Cards without a link get one built from the job ID"""
+    card = normalize_card({"job_id": "3712345601", "title": "Data Analyst"})
+    assert card["link"] == "https://www.linkedin.com/jobs/view/3712345601"
+    assert card["company"] == "N/A"
+
+
+def test_logged_in_fixture():
+    """Logged-in results layout"""
+    cards = extract_cards_from_html(load_fixture("search_results_logged_in.html"))
+    assert len(cards) == 5
+    assert cards[0] == {
+        "job_id": 3712345601,
+        "title": "Data Analyst",
+        "company": "Tech Solutions Inc",
+        "location": "New York, NY (Hybrid)",
+        "post_date": "2025-10-08",
+        "link": "https://www.linkedin.com/jobs/view/3712345601/",
+    }
+    assert cards[4]["post_date"] == "N/A"
+
+
+def test_guest_fixture():
+    """Public guest results layout"""
+    cards = extract_cards_from_html(load_fixture("search_results_guest.html"))
+    assert len(cards) == 5
+    assert cards[0]["job_id"] == 3798765401
+    assert cards[0]["title"] == "Software Engineer"
+    assert cards[0]["company"] == "Google"
+    assert cards[0]["location"] == "San Francisco, CA"
+    assert cards[0]["link"] == "https://www.linkedin.com/jobs/view/software-engineer-at-google-3798765401"
+
+
+class SnapshotDriver:
+    """Stand-in driver whose page grows by one snapshot per scroll"""
+
+    def __init__(self, snapshots):
+        self.snapshots = snapshots
+        self.scrolls = 0
+
+    @property
+    def page_source(self):
+        return self.snapshots[min(self.scrolls, len(self.snapshots) - 1)]
+
+    def execute_script(self, script, *args):
+        if "scrollTop" in script:
+            self.scrolls += 1
+
+
+def growing_snapshots(counts):
+    """Copies of the logged-in fixture truncated to the given card counts"""
+    page = load_fixture("search_results_logged_in.html")
+    head, *cards = page.split("\n      <li class=")
+    cards[-1], tail = cards[-1].split("\n      </ul>\n", 1)
+    snapshots = [
+        head + "".join("\n      <li class=" + c for c in cards[:n]) + "\n      </ul>\n" + tail
+        for n in counts
+    ]
+    return snapshots
+
+
+def test_stream_job_cards_yields_only_new_cards():
+    """Each scroll yields just the cards appended since the previous one"""
+    driver = SnapshotDriver(growing_snapshots((2, 4, 5, 5)))
+    streamed = list(stream_job_cards(driver, None, max_scrolls=3, mode="soup"))
+    assert [card["job_id"] for card in streamed] == [3712345601 + i for i in range(5)]
+
+
+def test_incremental_crawl_stops_at_known_jobs():
+    """Scrolling stops once a run of already-stored jobs is reached"""
+    driver = SnapshotDriver(growing_snapshots((2, 4, 5, 5)))
+    cutoff = KnownJobCutoff({3712345603, 3712345604}, stop_after_seen=2)
+    streamed = list(stream_job_cards(driver, None, max_scrolls=3, mode="soup", cutoff=cutoff))
+    assert [card["job_id"] for card in streamed] == [3712345601, 3712345602]
+    assert cutoff.reached
+    assert driver.scrolls == 1
+
+
+if __name__ == "__main__":
+    print("🔍 Testing job card extractor...")
+    test_parse_job_id()
+    test_normalize_card_builds_link_from_job_id()
+    test_logged_in_fixture()
+    test_guest_fixture()
+    test_stream_job_cards_yields_only_new_cards()
+    test_incremental_crawl_stops_at_known_jobs()
+    print("✅ All job card extractor tests passed")
@@ -0,0 +1,61 @@
+"""
+Tests for the streaming, incremental jobs export
+"""
+
+import csv
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from database_storage import connect, export_database_to_csv, save_to_database
+from job_export import export_jobs
+
+
+def job(job_id, title="Data Analyst"):
+    return {'Job ID': job_id, 'Job Title': title, 'Company': 'Acme', 'Location': 'Remote',
+            'Post Date': '2026-10-01', 'Link': f'https://www.linkedin.com/jobs/view/{job_id}'}
+
+
+def test_full_export_is_not_truncated():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "jobs.db")
+        save_to_database([job(3712345000 + i, f"Role {i}") for i in range(250)], db)
+
+        out = export_database_to_csv(db, os.path.join(tmp, "jobs.csv"))
+        with open(out, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 250
+        assert rows[0]["company"] == "Acme"
+
+
+def test_incremental_export_in_chunks():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "jobs.db")
+        save_to_database([job(3712345601), job(3712345602), job(3712345603)], db)
+        conn = connect(db)
+        with conn:
+            conn.execute("UPDATE postings SET scraped_at = '2026-10-01 09:00:00'")
+        conn.close()
+
+        exported, cursor = export_jobs(os.path.join(tmp, "all.jsonl"), db, chunk_size=2)
+        assert (exported, cursor) == (3, "2026-10-01 09:00:00|3712345603")
+
+        # Stored after the export, with a lower job ID: still the only job in the next one
+        save_to_database([job(3712345599, "Designer")], db)
+        second = os.path.join(tmp, "second.jsonl")
+        exported, next_cursor = export_jobs(second, db, since=cursor)
+        with open(second, encoding="utf-8") as f:
+            assert [json.loads(line)["job_title"] for line in f] == ["Designer"]
+        # Jobs from the current second are exported again rather than risk skipping any
+        assert next_cursor == cursor
+        assert export_jobs(os.path.join(tmp, "bare.csv"), db, since="2026-10-01 09:00:00")[0] == 4
+
+
+if __name__ == "__main__":
+    print("🔍 Testing job export...")
+    test_full_export_is_not_truncated()
+    test_incremental_export_in_chunks()
+    print("✅ All job export tests passed")
@@ -0,0 +1,49 @@
+"""
+Tests for the slotted Job record and the columnar JobBatch
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from job_record import LABELS, Job, JobBatch, as_frame
+
+CARD = {"job_id": 3712345601, "title": "Data Analyst", "company": "Acme Corp", "location": "Remote",
+        "post_date": "2026-10-01", "link": "https://www.linkedin.com/jobs/view/3712345601"}
+
+
+def test_job_is_slotted_and_reads_older_record_formats():
+    job = Job.from_card(CARD, "Data Analyst", "Remote")
+    assert not hasattr(job, "__dict__")
+    with pytest.raises(AttributeError):
+        job.salary = 1
+    assert job.to_labeled()["Job Title"] == "Data Analyst" and job.key() == 3712345601
+
+    labeled = Job.from_record(job.to_labeled())
+    lowercase = Job.from_record({"title": "Data Analyst", "company": "Acme Corp", "location": "Remote",
+                                 "link": "https://www.linkedin.com/jobs/view/3712345601/?trk=x"})
+    assert labeled == job
+    assert lowercase.job_id == 3712345601 and lowercase.post_date == "N/A"
+
+
+def test_batch_converts_to_labeled_frame_without_row_dicts():
+    batch = JobBatch(Job.from_card({**CARD, "job_id": CARD["job_id"] + i}) for i in range(3))
+    batch.append({"Job Title": "No ID", "Link": "N/A"})
+    df = batch.to_frame()
+    assert list(df.columns) == list(LABELS.values())
+    assert str(df["Job ID"].dtype) == "Int64" and df["Job ID"].isna().tolist() == [False] * 3 + [True]
+    assert [job.title for job in batch] == ["Data Analyst"] * 3 + ["No ID"]
+
+    round_trip = JobBatch.from_frame(df)
+    assert list(round_trip) == list(batch)
+    assert as_frame(list(batch)).equals(df)
+
+
+if __name__ == "__main__":
+    print("🔍 Testing job records...")
+    test_job_is_slotted_and_reads_older_record_formats()
+    test_batch_converts_to_labeled_frame_without_row_dicts()
+    print("✅ All job record tests passed")
@@ -0,0 +1,75 @@
+"""
+Tests for the lean-load profile (performance-log parsing, no browser needed)
+"""
+
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from driver_setup import build_chrome_options
+from lean_load import LeanLoad, summarize_network_log
+
+
+def log_entry(webview, method, **params):
+    return {"message": json.dumps({"webview": webview, "message": {"method": method, "params": params}})}
+
+
+class LoggingDriver:
+    """Stand-in driver whose performance log is drained on each get_log call"""
+
+    def __init__(self, entries, handle="tab1"):
+        self.entries = list(entries)
+        self.current_window_handle = handle
+
+    def get_log(self, kind):
+        entries, self.entries = self.entries, []
+        return entries
+
+
+PAGE_LOG = [
+    log_entry("tab1", "Network.requestWillBeSent"),
+    log_entry("tab1", "Network.loadingFinished", encodedDataLength=2048),
+    log_entry("tab1", "Network.requestWillBeSent"),
+    log_entry("tab1", "Network.loadingFailed", type="Image", blockedReason="inspector"),
+    log_entry("tab1", "Network.requestWillBeSent"),
+    log_entry("tab1", "Network.loadingFailed", type="Ping", blockedReason="inspector"),
+    log_entry("tab1", "Network.requestWillBeSent"),
+    log_entry("tab1", "Network.loadingFailed", type="XHR", errorText="net::ERR_ABORTED"),
+    log_entry("tab2", "Network.requestWillBeSent"),
+    log_entry("tab2", "Network.loadingFailed", type="Font", blockedReason="inspector"),
+]
+
+
+def test_blocked_requests_counted_per_tab():
+    pages = summarize_network_log(PAGE_LOG)
+    assert pages["tab1"]["requests"] == 4
+    assert pages["tab1"]["bytes"] == 2048
+    # Ordinary failures are not counted as blocked
+    assert dict(pages["tab1"]["blocked"]) == {"images": 1, "trackers": 1}
+    assert dict(pages["tab2"]["blocked"]) == {"fonts": 1}
+
+
+def test_page_report_keeps_other_tabs_pending():
+    lean = LeanLoad()
+    driver = LoggingDriver(PAGE_LOG, handle="tab1")
+    assert sum(lean.page_report(driver, "Page 1")["blocked"].values()) == 2
+    driver.current_window_handle = "tab2"
+    assert lean.page_report(driver, "Page 2")["blocked"]["fonts"] == 1
+    assert lean.summary() == {"pages": 2, "requests": 5, "blocked": 3, "kb_received": 2.0}
+
+
+def test_lean_chrome_options():
+    options = build_chrome_options(headless=True, lean=True)
+    assert options.page_load_strategy == "eager"
+    assert options.to_capabilities()["goog:loggingPrefs"] == {"performance": "ALL"}
+    assert build_chrome_options(headless=True, lean=False).page_load_strategy == "normal"
+
+
+if __name__ == "__main__":
+    print("🔍 Testing lean load...")
+    test_blocked_requests_counted_per_tab()
+    test_page_report_keeps_other_tabs_pending()
+    test_lean_chrome_options()
+    print("✅ All lean load tests passed")
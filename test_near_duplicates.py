@@ -0,0 +1,72 @@
+"""
+Tests for MinHash-LSH repost detection and cluster assignment on save
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from database_storage import connect, save_to_database
+from near_duplicates import NearDuplicateIndex, minhash, normalize_city, normalize_title, shingles, similarity
+
+
+def job(job_id, title, company="Acme Corp", location="San Francisco, CA"):
+    return {'Job ID': job_id, 'Job Title': title, 'Company': company, 'Location': location,
+            'Post Date': '2026-10-01', 'Link': f'https://www.linkedin.com/jobs/view/{job_id}',
+            'Search Keywords': 'Data Engineer', 'Search Location': 'San Francisco'}
+
+
+def test_edited_titles_are_similar_and_other_roles_are_not():
+    base = minhash(shingles("Senior Data Engineer"))
+    assert normalize_title("Sr. Data Engineer (Remote) - Urgent Hiring!") == "senior data engineer"
+    assert similarity(base, minhash(shingles("Sr. Data Engineer (Remote)"))) == 1.0
+    assert similarity(base, minhash(shingles("Senior Data Engineer II"))) >= 0.75
+    assert similarity(base, minhash(shingles("Data Analyst"))) < 0.5
+    assert normalize_city("San Francisco Bay Area") == normalize_city("San Francisco, CA") == "san francisco"
+
+
+def test_reposts_join_the_cluster_of_the_first_posting():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "jobs.db")
+        save_to_database([job(3712345601, "Senior Data Engineer"), job(3712345602, "Data Analyst")], db)
+        save_to_database([job(3712345611, "Sr. Data Engineer - Urgent Hiring"),
+                          job(3712345612, "Senior Data Engineer", company="Globex"),
+                          job(3712345613, "Senior Data Engineer II"),
+                          job(3712345614, "Junior Data Engineer"),
+                          job(3712345615, "Senior Data Engineer", location="New York, NY")], db)
+
+        conn = connect(db)
+        clusters = dict(conn.execute("SELECT job_id, cluster_id FROM jobs"))
+        conn.close()
+        assert clusters == {3712345601: 3712345601, 3712345602: 3712345602, 3712345611: 3712345601,
+                            3712345612: 3712345612, 3712345613: 3712345601, 3712345614: 3712345614,
+                            3712345615: 3712345615}
+
+
+def test_candidates_come_from_lsh_buckets_only():
+    conn = sqlite3.connect(":memory:")
+    index = NearDuplicateIndex(conn)
+    index.create_tables()
+    levels = ["Junior", "Senior", "Staff", "Principal", "Lead"]
+    fields = ["Data", "Backend", "Frontend", "Platform", "Security", "Mobile", "Cloud", "Embedded"]
+    roles = ["Engineer", "Analyst", "Architect", "Consultant", "Scientist"]
+    titles = [f"{level} {field} {role}" for level in levels for field in fields for role in roles]
+    for job_id, title in enumerate(titles, 1):
+        index.add(job_id, title, "Acme Corp", "Austin, TX")
+    assert titles[16] == "Junior Platform Analyst"
+    assert index.add(1000, "Jr. Platform Analyst", "Acme Corp", "Austin, TX") == 17
+    signature = minhash(shingles("Junior Platform Analyst"))
+    candidates = index.candidates(signature, "Acme Corp", "Austin, TX", "Junior Platform Analyst")
+    assert 17 in candidates and len(candidates) < 10
+    assert index.candidates(signature, "Globex", "Austin, TX", "Junior Platform Analyst") == set()
+
+
+if __name__ == "__main__":
+    print("🔍 Testing near-duplicate detection...")
+    test_edited_titles_are_similar_and_other_roles_are_not()
+    test_reposts_join_the_cluster_of_the_first_posting()
+    test_candidates_come_from_lsh_buckets_only()
+    print("✅ All near-duplicate tests passed")
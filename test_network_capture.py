@@ -0,0 +1,108 @@
+"""
+Tests for the API-response capture mode against a recorded Voyager response
+"""
+
+import base64
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from job_card_extractor import KnownJobCutoff
+from network_capture import NetworkCapture, decode_job_cards, is_job_api_url, stream_captured_cards
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+JOB_CARDS_URL = ("https://www.linkedin.com/voyager/api/voyagerJobsDashJobCards"
+                 "?decorationId=com.linkedin.voyager.dash.deco.jobs.search.JobSearchCardsCollection-220&count=25&q=jobSearch")
+
+
+def load_response():
+    with open(os.path.join(FIXTURES_DIR, "voyager_job_cards.json"), encoding="utf-8") as f:
+        return f.read()
+
+
+def network_events(request_id, url):
+    events = [
+        ("Network.responseReceived", {"requestId": request_id, "response": {"url": url, "mimeType": "application/json"}}),
+        ("Network.loadingFinished", {"requestId": request_id, "encodedDataLength": 4096}),
+    ]
+    return [{"message": json.dumps({"webview": "tab1", "message": {"method": m, "params": p}})} for m, p in events]
+
+
+class CaptureDriver:
+    """Stand-in driver: one job API response (plus unrelated traffic) arrives per scroll"""
+
+    def __init__(self, responses):
+        self.responses = responses  # list of (url, body) per scroll, first one on page load
+        self.bodies = {}
+        self.log = []
+        self.scrolls = 0
+        self._deliver()
+
+    def _deliver(self):
+        if self.scrolls < len(self.responses):
+            url, body = self.responses[self.scrolls]
+            request_id = f"req-{self.scrolls}"
+            self.bodies[request_id] = body
+            self.log += network_events(f"other-{self.scrolls}", "https://www.linkedin.com/voyager/api/me")
+            self.log += network_events(request_id, url)
+
+    def get_log(self, kind):
+        log, self.log = self.log, []
+        return log
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == "Network.getResponseBody":
+            body = self.bodies[params["requestId"]]
+            return {"body": base64.b64encode(body.encode()).decode(), "base64Encoded": True}
+        return {}
+
+    def execute_script(self, script, *args):
+        self.scrolls += 1
+        self._deliver()
+
+
+def test_decode_recorded_response():
+    cards = decode_job_cards(load_response())
+    assert [card["job_id"] for card in cards] == [3712345601, 3712345602, 3712345603]
+    assert cards[0] == {
+        "job_id": 3712345601,
+        "title": "Data Analyst",
+        "company": "Tech Solutions Inc",
+        "location": "New York, NY (Hybrid)",
+        "post_date": "2025-10-08",
+        "link": "https://www.linkedin.com/jobs/view/3712345601",
+    }
+    # Title and listing date come from the referenced JobPosting when the card lacks them
+    assert cards[2]["title"] == "Business Intelligence Analyst"
+    assert cards[2]["post_date"] == "2025-10-06"
+
+
+def test_only_job_search_responses_are_captured():
+    assert is_job_api_url(JOB_CARDS_URL)
+    assert is_job_api_url("https://www.linkedin.com/voyager/api/graphql?queryId=voyagerJobsDashJobCards.93590893e4adb90623f00d61719b838c")
+    assert not is_job_api_url("https://www.linkedin.com/voyager/api/me")
+
+
+def test_stream_captured_cards_across_scrolls():
+    second_page = json.loads(load_response())
+    for entity in second_page["included"]:
+        for key in ("entityUrn", "jobPostingUrn", "*jobPosting"):
+            if key in entity:
+                entity[key] = entity[key].replace("37123456", "37123457")
+    driver = CaptureDriver([(JOB_CARDS_URL, load_response()), (JOB_CARDS_URL, json.dumps(second_page))])
+
+    capture = NetworkCapture(driver)
+    cutoff = KnownJobCutoff({3712345702, 3712345703}, stop_after_seen=5)
+    cards = list(stream_captured_cards(driver, None, capture, max_scrolls=2, cutoff=cutoff))
+    assert [card["job_id"] for card in cards] == [3712345601, 3712345602, 3712345603, 3712345701]
+    assert capture.responses == 2
+
+
+if __name__ == "__main__":
+    print("🔍 Testing network capture...")
+    test_decode_recorded_response()
+    test_only_job_search_responses_are_captured()
+    test_stream_captured_cards_across_scrolls()
+    print("✅ All network capture tests passed")
@@ -0,0 +1,54 @@
+"""
+Tests for the lxml / card-subtree parser layer
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from job_card_extractor import CARD_SELECTORS, CARD_STRAINER, extract_cards_from_html
+from page_parser import ParseStats, card_root_rules, parse_results_html
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+FIXTURES = ["search_results_logged_in.html", "search_results_guest.html"]
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_restricted_lxml_parse_matches_full_html_parser():
+    for name in FIXTURES:
+        html = load_fixture(name)
+        assert extract_cards_from_html(html) == extract_cards_from_html(html, restrict=False, parser="html.parser")
+
+
+def test_only_card_subtrees_are_built():
+    stats = ParseStats()
+    html = load_fixture("search_results_logged_in.html")
+    soup = parse_results_html(html, CARD_STRAINER, stats=stats)
+    full = parse_results_html(html, None, "html.parser", stats=stats)
+    assert soup.find("header") is None and full.find("header") is not None
+    assert len(soup.select("li.jobs-search-results__list-item")) == 5
+    restricted, unrestricted = stats.pages
+    assert restricted["restricted"] and restricted["nodes"] < unrestricted["nodes"]
+    assert stats.summary()["pages"] == 2
+
+
+def test_card_selectors_translate_to_rules():
+    assert ("div", None, "data-job-id") in card_root_rules(CARD_SELECTORS)
+    try:
+        card_root_rules(["ul > li.card"])
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    print("🔍 Testing page parser...")
+    test_restricted_lxml_parse_matches_full_html_parser()
+    test_only_card_subtrees_are_built()
+    test_card_selectors_translate_to_rules()
+    print("✅ All page parser tests passed")
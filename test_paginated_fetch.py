@@ -0,0 +1,104 @@
+"""
+Tests for the pagination-by-URL fetch mode
+"""
+
+import json
+import os
+import sys
+from urllib.parse import parse_qs, urlparse
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from job_card_extractor import EXTRACT_CARDS_JS, KnownJobCutoff
+from paginated_fetch import PAGE_READY_JS, PAGE_SIZE, build_search_url, fetch_paginated_jobs
+
+
+class TabbedDriver:
+    """Stand-in driver: each tab 'loads' a results page of PAGE_SIZE cards per &start offset"""
+
+    def __init__(self, total_results, failing_starts=()):
+        self.total_results = total_results
+        self.failing_starts = set(failing_starts)
+        self.tabs = {"origin": None}
+        self.current_window_handle = "origin"
+        self.switch_to = self
+        self.max_open_tabs = 0
+        self.requested_starts = []
+        self.tabs_opened = 0
+
+    # driver.switch_to API
+    def new_window(self, kind):
+        self.tabs_opened += 1
+        handle = f"tab{self.tabs_opened}"
+        self.tabs[handle] = None
+        self.current_window_handle = handle
+        self.max_open_tabs = max(self.max_open_tabs, len(self.tabs) - 1)
+
+    def window(self, handle):
+        self.current_window_handle = handle
+
+    def close(self):
+        del self.tabs[self.current_window_handle]
+
+    def execute_script(self, script, *args):
+        if script.startswith("window.location.href"):
+            start = int(parse_qs(urlparse(args[0]).query).get("start", ["0"])[0])
+            self.tabs[self.current_window_handle] = start
+            self.requested_starts.append(start)
+            return None
+        if script == PAGE_READY_JS and self.tabs[self.current_window_handle] in self.failing_starts:
+            raise RuntimeError("net::ERR_TIMED_OUT")
+        if script == EXTRACT_CARDS_JS:
+            start = self.tabs[self.current_window_handle]
+            ids = range(start, min(start + PAGE_SIZE, self.total_results))
+            return json.dumps([{"job_id": str(1000000 + i), "title": f"Job {i}"} for i in ids])
+        return True
+
+
+def test_build_search_url():
+    url = build_search_url("Data Analyst", "New York City Metro Area", start=50, sort_by_date=True)
+    assert url == ("https://www.linkedin.com/jobs/search/?keywords=Data%20Analyst"
+                   "&location=New%20York%20City%20Metro%20Area&sortBy=DD&start=50")
+    assert "start=" not in build_search_url("Data Analyst", "Remote")
+
+
+def test_pages_fetched_in_order_with_concurrency_limit():
+    driver = TabbedDriver(total_results=60)
+    cards = list(fetch_paginated_jobs(driver, "Data Analyst", "Remote", max_pages=5, concurrency=2, render_pause=0))
+    assert [card["job_id"] for card in cards] == [1000000 + i for i in range(60)]
+    assert driver.max_open_tabs == 2
+    # Page 4 (start=75) comes back empty and ends the crawl; page 5 is never requested
+    assert driver.requested_starts == [0, 25, 50, 75]
+    assert list(driver.tabs) == ["origin"]
+    assert driver.current_window_handle == "origin"
+
+
+def test_pagination_stops_at_known_jobs():
+    driver = TabbedDriver(total_results=500)
+    cutoff = KnownJobCutoff({1000000 + i for i in range(30, 500)}, stop_after_seen=5)
+    pages = []
+    cards = list(fetch_paginated_jobs(driver, "Data Analyst", "Remote", max_pages=10, concurrency=3,
+                                      cutoff=cutoff, render_pause=0, on_page=lambda: pages.append(1)))
+    assert [card["job_id"] for card in cards] == [1000000 + i for i in range(30)]
+    assert driver.requested_starts == [0, 25, 50]
+    # Pages loaded, not jobs saved, count towards the driver's recycle budget
+    assert len(pages) == 3
+    assert list(driver.tabs) == ["origin"]
+
+
+def test_failed_page_is_skipped_not_taken_as_the_end():
+    driver = TabbedDriver(total_results=100, failing_starts={25})
+    cards = list(fetch_paginated_jobs(driver, "Data Analyst", "Remote", max_pages=10, concurrency=2, render_pause=0))
+    # Page 2 timed out; pages 3 and 4 are still crawled, and only the empty page 5 ends it
+    assert [card["job_id"] for card in cards] == [1000000 + i for i in range(100) if not 25 <= i < 50]
+    assert driver.requested_starts == [0, 25, 50, 75, 100, 125]
+    assert list(driver.tabs) == ["origin"]
+
+
+if __name__ == "__main__":
+    print("🔍 Testing paginated fetch...")
+    test_build_search_url()
+    test_pages_fetched_in_order_with_concurrency_limit()
+    test_pagination_stops_at_known_jobs()
+    test_failed_page_is_skipped_not_taken_as_the_end()
+    print("✅ All paginated fetch tests passed")
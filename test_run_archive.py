@@ -0,0 +1,60 @@
+"""
+Tests for the date/search-partitioned Parquet run archive
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import run_archive
+from job_record import Job
+from run_archive import RunArchive, archived_partitions, read_archive, search_slug
+
+
+def test_partitions_are_listed_from_directory_names():
+    assert search_slug("Data Analyst", "New York, NY") == "data_analyst_new_york_ny"
+    assert search_slug(None, None) == "all"
+    with tempfile.TemporaryDirectory() as tmp:
+        for date, search in [("2026-10-17", "data_analyst_remote"), ("2026-10-16", "data_analyst_remote"),
+                             ("2026-10-17", "designer_berlin")]:
+            (Path(tmp) / f"date={date}" / f"search={search}").mkdir(parents=True)
+        assert archived_partitions(tmp) == [("2026-10-16", "data_analyst_remote"),
+                                            ("2026-10-17", "data_analyst_remote"),
+                                            ("2026-10-17", "designer_berlin")]
+
+
+def test_runs_round_trip_with_partition_pruning():
+    pytest.importorskip("pyarrow")
+    with tempfile.TemporaryDirectory() as tmp:
+        with RunArchive("Data Analyst", "Remote", tmp, datetime(2026, 10, 16, 9, 30)) as archive:
+            archive.append([Job(3712345601, "Data Analyst", "Acme", "Remote", "2026-10-15",
+                                "https://www.linkedin.com/jobs/view/data-analyst-at-acme-3712345601")])
+            archive.append([Job(None, "Analyst", "Globex", "Remote", "2026-10-15", "https://example.com/1")])
+        with RunArchive("Designer", "Berlin", tmp, datetime(2026, 10, 17, 9, 30)) as archive:
+            archive.append([Job(3712345700, "Designer", "Initech", "Berlin", "2026-10-17")])
+        assert archived_partitions(tmp) == [("2026-10-16", "data_analyst_remote"), ("2026-10-17", "designer_berlin")]
+
+        df = read_archive(tmp, ["job_id", "company", "link", "search_keywords"], searches=[("Data Analyst", "Remote")])
+        assert list(df.columns) == ["job_id", "company", "link", "search_keywords"]
+        assert sorted(df["company"].astype(str)) == ["Acme", "Globex"]
+        assert set(df["search_keywords"].astype(str)) == {"Data Analyst"}
+        assert sorted(df["link"]) == ["https://example.com/1", "https://www.linkedin.com/jobs/view/3712345601"]
+
+        latest = read_archive(tmp, ["title", "date"], since="2026-10-17", labels=True)
+        assert latest.to_dict("records") == [{"Job Title": "Designer", "date": "2026-10-17"}]
+
+
+if __name__ == "__main__":
+    print("🔍 Testing the run archive...")
+    test_partitions_are_listed_from_directory_names()
+    if run_archive.pa is not None:
+        test_runs_round_trip_with_partition_pruning()
+    else:
+        print("⚠️ pyarrow not installed, skipping the Parquet round trip")
+    print("✅ Run archive tests passed!")
@@ -0,0 +1,95 @@
+"""
+Tests for the adaptive scroll waits (stand-in drivers, no browser needed)
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from job_card_extractor import stream_job_cards
+from scroll_wait import PANE_STATE_JS, SCROLL_PANE_JS, AdaptiveScrollWait
+
+
+class PollingDriver:
+    """No MutationObserver support; cards appear `render_delay` seconds after a scroll"""
+
+    def __init__(self, render_delay, batches=1):
+        self.render_delay = render_delay
+        self.batches = batches
+        self.cards = 5
+        self.scrolled_at = None
+
+    def execute_async_script(self, script, *args):
+        raise RuntimeError("async scripts not supported")
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def execute_script(self, script, *args):
+        if script == SCROLL_PANE_JS:
+            self.scrolled_at = time.perf_counter()
+        elif script == PANE_STATE_JS:
+            scrolled = self.scrolled_at is not None
+            if scrolled and self.batches and time.perf_counter() - self.scrolled_at >= self.render_delay:
+                self.batches -= 1
+                self.cards += 5
+            return [self.cards, self.cards * 100]
+
+
+class ObserverDriver:
+    """Async script resolves like the in-page MutationObserver would"""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.seen = set()
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def execute_async_script(self, script, *args):
+        return self.outcomes.pop(0)
+
+    def execute_script(self, script, *args):
+        if "window.__scraperSeenJobKeys = new Set()" in script:
+            return None
+        return "[]"
+
+
+def test_returns_when_cards_render_not_after_fixed_sleep():
+    waiter = AdaptiveScrollWait(timeout=3, poll_interval=0.02, stealth_floor=None)
+    outcome = waiter.scroll_and_wait(PollingDriver(render_delay=0.1), pane=None)
+    assert outcome["changed"] and outcome["cards"] == 10
+    assert outcome["total_ms"] < 1000
+
+
+def test_timeout_and_stealth_floor_are_separate():
+    waiter = AdaptiveScrollWait(timeout=0.2, poll_interval=0.02, stealth_floor=(0.4, 0.4))
+    driver = PollingDriver(render_delay=0.0)
+    fast = waiter.scroll_and_wait(driver, pane=None)
+    assert fast["waited_ms"] < 200 and fast["total_ms"] >= 400
+    stalled = waiter.scroll_and_wait(driver, pane=None)
+    assert stalled["timed_out"] and stalled["waited_ms"] >= 200
+
+    summary = waiter.summary()
+    assert summary["scrolls"] == 2 and summary["timeouts"] == 1
+
+
+def test_stream_stops_after_two_empty_scrolls():
+    waiter = AdaptiveScrollWait(stealth_floor=None)
+    driver = ObserverDriver([
+        {"changed": True, "cards": 10, "height": 1000, "waited_ms": 120},
+        {"changed": False, "cards": 10, "height": 1000, "waited_ms": 6000},
+        {"changed": False, "cards": 10, "height": 1000, "waited_ms": 6000},
+    ])
+    list(stream_job_cards(driver, None, max_scrolls=10, waiter=waiter))
+    assert waiter.summary()["scrolls"] == 3
+
+
+if __name__ == "__main__":
+    print("🔍 Testing adaptive scroll waits...")
+    test_returns_when_cards_render_not_after_fixed_sleep()
+    test_timeout_and_stealth_floor_are_separate()
+    test_stream_stops_after_two_empty_scrolls()
+    print("✅ All scroll wait tests passed")
@@ -0,0 +1,87 @@
+"""
+Tests for the persistent cross-run seen-set
+"""
+
+import os
+import sys
+import tempfile
+import threading
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pandas as pd
+
+from seen_set import SeenSet, seed_from_csv
+
+
+def test_claim_marks_new_ids_and_survives_reopen():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "seen.npy")
+        seen = SeenSet(path)
+        assert seen.claim([3712345601, 3712345602, 3712345601, None]).tolist() == [True, True, False, True]
+        assert seen.claim([3712345602, 3712345603]).tolist() == [False, True]
+        seen.flush()
+
+        reopened = SeenSet(path)
+        assert len(reopened) == 3
+        assert reopened.contains([3712345600, 3712345601, 3712345603, 9999999999]).tolist() == [False, True, True, False]
+        assert reopened.claim([None, 3712345603]).tolist() == [True, False]
+
+
+def test_delta_file_is_folded_into_sorted_base():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "seen.npy")
+        seen = SeenSet(path, compact_ratio=0.1)
+        rng = np.random.default_rng(7)
+        ids = rng.choice(10**10, size=20_000, replace=False)
+        seen.claim(int(i) for i in ids)
+        seen.flush()
+        assert seen.stats()["base"] == 20_000 and seen.stats()["delta"] == 0
+
+        seen.claim(int(i) for i in ids[:100] + 1)
+        seen.flush()
+        assert seen.stats()["delta"] > 0  # Small runs only rewrite the delta file
+        base = np.load(path, mmap_mode="r")
+        assert np.all(base[1:] > base[:-1])
+        assert seen.contains(ids[:100] + 1).all() and len(seen) == len(set(ids) | set(ids[:100] + 1))
+
+
+def test_seed_from_older_csvs():
+    with tempfile.TemporaryDirectory() as tmp:
+        old_csv = os.path.join(tmp, "linkedin_jobs_old.csv")
+        pd.DataFrame({"Job Title": ["A", "B", "C"],
+                      "Link": ["https://www.linkedin.com/jobs/view/3712345601",
+                               "https://www.linkedin.com/jobs/view/analyst-3712345602/?trk=x", "N/A"]}).to_csv(old_csv, index=False)
+        seen = SeenSet(os.path.join(tmp, "seen.npy"))
+        assert seed_from_csv(seen, [old_csv], chunksize=2) == 2
+        assert seen.contains([3712345601, 3712345602]).all()
+
+
+def test_concurrent_flushes_keep_every_id():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "seen.npy")
+        # Each SeenSet stands in for a separate scraper process with its own stale view of the files
+        writers = [SeenSet(path, compact_ratio=0.5) for _ in range(8)]
+        for i, seen in enumerate(writers):
+            seen.contains([0])  # open the memory maps before anyone flushes
+            seen.claim(range(100 * i + 10, 100 * i + 20))
+        threads = [threading.Thread(target=seen.flush) for seen in writers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        reopened = SeenSet(path)
+        assert reopened.contains([100 * i + j for i in range(8) for j in range(10, 20)]).all()
+        assert len(reopened) == 80
+        assert not [name for name in os.listdir(tmp) if name.endswith(".tmp")]
+
+
+if __name__ == "__main__":
+    print("🔍 Testing cross-run seen-set...")
+    test_claim_marks_new_ids_and_survives_reopen()
+    test_delta_file_is_folded_into_sorted_base()
+    test_seed_from_older_csvs()
+    test_concurrent_flushes_keep_every_id()
+    print("✅ All seen-set tests passed")
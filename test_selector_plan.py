@@ -0,0 +1,99 @@
+"""
+Tests for the declarative single-pass selector plan
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+
+from selector_plan import SELECTORS_FILE, SelectorPlan, compile_selector
+
+CARD_HTML = """
+<li class="card">
+  <span class="subtitle">Acme</span>
+  <a class="fallback-title" href="/jobs/view/123456789/">Fallback title</a>
+  <div><h3 class="title primary">Primary title</h3></div>
+  <ul><li class="loc">Remote</li></ul>
+</li>
+"""
+
+
+def make_card(html=CARD_HTML):
+    return BeautifulSoup(html, "html.parser").li
+
+
+def test_highest_priority_alternative_wins_regardless_of_document_order():
+    plan = SelectorPlan(["li.card"], {
+        "title": ["h3.title", "a.fallback-title"],
+        "company": ["h4.subtitle", "span.subtitle"],
+        "link": ["a[href*='/jobs/view/']"],
+        "location": ["ul > li.loc"],
+        "post_date": ["time"],
+    })
+    fields = plan.resolve(make_card())
+    assert fields["title"].get_text() == "Primary title"
+    assert fields["company"].get_text() == "Acme"
+    assert fields["link"]["href"] == "/jobs/view/123456789/"
+    # Combinator selectors can't be compiled and fall back to a CSS query
+    assert fields["location"].get_text() == "Remote"
+    assert fields["post_date"] is None
+
+    report = plan.match_report()
+    assert report["title"] == {"h3.title": 1, "a.fallback-title": 0, "(none)": 0}
+    assert report["company"]["span.subtitle"] == 1
+    assert report["post_date"]["(none)"] == 1
+
+
+def test_compile_selector():
+    el = make_card().h3
+    assert compile_selector("h3.title.primary")(el)
+    assert not compile_selector("h3.title.secondary")(el)
+    assert compile_selector("*[class]")(el)
+    assert compile_selector("a[data-x='1']") is not None
+    assert compile_selector("ul > li") is None
+
+
+def test_plan_loads_from_data_file():
+    with open(SELECTORS_FILE, encoding="utf-8") as f:
+        spec = json.load(f)
+    spec["fields"]["title"].insert(0, "h3.title")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "selectors.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(spec, f)
+        plan = SelectorPlan.load(path)
+    assert plan.fields["title"][0] == "h3.title"
+    assert plan.cards == spec["cards"]
+    assert plan.resolve(make_card())["title"].get_text() == "Primary title"
+
+
+def test_match_counts_from_concurrent_extraction():
+    plan = SelectorPlan(["li.card"], {"title": ["h3.title", "a.title"], "company": ["h4.subtitle"]})
+
+    def extract():
+        for _ in range(2000):
+            plan.record_ranks({"title": 1, "company": -1})
+
+    threads = [threading.Thread(target=extract) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    report = plan.match_report()
+    assert report["title"] == {"h3.title": 0, "a.title": 8000, "(none)": 0}
+    assert report["company"]["(none)"] == 8000
+
+
+if __name__ == "__main__":
+    print("🔍 Testing selector plan...")
+    test_highest_priority_alternative_wins_regardless_of_document_order()
+    test_compile_selector()
+    test_plan_loads_from_data_file()
+    test_match_counts_from_concurrent_extraction()
+    print("✅ All selector plan tests passed")
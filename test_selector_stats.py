@@ -0,0 +1,111 @@
+"""
+Tests for hit-rate driven selector ordering
+"""
+
+import os
+import sys
+import tempfile
+import threading
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from selector_stats import SelectorStats, layout_fingerprint, probe_cascade
+
+SELECTORS = ["li.old-card", "div.mid-card", "li.new-card"]
+PAGE = {"li.new-card": ["card1", "card2"]}
+
+
+def run_page(stats, layout="two-pane"):
+    order, skipped = stats.plan(layout, "cards", SELECTORS)
+    cards, probes = probe_cascade(order, skipped, lambda selector: PAGE.get(selector, []))
+    stats.record(layout, "cards", probes)
+    return cards, [selector for selector, _, _ in probes]
+
+
+def test_matching_selector_moves_first_and_dead_ones_are_skipped():
+    stats = SelectorStats(path=None, dead_after=1, reprobe_every=10)
+    cards, tried = run_page(stats)
+    assert cards == ["card1", "card2"] and tried == SELECTORS
+
+    order, skipped = stats.plan("two-pane", "cards", SELECTORS)
+    assert order == ["li.new-card"] and sorted(skipped) == ["div.mid-card", "li.old-card"]
+    assert run_page(stats)[1] == ["li.new-card"]
+
+    # Other layouts keep their own stats
+    assert stats.plan("guest", "cards", SELECTORS) == (SELECTORS, [])
+    assert stats.report("two-pane", "cards")["li.old-card"]["dead"]
+
+
+def test_skipped_selectors_are_still_tried_and_reprobed():
+    stats = SelectorStats(path=None, dead_after=1, reprobe_every=4)
+    for _ in range(3):
+        run_page(stats)
+    # Layout rolled back: the skipped selector is probed after the live one misses
+    PAGE["li.old-card"] = ["old"]
+    try:
+        cards, tried = run_page(stats)
+    finally:
+        del PAGE["li.old-card"]
+    assert cards == ["card1", "card2"] and tried == ["li.new-card"]
+    # Page 5 is a re-probe page: nothing is skipped
+    assert stats.plan("two-pane", "cards", SELECTORS)[1] == []
+
+
+def test_stats_persist_and_fingerprint_layouts():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "selector_stats.json")
+        stats = SelectorStats(path=path, autosave_every=0)
+        run_page(stats)
+        stats.save()
+        reloaded = SelectorStats(path=path)
+        assert reloaded.plan("two-pane", "cards", SELECTORS)[0][0] == "li.new-card"
+        assert reloaded.known_layouts("cards") == ["two-pane"]
+
+    assert layout_fingerprint('<ul class="jobs-search__results-list"><li><div class="base-card x">') == (
+        "jobs-search__results-list|base-card")
+    assert layout_fingerprint("<div class='scaffold-layout__list'></div>") == "unknown"
+
+
+def test_concurrent_saves_do_not_collide():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "selector_stats.json")
+        # Threads of one process, and two stores standing in for two processes, all saving at once
+        stores = [SelectorStats(path=path, autosave_every=1), SelectorStats(path=path, autosave_every=1)]
+        errors = []
+
+        def work(stats):
+            try:
+                for _ in range(50):
+                    run_page(stats)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work, args=(stores[i % 2],)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert SelectorStats(path=path).known_layouts("cards") == ["two-pane"]
+        assert os.listdir(tmp) == ["selector_stats.json"]
+
+
+def test_worker_probes_are_merged_by_the_parent():
+    worker = SelectorStats(path=None)
+    worker.start_journal()
+    run_page(worker)
+    parent = SelectorStats(path=None)
+    for entry in worker.drain_journal():
+        parent.record(*entry)
+    assert parent.report("two-pane", "cards") == worker.report("two-pane", "cards")
+    assert worker.drain_journal() == []
+
+
+if __name__ == "__main__":
+    print("🔍 Testing selector statistics...")
+    test_matching_selector_moves_first_and_dead_ones_are_skipped()
+    test_skipped_selectors_are_still_tried_and_reprobed()
+    test_stats_persist_and_fingerprint_layouts()
+    test_concurrent_saves_do_not_collide()
+    test_worker_probes_are_merged_by_the_parent()
+    print("✅ All selector statistics tests passed")
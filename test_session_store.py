@@ -0,0 +1,129 @@
+"""
+Tests for the persisted LinkedIn session (stand-in driver, no browser needed)
+"""
+
+import os
+import sys
+import tempfile
+import time
+from fnmatch import fnmatch
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from cryptography.fernet import Fernet
+
+import session_store
+from lean_load import enable_request_blocking
+from session_store import ensure_logged_in, has_live_auth_cookie, load_session, save_session
+
+
+class SessionDriver:
+    """Stand-in driver: /feed/ stays on the feed only when the li_at cookie is set"""
+
+    def __init__(self, cookies=None):
+        self.cookies = list(cookies or [])
+        self.current_url = "about:blank"
+        self.visits = []
+
+    def get(self, url):
+        self.visits.append(url)
+        logged_in = any(c["name"] == "li_at" for c in self.cookies)
+        if "/feed" in url and not logged_in:
+            url = "https://www.linkedin.com/authwall?trk=feed"
+        self.current_url = url
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def execute_script(self, script, *args):
+        return "{}"
+
+
+class BlockingSessionDriver(SessionDriver):
+    """SessionDriver honouring Network.setBlockedURLs: blocked pages fail to load and cookies
+    can then only be set for the error page's origin, which Chrome rejects"""
+
+    def __init__(self, cookies=None):
+        super().__init__(cookies)
+        self.blocked = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == "Network.setBlockedURLs":
+            self.blocked = params["urls"]
+        return {}
+
+    def get(self, url):
+        if any(fnmatch(url, pattern) for pattern in self.blocked):
+            self.visits.append(url)
+            self.current_url = "chrome-error://chromewebdata/"
+            return
+        super().get(url)
+
+    def add_cookie(self, cookie):
+        if not self.current_url.startswith("https://www.linkedin.com"):
+            raise Exception("invalid cookie domain")
+        super().add_cookie(cookie)
+
+
+def setup_module(module=None):
+    os.environ["LINKEDIN_SESSION_KEY"] = Fernet.generate_key().decode()
+
+
+def test_auth_cookie_expiry():
+    now = time.time()
+    assert has_live_auth_cookie([{"name": "li_at", "value": "x", "expiry": now + 60}], now)
+    assert not has_live_auth_cookie([{"name": "li_at", "value": "x", "expiry": now - 60}], now)
+    assert not has_live_auth_cookie([{"name": "JSESSIONID", "value": "x"}], now)
+
+
+def test_session_is_encrypted_and_round_trips():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "session")
+        save_session(SessionDriver([{"name": "li_at", "value": "secret-token"}]), path)
+        with open(path, "rb") as f:
+            assert b"secret-token" not in f.read()
+        assert load_session(path)["cookies"][0]["value"] == "secret-token"
+
+
+def test_saved_session_skips_form_login():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "session")
+        logins = []
+
+        def login():
+            logins.append(1)
+            first.add_cookie({"name": "li_at", "value": "token"})
+            return True
+
+        first = SessionDriver()
+        assert ensure_logged_in(first, login, session_file=path)
+        assert len(logins) == 1
+
+        second = SessionDriver()
+        assert ensure_logged_in(second, lambda: False, session_file=path)
+        assert second.visits == [session_store.COOKIE_ORIGIN_URL, session_store.SESSION_CHECK_URL]
+
+
+def test_saved_session_restores_with_lean_load_blocking():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "session")
+        save_session(SessionDriver([{"name": "li_at", "value": "token"}]), path)
+
+        # create_driver turns request blocking on before the session is restored
+        driver = BlockingSessionDriver()
+        assert enable_request_blocking(driver)
+        assert ensure_logged_in(driver, lambda: False, session_file=path)
+        assert driver.current_url == session_store.SESSION_CHECK_URL
+
+
+if __name__ == "__main__":
+    print("🔍 Testing session store...")
+    setup_module()
+    test_auth_cookie_expiry()
+    test_session_is_encrypted_and_round_trips()
+    test_saved_session_skips_form_login()
+    test_saved_session_restores_with_lean_load_blocking()
+    print("✅ All session store tests passed")
@@ -0,0 +1,57 @@
+"""
+Tests for the offline snapshot store and process-pool replay
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from snapshot_store import SnapshotStore, replay
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_pages_are_stored_once_per_content_hash():
+    html = load_fixture("search_results_guest.html")
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SnapshotStore(tmp, codec="gz")
+        first = store.put(html, query="Software Engineer", scroll_index=0)
+        second = store.put(html, query="Software Engineer", scroll_index=1)
+        assert first == second
+        assert store.get(first) == html
+        assert len(list(store.root.glob("objects/*/*.html.gz"))) == 1
+
+        stats = store.stats()
+        assert stats["captures"] == 2 and stats["pages"] == 1
+        assert stats["stored_mb"] < stats["html_mb"]
+        assert [entry["scroll_index"] for entry in store.latest_entries()] == [1]
+
+
+def test_replay_extracts_cards_in_worker_processes():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SnapshotStore(tmp, codec="gz")
+        store.put(load_fixture("search_results_guest.html"), query="guest")
+        store.put(load_fixture("search_results_logged_in.html"), query="logged in")
+        store.put("<html><body>Checkpoint</body></html>", query="blocked")
+
+        results = {entry["query"]: cards for entry, cards in replay(store, workers=2)}
+        assert set(results) == {"guest", "logged in", "blocked"}
+        assert len(results["guest"]) == 5 and results["guest"][0]["title"] == "Software Engineer"
+        assert results["logged in"] and results["blocked"] == []
+
+        only_guest = list(replay(store, workers=1, query="guest"))
+        assert len(only_guest) == 1
+
+
+if __name__ == "__main__":
+    print("🔍 Testing snapshot store...")
+    test_pages_are_stored_once_per_content_hash()
+    test_replay_extracts_cards_in_worker_processes()
+    print("✅ All snapshot store tests passed")